@@ -0,0 +1,45 @@
+"""
+Shared helpers for the benchmark scripts.
+
+Benchmarks are plain scripts, run from the repository root:
+
+    python benchmarks/bench_dbc_loader.py
+"""
+
+from typing import Any, Callable, List, Tuple
+from pathlib import Path
+import sys
+import time
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+EXAMPLES_DIR = REPO_ROOT / 'examples' / 'data'
+
+# Make the package importable without installation
+sys.path.insert(0, str(REPO_ROOT / 'src'))
+
+
+def best_of(func: Callable[[], Any], repeat: int = 5) -> Tuple[float, Any]:
+    """
+    Run ``func`` several times and return (best wall time in seconds, result).
+    """
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def print_table(headers: List[str], rows: List[List[Any]]) -> None:
+    """Print a plain-text table with left-aligned first column."""
+    cells = [[str(c) for c in headers]] + [[str(c) for c in row] for row in rows]
+    widths = [max(len(row[i]) for row in cells) for i in range(len(headers))]
+    for idx, row in enumerate(cells):
+        line = '  '.join(
+            cell.ljust(widths[i]) if i == 0 else cell.rjust(widths[i])
+            for i, cell in enumerate(row)
+        )
+        print(line)
+        if idx == 0:
+            print('  '.join('-' * w for w in widths))
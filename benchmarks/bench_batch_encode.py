@@ -0,0 +1,83 @@
+"""
+Benchmark: per-frame vs vectorized encoding of CAN payloads.
+
+Decodes random payloads of the messages of the FD3 database (the ones
+with the most signals) into raw signal columns, then packs them back per
+frame with cantools (Message.encode, raw) and in one call with
+CANMessage.encode_batch(). The cantools baseline runs on a slice of the
+frames and is extrapolated; the payloads are checked against each other.
+
+Usage:
+    python benchmarks/bench_batch_encode.py [--repeat N] [--frames N] [--messages K]
+"""
+
+import argparse
+
+from _bench import EXAMPLES_DIR, best_of, print_table
+
+import cantools
+import numpy as np
+
+from autosar.loader import DBCLoader
+
+DEFAULT_DBC = EXAMPLES_DIR / 'dbc' / 'ECM_PMBD_FD3_2025-34_LB-WL_PRS_Release_v2.dbc'
+BASELINE_FRAMES = 2000
+
+
+def cantools_pass(message, frames):
+    for values in frames:
+        message.encode(values, scaling=False, strict=False)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--frames', type=int, default=1_000_000)
+    parser.add_argument('--messages', type=int, default=5)
+    parser.add_argument('--dbc', default=str(DEFAULT_DBC))
+    args = parser.parse_args()
+
+    db = DBCLoader().load_and_convert(args.dbc, use_cache=False)
+    reference = cantools.database.load_file(args.dbc, strict=False)
+    messages = sorted(db.messages, key=lambda m: len(m.signals), reverse=True)[:args.messages]
+    rng = np.random.default_rng(0)
+
+    rows = []
+    for message in messages:
+        payloads = rng.integers(0, 256, (args.frames, message.dlc), dtype=np.uint8)
+        raw = message.decode_batch(payloads).raw
+        baseline = [
+            {name: column[i].item() for name, column in raw.items()}
+            for i in range(BASELINE_FRAMES)
+        ]
+        ref_message = reference.get_message_by_name(message.name)
+
+        t_frame, _ = best_of(lambda: cantools_pass(ref_message, baseline), args.repeat)
+        t_frame *= args.frames / len(baseline)
+        t_batch, encoded = best_of(
+            lambda: message.encode_batch(raw, scaled=False), args.repeat
+        )
+
+        expected = ref_message.encode(baseline[0], scaling=False, strict=False)
+        assert bytes(encoded[0][:len(expected)]) == expected, message.name
+
+        rows.append([
+            message.name[:32],
+            len(message.signals),
+            message.dlc,
+            f"{t_frame:.2f}",
+            f"{t_batch:.3f}",
+            f"{args.frames / t_batch / 1e6:.1f}",
+            f"{t_frame / t_batch:.0f}x",
+        ])
+
+    print(f"{args.dbc}: {args.frames} frames per message "
+          f"(cantools extrapolated from {BASELINE_FRAMES})\n")
+    print_table(
+        ['message', 'signals', 'dlc', 'cantools s', 'batch s', 'Mframes/s', 'speedup'],
+        rows,
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,142 @@
+"""
+Benchmark: linear scans vs indexed lookups on CANDatabase/CANMessage.
+
+Loads the FD3 database (examples/data/dbc, ~1.3 MB) and runs a
+gateway-style pass that, for every message, looks the message up by ID,
+by (ID, extended flag) and by name, every signal of it by name, and its
+sender node. The same pass is timed with the pre-index linear scans and
+with the indexed model methods (indexes warm), plus the cost of the
+first pass after a mutation, which rebuilds the indexes.
+
+``--scale K`` replicates the messages K times under new extended IDs to
+show how both variants grow with database size.
+
+Usage:
+    python benchmarks/bench_can_lookup.py [--repeat N] [--dbc PATH] [--scale K]
+"""
+
+import argparse
+
+from _bench import EXAMPLES_DIR, best_of, print_table
+
+from autosar.loader import DBCLoader
+
+DEFAULT_DBC = EXAMPLES_DIR / 'dbc' / 'ECM_PMBD_FD3_2025-34_LB-WL_PRS_Release_v2.dbc'
+
+
+# Lookups as implemented before the indexes
+
+def linear_message_by_id(db, message_id, is_extended=None):
+    for message in db.messages:
+        if message.message_id == message_id and is_extended in (None, message.is_extended):
+            return message
+    return None
+
+
+def linear_message_by_name(db, name):
+    for message in db.messages:
+        if message.name == name:
+            return message
+    return None
+
+
+def linear_signal(message, name):
+    for signal in message.signals:
+        if signal.name == name or signal.short_name == name:
+            return signal
+    return None
+
+
+def linear_node(db, name):
+    for node in db.nodes:
+        if node.name == name:
+            return node
+    return None
+
+
+def linear_pass(db, keys):
+    found = 0
+    for message_id, is_extended, name, signal_names, sender in keys:
+        found += linear_message_by_id(db, message_id) is not None
+        found += linear_message_by_id(db, message_id, is_extended) is not None
+        message = linear_message_by_name(db, name)
+        for signal_name in signal_names:
+            found += linear_signal(message, signal_name) is not None
+        found += linear_node(db, sender) is not None
+    return found
+
+
+def indexed_pass(db, keys):
+    found = 0
+    for message_id, is_extended, name, signal_names, sender in keys:
+        found += db.get_message_by_id(message_id) is not None
+        found += db.get_message_by_id(message_id, is_extended) is not None
+        message = db.get_message_by_name(name)
+        for signal_name in signal_names:
+            found += message.get_signal(signal_name) is not None
+        found += db.get_node(sender) is not None
+    return found
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--dbc', default=str(DEFAULT_DBC))
+    parser.add_argument('--scale', type=int, default=1)
+    args = parser.parse_args()
+
+    db = DBCLoader().load_and_convert(args.dbc, use_cache=False)
+    originals = list(db.messages)
+    for k in range(1, args.scale):
+        db.messages.extend(
+            m.model_copy(deep=True, update={
+                'name': f"{m.name}_{k}",
+                'short_name': f"{m.short_name}_{k}",
+                'message_id': (m.message_id + k * 0x800) & 0x1FFFFFFF,
+                'is_extended': True,
+            })
+            for m in originals
+        )
+    keys = [
+        (
+            m.message_id,
+            m.is_extended,
+            m.name,
+            [s.name for s in m.signals],
+            m.sender or '',
+        )
+        for m in db.messages
+    ]
+    lookups = sum(4 + len(signal_names) for _, _, _, signal_names, _ in keys)
+
+    t_linear, found_linear = best_of(lambda: linear_pass(db, keys), args.repeat)
+    indexed_pass(db, keys)  # build indexes
+    t_indexed, found_indexed = best_of(lambda: indexed_pass(db, keys), args.repeat)
+    assert found_linear == found_indexed, (found_linear, found_indexed)
+
+    def rebuild_pass():
+        db.messages.append(db.messages.pop())  # invalidates message indexes
+        for message in db.messages:
+            if message.signals:
+                message.signals.append(message.signals.pop())
+        return indexed_pass(db, keys)
+
+    t_rebuild, _ = best_of(rebuild_pass, args.repeat)
+
+    n_signals = sum(len(m.signals) for m in db.messages)
+    print(f"{args.dbc}: {len(db.messages)} messages, {n_signals} signals, "
+          f"{len(db.nodes)} nodes, {lookups} lookups per pass\n")
+    print_table(
+        ['pass', 'ms', 'us/lookup', 'speedup'],
+        [
+            ['linear scans', f"{t_linear * 1000:.2f}", f"{t_linear * 1e6 / lookups:.2f}", '1.0x'],
+            ['indexed (warm)', f"{t_indexed * 1000:.2f}", f"{t_indexed * 1e6 / lookups:.2f}",
+             f"{t_linear / t_indexed:.1f}x"],
+            ['indexed (rebuild)', f"{t_rebuild * 1000:.2f}", f"{t_rebuild * 1e6 / lookups:.2f}",
+             f"{t_linear / t_rebuild:.1f}x"],
+        ],
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+"""
+Benchmark: staged vs direct DBC conversion.
+
+Compares, for every DBC in ``examples/data/dbc``:
+- parse:  cantools.database.load_file() alone
+- staged: dict extraction (load) + to_model() with full validation
+- direct: DBCLoader.from_cantools() via the trusted construction path
+
+Usage:
+    python benchmarks/bench_dbc_loader.py [--repeat N]
+"""
+
+import argparse
+
+from _bench import EXAMPLES_DIR, best_of, print_table
+
+import cantools
+
+from autosar.loader import DBCLoader
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    rows = []
+    for path in sorted((EXAMPLES_DIR / 'dbc').glob('*.dbc')):
+        loader = DBCLoader()
+
+        t_parse, db = best_of(lambda: cantools.database.load_file(str(path)), args.repeat)
+
+        def staged():
+            loader._db = db
+            data = {
+                'version': getattr(db, 'version', '1.0'),
+                'messages': [loader._extract_message(msg) for msg in db.messages],
+                'nodes': [loader._extract_node(node) for node in db.nodes],
+                'file_path': str(path),
+            }
+            loader.validate(data)
+            return loader.to_model(data)
+
+        t_staged, model = best_of(staged, args.repeat)
+        t_direct, _ = best_of(lambda: loader.from_cantools(db, name=path.stem), args.repeat)
+
+        n_signals = sum(len(m.signals) for m in model.messages)
+        rows.append([
+            path.name[:40],
+            f"{path.stat().st_size / 1024:.0f}",
+            len(model.messages),
+            n_signals,
+            f"{t_parse * 1000:.1f}",
+            f"{t_staged * 1000:.1f}",
+            f"{t_direct * 1000:.1f}",
+            f"{t_staged / t_direct:.1f}x",
+            f"{(t_parse + t_staged) / (t_parse + t_direct):.2f}x",
+        ])
+
+    print_table(
+        ['file', 'KB', 'msgs', 'sigs', 'parse ms', 'staged ms', 'direct ms',
+         'convert speedup', 'end-to-end speedup'],
+        rows,
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+"""
+Benchmark: package import time, checked against a budget.
+
+Imports each entry point in a fresh interpreter with ``python -X importtime``
+and reports the cumulative import time (best of N runs). The run fails
+(exit status 1) if an entry point exceeds its budget or pulls in one of the
+heavy third-party modules that must only be imported when they are
+actually used (cantools, openpyxl, numpy).
+
+Usage:
+    python benchmarks/bench_import_time.py [--repeat N] [--budget-scale X]
+"""
+
+from typing import List, Set, Tuple
+import argparse
+import os
+import subprocess
+import sys
+
+from _bench import REPO_ROOT, print_table
+
+# Entry point -> import time budget in ms (cumulative, from -X importtime)
+BUDGETS_MS = {
+    'autosar': 50,
+    'autosar.model': 50,
+    'autosar.loader': 100,
+    'autosar.generator': 300,
+    'autosar.service': 400,
+}
+
+# Modules that no entry point may import eagerly
+DEFERRED_MODULES = ('cantools', 'openpyxl', 'numpy')
+
+
+def measure(module: str) -> Tuple[float, Set[str]]:
+    """
+    Import ``module`` in a fresh interpreter.
+
+    Returns:
+        Tuple of (cumulative import time in ms, deferred modules imported)
+    """
+    code = (
+        f"import sys, {module}; "
+        f"print(' '.join(m for m in {DEFERRED_MODULES!r} if m in sys.modules))"
+    )
+    env = dict(os.environ, PYTHONPATH=str(REPO_ROOT / 'src'))
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        capture_output=True, text=True, env=env, check=True,
+    )
+
+    # Lines look like "import time:  self [us] | cumulative | name"; the
+    # requested module is the last top-level entry
+    cumulative_us = 0
+    for line in proc.stderr.splitlines():
+        parts = line.split('|')
+        if len(parts) == 3 and parts[2].strip() == module and not parts[2][1:].startswith(' '):
+            cumulative_us = int(parts[1])
+    return cumulative_us / 1000, set(proc.stdout.split())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--budget-scale', type=float, default=1.0,
+                        help='multiply all budgets (for slow machines)')
+    args = parser.parse_args()
+
+    rows: List[List[str]] = []
+    failures: List[str] = []
+    for module, budget in BUDGETS_MS.items():
+        budget *= args.budget_scale
+        runs = [measure(module) for _ in range(args.repeat)]
+        best = min(ms for ms, _ in runs)
+        deferred = set().union(*(mods for _, mods in runs))
+
+        status = 'ok'
+        if best > budget:
+            status = 'OVER'
+            failures.append(f"{module}: {best:.1f} ms > {budget:.0f} ms budget")
+        if deferred:
+            status = 'EAGER'
+            failures.append(f"{module}: imports {', '.join(sorted(deferred))}")
+        rows.append([
+            module,
+            f"{best:.1f}",
+            f"{budget:.0f}",
+            ', '.join(sorted(deferred)) or '-',
+            status,
+        ])
+
+    print_table(['module', 'import ms', 'budget ms', 'deferred imported', 'status'], rows)
+
+    if failures:
+        print()
+        for failure in failures:
+            print(f"FAIL {failure}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
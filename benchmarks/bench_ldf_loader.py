@@ -0,0 +1,113 @@
+"""
+Benchmark: LDF parse time scaling on large synthetic files.
+
+Generates LDF text of growing size and reports LDFLoader.parse() time per
+KB. Parse time should grow linearly with input size for both regular and
+pathological inputs:
+- regular:      N signals / frames / schedule entries
+- comments:     every line followed by block and line comments
+- unterminated: a regular file followed by a never-closed block comment
+- nesting:      deeply nested braces inside a schedule table
+- unbalanced:   many opening braces that are never closed
+
+Usage:
+    python benchmarks/bench_ldf_loader.py [--repeat N] [--sizes 1000,2000,...]
+"""
+
+import argparse
+
+from _bench import best_of, print_table
+
+from autosar.loader import LDFLoader
+
+
+def regular(n: int) -> str:
+    """LDF with n signals, n frames and one schedule table of n entries."""
+    lines = [
+        'LIN_description_file;',
+        'LIN_protocol_version = "2.1";',
+        'LIN_language_version = "2.1";',
+        'LIN_speed = 19.2 kbps;',
+        'Nodes {',
+        '  Master: ECU, 5 ms, 0.1 ms ;',
+        '  Slaves: ' + ', '.join(f'S{i}' for i in range(min(n, 16))) + ' ;',
+        '}',
+        'Signals {',
+    ]
+    lines += [f'  Sig{i}: 8, 0, ECU, S{i % 16} ;' for i in range(n)]
+    lines += ['}', 'Frames {']
+    for i in range(n):
+        lines += [f'  Frm{i}: {i % 60}, ECU, 1 {{', f'    Sig{i}, 0 ;', '  }']
+    lines += ['}', 'Schedule_tables {', '  Main {']
+    lines += [f'    Frm{i} delay 10 ms ;' for i in range(n)]
+    lines += ['  }', '}']
+    return '\n'.join(lines) + '\n'
+
+
+def commented(n: int) -> str:
+    return '\n'.join(
+        f'{line} /* block {{ ; */ // line }} comment'
+        for line in regular(n).splitlines()
+    )
+
+
+def unterminated(n: int) -> str:
+    return regular(n) + '/* ' + '/* x } { ;' * (n * 4)
+
+
+def nesting(n: int) -> str:
+    depth = n * 4
+    return regular(n).replace(
+        '  Main {',
+        '  Deep { ' + 'AssignNAD { ' * depth + '} ' * depth + 'delay 1 ms ; }\n  Main {',
+    )
+
+
+def unbalanced(n: int) -> str:
+    return regular(n) + 'Schedule_tables {' + ' T {' * (n * 4)
+
+
+GENERATORS = {
+    'regular': regular,
+    'comments': commented,
+    'unterminated': unterminated,
+    'nesting': nesting,
+    'unbalanced': unbalanced,
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--sizes', default='1000,4000,16000')
+    args = parser.parse_args()
+    sizes = [int(size) for size in args.sizes.split(',')]
+
+    loader = LDFLoader()
+    rows = []
+    for kind, generate in GENERATORS.items():
+        base_rate = None
+        for n in sizes:
+            content = generate(n)
+            kb = len(content) / 1024
+            t_parse, data = best_of(lambda: loader.parse(content), args.repeat)
+            rate = t_parse * 1e6 / kb
+            base_rate = base_rate or rate
+            rows.append([
+                kind,
+                n,
+                f"{kb:.0f}",
+                len(data['frames']),
+                f"{t_parse * 1000:.1f}",
+                f"{rate:.1f}",
+                f"{rate / base_rate:.2f}",
+            ])
+
+    print_table(
+        ['input', 'n', 'KB', 'frames', 'parse ms', 'us/KB', 'us/KB vs smallest'],
+        rows,
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+"""
+Benchmark: per-bit sets vs integer bitmasks for signal layout validation.
+
+Loads the largest example DBC (FD3, examples/data/dbc) and checks every
+message for overlapping signals and signals beyond the message length:
+
+- bit sets: each signal's bits collected one by one into a set (walking
+  the Motorola sawtooth), then compared pairwise
+- bitmask:  check_layout(), one integer mask per signal and a single
+  AND pass per message
+
+Both run on the database as loaded (no conflicts) and on a perturbed copy
+where every fifth signal is moved by three bits, and must report the same
+conflicts. ``--scale K`` replicates the messages K times.
+
+Usage:
+    python benchmarks/bench_signal_layout.py [--repeat N] [--dbc PATH] [--scale K]
+"""
+
+import argparse
+
+from _bench import EXAMPLES_DIR, best_of, print_table
+
+from autosar.loader import DBCLoader
+from autosar.model import check_layout
+from autosar.model.base import trusted_assignment
+
+DEFAULT_DBC = EXAMPLES_DIR / 'dbc' / 'ECM_PMBD_FD3_2025-34_LB-WL_PRS_Release_v2.dbc'
+
+
+def mux_value(indicator):
+    if indicator and indicator[0] == 'm' and indicator[1:].rstrip('M').isdigit():
+        return int(indicator[1:].rstrip('M'))
+    return None
+
+
+def signal_bits(signal):
+    """Bits of a signal, walked one at a time."""
+    bits = set()
+    bit = signal.start_bit
+    big_endian = signal.byte_order.value == 'big_endian'
+    for _ in range(signal.length):
+        bits.add(bit)
+        if not big_endian:
+            bit += 1
+        elif bit % 8 == 0:
+            bit += 15
+        else:
+            bit -= 1
+    return bits
+
+
+def bit_set_pass(messages):
+    conflicts = []
+    for message in messages:
+        placed = []
+        for signal in message.signals:
+            bits = signal_bits(signal)
+            mux = mux_value(signal.multiplex_indicator)
+            if max(bits, default=-1) >= message.length * 8:
+                conflicts.append((message.name, 'boundary', (signal.name,)))
+            for other, other_bits, other_mux in placed:
+                if bits & other_bits and (mux is None or other_mux is None or mux == other_mux):
+                    conflicts.append((message.name, 'overlap', (other, signal.name)))
+            placed.append((signal.name, bits, mux))
+    return conflicts
+
+
+def bitmask_pass(messages):
+    return [(i.message, i.kind.value, i.signals) for i in check_layout(messages)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--dbc', default=str(DEFAULT_DBC))
+    parser.add_argument('--scale', type=int, default=1)
+    args = parser.parse_args()
+
+    db = DBCLoader().load_and_convert(args.dbc, use_cache=False)
+    messages = list(db.messages) * args.scale
+    perturbed = [m.model_copy(deep=True) for m in db.messages] * args.scale
+    with trusted_assignment():
+        for message in perturbed[:len(db.messages)]:
+            for signal in message.signals[::5]:
+                signal.start_bit += 3
+    n_signals = sum(len(m.signals) for m in messages)
+
+    rows = []
+    for label, frames in [('as loaded', messages), ('perturbed', perturbed)]:
+        t_sets, expected = best_of(lambda: bit_set_pass(frames), args.repeat)
+        t_masks, found = best_of(lambda: bitmask_pass(frames), args.repeat)
+        assert found == expected, (label, len(found), len(expected))
+        rows.append([label, len(found), f"{t_sets * 1000:.2f}", f"{t_masks * 1000:.2f}",
+                     f"{t_masks * 1e6 / n_signals:.2f}", f"{t_sets / t_masks:.1f}x"])
+
+    print(f"{args.dbc}: {len(messages)} messages, {n_signals} signals\n")
+    print_table(['database', 'conflicts', 'bit sets ms', 'bitmask ms', 'us/signal', 'speedup'], rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,191 @@
+"""
+Benchmark: streaming decoding of candump and Vector ASC trace logs.
+
+Generates a synthetic log (default 2 GB per format) of random payloads for
+the messages of a DBC from examples/data/dbc, with one extended-ID frame
+in 50 unknown to the database, then times TraceDecoder over it:
+
+- frames:  chunked reading and line parsing only (iter_frames)
+- blocks:  parsing + per-message batched decoding (iter_blocks)
+- records: blocks + per-frame records in log order (iter_records)
+
+and a per-frame baseline (regex parsing + cantools Message.decode) on the
+first lines, extrapolated to the whole log. Throughput is in frames per
+second. The log is written to a temporary directory and deleted afterwards
+unless ``--keep`` is given.
+
+Usage:
+    python benchmarks/bench_trace_decode.py [--repeat N] [--size-mb MB]
+        [--format candump|asc|all] [--dbc PATH] [--keep DIR]
+"""
+
+import argparse
+import re
+import shutil
+import tempfile
+from pathlib import Path
+
+from _bench import EXAMPLES_DIR, best_of, print_table
+
+import cantools
+import numpy as np
+
+from autosar.loader import DBCLoader, TraceDecoder, TraceFormat
+
+DEFAULT_DBC = EXAMPLES_DIR / 'dbc' / 'ECM_PMBD_FD3_2025-34_LB-WL_PRS_Release_v2.dbc'
+BLOCK_FRAMES = 20000
+BASELINE_FRAMES = 20000
+
+# CAN FD data lengths -> DLC code
+FD_DLC = {12: 9, 16: 10, 20: 11, 24: 12, 32: 13, 48: 14, 64: 15}
+
+ASC_HEADER = (
+    "date Thu Oct 15 09:00:00.000 am 2026\n"
+    "base hex  timestamps absolute\n"
+    "internal events logged\n"
+    "Begin Triggerblock Thu Oct 15 09:00:00.000 am 2026\n"
+    "   0.000000 Start of measurement\n"
+)
+
+
+def frame_bodies(db, trace_format, rng):
+    """Timestamp-less line bodies of one block of random frames."""
+    messages = list(db.messages)
+    bodies = []
+    for i in range(BLOCK_FRAMES):
+        if i % 50 == 49:
+            frame_id, is_extended, data, name = 0x1FFFFFF0, True, b'\0' * 8, None
+        else:
+            message = messages[rng.integers(len(messages))]
+            frame_id, is_extended, name = message.message_id, message.is_extended, message.name
+            data = bytes(rng.integers(0, 256, message.dlc, dtype=np.uint8))
+        if trace_format == TraceFormat.CANDUMP:
+            frame = f"{frame_id:08X}" if is_extended else f"{frame_id:03X}"
+            sep = '##0' if len(data) > 8 else '#'
+            bodies.append(f" can0 {frame}{sep}{data.hex().upper()}\n")
+        else:
+            frame = f"{frame_id:X}" + ('x' if is_extended else '')
+            hex_bytes = ' '.join(f"{b:02X}" for b in data)
+            if len(data) > 8:
+                bodies.append(
+                    f" CANFD   1 Rx   {frame}  {name}   1 0 {FD_DLC[len(data)]:x} {len(data)} "
+                    f"{hex_bytes}   130000  130  303000 b 0 0\n"
+                )
+            else:
+                bodies.append(
+                    f" 1  {frame:<15} Rx   d {len(data)} {hex_bytes}  "
+                    f"Length = 228000 BitCount = 117 ID = {frame_id}\n"
+                )
+    return bodies
+
+
+def write_log(path, db, trace_format, size_bytes, rng):
+    """Write a synthetic log of about ``size_bytes``; returns the frame count."""
+    bodies = frame_bodies(db, trace_format, rng)
+    frames = 0
+    written = 0
+    t = 0.0
+    with open(path, 'w', encoding='latin-1') as f:
+        if trace_format == TraceFormat.ASC:
+            written += f.write(ASC_HEADER)
+        while written < size_bytes:
+            if trace_format == TraceFormat.CANDUMP:
+                lines = [f"({1760000000 + t + i * 1e-4:.6f})" + body for i, body in enumerate(bodies)]
+            else:
+                lines = [f"{t + i * 1e-4:11.6f}" + body for i, body in enumerate(bodies)]
+            written += f.write(''.join(lines))
+            frames += len(bodies)
+            t += len(bodies) * 1e-4
+        if trace_format == TraceFormat.ASC:
+            f.write("End TriggerBlock\n")
+    return frames
+
+
+def baseline_pass(path, reference, trace_format, limit):
+    """Per-frame parsing and cantools decoding of the first ``limit`` lines."""
+    if trace_format == TraceFormat.CANDUMP:
+        line_re = re.compile(r'^\((\d+\.\d+)\) (\S+) ([0-9A-F]+)#(?:#[0-9A-F])?([0-9A-F]*)$')
+    else:
+        line_re = re.compile(
+            r'^\s*(\d+\.\d+)\s+(?:CANFD\s+)?(\d+)\s+(?:Rx\s+)?([0-9A-F]+)x?\s+'
+            r'(?:Rx\s+d\s+\d+|\S+\s+1 0 \w \d+)((?: [0-9A-F]{2})*)'
+        )
+    by_id = {m.frame_id: m for m in reference.messages}
+    decoded = 0
+    with open(path, encoding='latin-1') as f:
+        for line, _ in zip(f, range(limit)):
+            match = line_re.match(line)
+            if match is None:
+                continue
+            message = by_id.get(int(match.group(3), 16))
+            if message is None:
+                continue
+            data = bytes.fromhex(match.group(4))[:message.length]
+            message.decode(data, decode_choices=False, allow_truncated=True)
+            decoded += 1
+    return decoded
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--repeat', type=int, default=1)
+    parser.add_argument('--size-mb', type=int, default=2048)
+    parser.add_argument('--format', choices=['candump', 'asc', 'all'], default='all')
+    parser.add_argument('--dbc', default=str(DEFAULT_DBC))
+    parser.add_argument('--keep', default=None, help="directory to write the logs to (kept)")
+    args = parser.parse_args()
+
+    db = DBCLoader().load_and_convert(args.dbc, use_cache=False)
+    reference = cantools.database.load_file(args.dbc, strict=False)
+    formats = list(TraceFormat) if args.format == 'all' else [TraceFormat(args.format)]
+    out_dir = Path(args.keep or tempfile.mkdtemp(prefix='ecuc_trace_'))
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    try:
+        for trace_format in formats:
+            path = out_dir / f"synthetic.{'log' if trace_format == TraceFormat.CANDUMP else 'asc'}"
+            frames = write_log(path, db, trace_format, args.size_mb * 1024 * 1024,
+                               np.random.default_rng(0))
+            size_mb = path.stat().st_size / 1024 / 1024
+
+            def run(method):
+                decoder = TraceDecoder(db)
+                count = sum(len(item.timestamps) if hasattr(item, 'timestamps') else 1
+                            for item in getattr(decoder, method)(path, trace_format))
+                return count, decoder.unknown_frames
+
+            t_frames, (n_frames, _) = best_of(lambda: run('iter_frames'), args.repeat)
+            t_blocks, (n_blocks, unknown) = best_of(lambda: run('iter_blocks'), args.repeat)
+            t_records, (n_records, _) = best_of(lambda: run('iter_records'), args.repeat)
+            assert n_frames == frames, (n_frames, frames)
+            assert n_blocks == n_records == frames - unknown, (n_blocks, n_records, unknown)
+
+            t_base, _ = best_of(
+                lambda: baseline_pass(path, reference, trace_format, BASELINE_FRAMES),
+                args.repeat,
+            )
+            t_base *= frames / BASELINE_FRAMES
+
+            print(f"{trace_format.value}: {size_mb:.0f} MB, {frames} frames "
+                  f"({unknown} unknown), cantools extrapolated from {BASELINE_FRAMES}\n")
+            print_table(
+                ['pass', 's', 'Mframes/s', 'MB/s', 'speedup'],
+                [
+                    [name, f"{t:.2f}", f"{frames / t / 1e6:.2f}", f"{size_mb / t:.0f}",
+                     f"{t_base / t:.1f}x"]
+                    for name, t in [
+                        ('cantools per frame', t_base),
+                        ('frames', t_frames),
+                        ('blocks', t_blocks),
+                        ('records', t_records),
+                    ]
+                ],
+            )
+            print()
+    finally:
+        if args.keep is None:
+            shutil.rmtree(out_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
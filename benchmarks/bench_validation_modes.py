@@ -0,0 +1,111 @@
+"""
+Benchmark: strict vs trusted model construction in every loader.
+
+For each example file, the file is parsed once and the model conversion
+(to_model(), and from_cantools() for DBC) is timed in 'strict' mode (full
+pydantic validation) and 'trusted' mode (construct_trusted). Both modes must
+produce the same models; the run aborts if they differ.
+
+A final row times a bulk edit (reassigning the start bit of every signal of
+the largest DBC) with and without trusted_assignment().
+
+Usage:
+    python benchmarks/bench_validation_modes.py [--repeat N]
+"""
+
+import argparse
+
+from _bench import EXAMPLES_DIR, best_of, print_table
+
+from autosar.loader import CompleteXLSXLoader, DBCLoader, LDFLoader, XLSXLoader
+from autosar.model.base import trusted_assignment
+
+CASES = (
+    (DBCLoader, 'dbc', '*.dbc'),
+    (LDFLoader, 'ldf', '*.ldf'),
+    (XLSXLoader, 'xlsx', '*.xlsx'),
+    (CompleteXLSXLoader, 'xlsx', '*.xlsx'),
+)
+
+
+def content(model):
+    """Model content without the random UUIDs."""
+    def strip(value):
+        if isinstance(value, dict):
+            return {k: strip(v) for k, v in value.items() if k != 'uuid'}
+        if isinstance(value, list):
+            return [strip(v) for v in value]
+        return value
+    return strip(model.model_dump())
+
+
+def count_models(model) -> int:
+    """Number of messages/frames plus signals in a loaded model."""
+    items = getattr(model, 'messages', None) or getattr(model, 'frames', [])
+    return len(items) + sum(len(item.signals) for item in items)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    rows = []
+    largest_dbc = None
+    for loader_cls, folder, pattern in CASES:
+        strict = loader_cls(validation='strict')
+        trusted = loader_cls(validation='trusted')
+        for path in sorted((EXAMPLES_DIR / folder).glob(pattern)):
+            data = strict.load(str(path))
+            strict.validate(data)
+
+            conversions = [('to_model', lambda loader: loader.to_model(data))]
+            if loader_cls is DBCLoader:
+                db = data['dbc_object']
+                conversions.append(
+                    ('from_cantools', lambda loader: loader.from_cantools(db, name=path.stem))
+                )
+
+            for label, convert in conversions:
+                t_strict, model = best_of(lambda: convert(strict), args.repeat)
+                t_trusted, trusted_model = best_of(lambda: convert(trusted), args.repeat)
+                assert content(model) == content(trusted_model), (loader_cls.__name__, path.name)
+                rows.append([
+                    f"{loader_cls.__name__}.{label}",
+                    path.name[:36],
+                    count_models(model),
+                    f"{t_strict * 1000:.1f}",
+                    f"{t_trusted * 1000:.1f}",
+                    f"{t_strict / t_trusted:.1f}x",
+                ])
+            if loader_cls is DBCLoader and (
+                largest_dbc is None or count_models(model) > count_models(largest_dbc)
+            ):
+                largest_dbc = trusted_model
+
+    signals = [signal for message in largest_dbc.messages for signal in message.signals]
+
+    def assign():
+        for signal in signals:
+            signal.start_bit = signal.start_bit
+
+    def assign_trusted():
+        with trusted_assignment():
+            assign()
+
+    t_strict, _ = best_of(assign, args.repeat)
+    t_trusted, _ = best_of(assign_trusted, args.repeat)
+    rows.append([
+        'bulk start_bit assignment',
+        largest_dbc.name[:36],
+        len(signals),
+        f"{t_strict * 1000:.1f}",
+        f"{t_trusted * 1000:.1f}",
+        f"{t_strict / t_trusted:.1f}x",
+    ])
+
+    print_table(['conversion', 'file', 'models', 'strict ms', 'trusted ms', 'speedup'], rows)
+
+
+if __name__ == '__main__':
+    main()
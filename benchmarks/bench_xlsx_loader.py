@@ -0,0 +1,75 @@
+"""
+Benchmark: XLSXLoader sheet parsing scaling on synthetic Rx/Tx sheets.
+
+Builds in-memory worksheets in the customer layout (title row, header row,
+then one row per signal with the message name/ID only on the first row of
+each message block, as produced by merged cells) and times
+XLSXLoader._parse_rx_sheet()/_parse_tx_sheet(). Parse time per row should
+stay flat as the sheet grows.
+
+Usage:
+    python benchmarks/bench_xlsx_loader.py [--repeat N] [--rows 12500,25000,50000]
+"""
+
+import argparse
+
+from _bench import best_of, print_table
+
+import openpyxl
+
+from autosar.loader import XLSXLoader
+
+SIGNALS_PER_MESSAGE = 8
+
+
+def build_sheet(workbook: openpyxl.Workbook, title: str, rows: int, width: int):
+    """Create a sheet with ``rows`` signal rows in blocks of SIGNALS_PER_MESSAGE."""
+    sheet = workbook.create_sheet(title)
+    sheet.append([f'{title} data'] + [None] * (width - 1))
+    sheet.append([f'Header {i}' for i in range(width)])
+    for i in range(rows):
+        msg = i // SIGNALS_PER_MESSAGE
+        first = i % SIGNALS_PER_MESSAGE == 0
+        row = [None] * width
+        if first:
+            row[0] = f'MSG_{msg}'
+            row[1] = f'{0x100 + msg:X}h'
+        row[2] = f'SIG_{i}'
+        row[4 if title == 'Tx' else 5] = 8
+        sheet.append(row)
+    return sheet
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--rows', default='12500,25000,50000')
+    args = parser.parse_args()
+
+    loader = XLSXLoader()
+    rows_out = []
+    for title, parse in (('Rx', loader._parse_rx_sheet), ('Tx', loader._parse_tx_sheet)):
+        base_rate = None
+        for n in (int(r) for r in args.rows.split(',')):
+            workbook = openpyxl.Workbook()
+            sheet = build_sheet(workbook, title, n, width=10)
+            t_parse, messages = best_of(lambda: parse(sheet), args.repeat)
+            rate = t_parse * 1e6 / n
+            base_rate = base_rate or rate
+            rows_out.append([
+                title,
+                n,
+                len(messages),
+                f"{t_parse * 1000:.1f}",
+                f"{rate:.2f}",
+                f"{rate / base_rate:.2f}",
+            ])
+
+    print_table(
+        ['sheet', 'rows', 'messages', 'parse ms', 'us/row', 'us/row vs smallest'],
+        rows_out,
+    )
+
+
+if __name__ == '__main__':
+    main()
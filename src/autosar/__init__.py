@@ -8,9 +8,24 @@ CAN/LIN networks, and related automotive communication protocols.
 __version__ = "0.1.0"
 __author__ = "ECUC Configurator Team"
 
-from . import model
-from . import loader
-from . import generator
-from . import service
+from typing import TYPE_CHECKING
+import importlib
+
+if TYPE_CHECKING:
+    from . import model
+    from . import loader
+    from . import generator
+    from . import service
 
 __all__ = ["model", "loader", "generator", "service"]
+
+
+def __getattr__(name: str):
+    """Import subpackages on first access to keep ``import autosar`` fast."""
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -4,8 +4,10 @@ ECUC Generator - Generates ECUC configuration files in ARXML format.
 Supports AUTOSAR AR4.2.2 and AR4.5 formats.
 """
 
-from typing import Optional, TextIO
+from typing import Dict, Optional, TextIO, Union
+from concurrent.futures import Executor
 from pathlib import Path
+import asyncio
 import logging
 from xml.etree import ElementTree as ET
 from xml.dom import minidom
@@ -15,6 +17,7 @@ from ..model import (
     ECUCContainerValue, ECUCParameterValue,
     AutosarVersion, ECUCParameterType
 )
+from ..model.base import BaseElement, UUIDStrategy, deterministic_uuid, get_uuid_strategy
 
 
 class GeneratorException(Exception):
@@ -22,12 +25,41 @@ class GeneratorException(Exception):
     pass
 
 
+class _UUIDResolver:
+    """
+    UUIDs written by one generation run.
+    
+    Under UUIDStrategy.DETERMINISTIC every element, otherwise only elements
+    without a UUID, get deterministic_uuid() of their reference path, as
+    returned by ``ECUCProject.reference_index`` (modules directly below the
+    project package, e.g. '/Proj/CanIf'). A path already used in the run
+    (e.g. a parameter named like a sibling sub-container) gets a '#n' suffix
+    so UUIDs stay unique within the file.
+    """
+    
+    def __init__(self, strategy: UUIDStrategy):
+        self.deterministic = strategy == UUIDStrategy.DETERMINISTIC
+        self._seen: Dict[str, int] = {}
+    
+    def uuid_of(self, element: BaseElement, path: str) -> str:
+        """Get the UUID to write for an element at ``path``."""
+        if element.uuid and not self.deterministic:
+            return element.uuid
+        count = self._seen.get(path, 0)
+        self._seen[path] = count + 1
+        return deterministic_uuid(f"{path}#{count}" if count else path)
+
+
 class ECUCGenerator:
     """
     Generator for ECUC configuration files.
     
     Generates ARXML files containing ECUC configuration values
     compatible with AUTOSAR AR4.2.2 and AR4.5.
+    
+    With ``uuid_strategy='deterministic'`` every UUID is derived from the
+    element's path instead of read from the model, so regenerating an
+    unchanged configuration gives a byte-identical file.
     """
     
     # XML namespaces for different AUTOSAR versions
@@ -44,14 +76,23 @@ class ECUCGenerator:
         },
     }
     
-    def __init__(self, logger: Optional[logging.Logger] = None):
+    def __init__(
+        self,
+        logger: Optional[logging.Logger] = None,
+        uuid_strategy: Optional[Union[UUIDStrategy, str]] = None
+    ):
         """
         Initialize ECUC generator.
         
         Args:
             logger: Optional logger instance
+            uuid_strategy: 'random' writes the elements' UUIDs (deriving
+                only missing ones), 'deterministic' derives all UUIDs from
+                the element paths (default: the process-wide strategy at
+                generation time)
         """
         self.logger = logger or logging.getLogger(self.__class__.__name__)
+        self.uuid_strategy = None if uuid_strategy is None else UUIDStrategy(uuid_strategy)
     
     def generate(
         self,
@@ -89,7 +130,9 @@ class ECUCGenerator:
             # Add ECUC value collection
             self._generate_ecuc_value_collection(
                 main_package,
-                project.value_collection
+                project.value_collection,
+                f"/{project.short_name}",
+                self._uuid_resolver()
             )
             
             # Write to file
@@ -100,6 +143,43 @@ class ECUCGenerator:
         except Exception as e:
             raise GeneratorException(f"Failed to generate ECUC ARXML: {e}") from e
     
+    async def agenerate(
+        self,
+        project: ECUCProject,
+        output_path: str,
+        pretty_print: bool = True,
+        timeout: Optional[float] = None,
+        executor: Optional[Executor] = None
+    ) -> None:
+        """
+        Generate ECUC configuration ARXML file without blocking the event loop.
+        
+        Async counterpart of generate(); the work runs in ``executor`` (the
+        event loop's default executor if None). On timeout or cancellation
+        the caller stops waiting, but a file write already in progress is
+        not interrupted.
+        
+        Args:
+            project: ECUC project to generate
+            output_path: Path to output ARXML file
+            pretty_print: If True, format XML with indentation
+            timeout: Optional timeout in seconds
+            executor: Optional executor to run generation in
+            
+        Raises:
+            GeneratorException: If generation fails
+            asyncio.TimeoutError: If the timeout expires
+        """
+        loop = asyncio.get_running_loop()
+        await asyncio.wait_for(
+            loop.run_in_executor(executor, self.generate, project, output_path, pretty_print),
+            timeout,
+        )
+    
+    def _uuid_resolver(self) -> _UUIDResolver:
+        """Create the UUID resolver of one generation run."""
+        return _UUIDResolver(self.uuid_strategy or get_uuid_strategy())
+    
     def _create_autosar_root(self, version: AutosarVersion) -> ET.Element:
         """Create AUTOSAR root element with proper namespaces."""
         namespaces = self.NAMESPACES[version]
@@ -139,7 +219,9 @@ class ECUCGenerator:
     def _generate_ecuc_value_collection(
         self,
         parent: ET.Element,
-        collection: ECUCValueCollection
+        collection: ECUCValueCollection,
+        package_path: str,
+        uuids: _UUIDResolver
     ) -> None:
         """Generate ECUC-VALUE-COLLECTION element."""
         elements = ET.SubElement(parent, 'ELEMENTS')
@@ -148,9 +230,9 @@ class ECUCGenerator:
         # Add SHORT-NAME
         ET.SubElement(ecuc_value_collection, 'SHORT-NAME').text = collection.short_name
         
-        # Add UUID if present
-        if collection.uuid:
-            ET.SubElement(ecuc_value_collection, 'UUID').text = collection.uuid
+        # Add UUID
+        path = f"{package_path}/{collection.short_name}"
+        ET.SubElement(ecuc_value_collection, 'UUID').text = uuids.uuid_of(collection, path)
         
         # Add ECU-EXTRACT-VERSION
         ET.SubElement(ecuc_value_collection, 'ECU-EXTRACT-VERSION').text = \
@@ -160,13 +242,16 @@ class ECUCGenerator:
         if collection.modules:
             ecuc_values = ET.SubElement(ecuc_value_collection, 'ECUC-VALUES')
             
+            # Modules are referenced below the package, not the collection
             for module in collection.modules:
-                self._generate_module_configuration(ecuc_values, module)
+                self._generate_module_configuration(ecuc_values, module, package_path, uuids)
     
     def _generate_module_configuration(
         self,
         parent: ET.Element,
-        module: ECUCModuleConfigurationValues
+        module: ECUCModuleConfigurationValues,
+        parent_path: str,
+        uuids: _UUIDResolver
     ) -> None:
         """Generate ECUC-MODULE-CONFIGURATION-VALUES element."""
         module_config = ET.SubElement(parent, 'ECUC-MODULE-CONFIGURATION-VALUES')
@@ -175,8 +260,8 @@ class ECUCGenerator:
         ET.SubElement(module_config, 'SHORT-NAME').text = module.short_name
         
         # Add UUID
-        if module.uuid:
-            ET.SubElement(module_config, 'UUID').text = module.uuid
+        path = f"{parent_path}/{module.short_name}"
+        ET.SubElement(module_config, 'UUID').text = uuids.uuid_of(module, path)
         
         # Add DEFINITION-REF
         definition_ref = ET.SubElement(module_config, 'DEFINITION-REF')
@@ -192,12 +277,14 @@ class ECUCGenerator:
             containers = ET.SubElement(module_config, 'CONTAINERS')
             
             for container in module.containers:
-                self._generate_container(containers, container)
+                self._generate_container(containers, container, path, uuids)
     
     def _generate_container(
         self,
         parent: ET.Element,
-        container: ECUCContainerValue
+        container: ECUCContainerValue,
+        parent_path: str,
+        uuids: _UUIDResolver
     ) -> None:
         """Generate ECUC-CONTAINER-VALUE element."""
         container_elem = ET.SubElement(parent, 'ECUC-CONTAINER-VALUE')
@@ -206,8 +293,8 @@ class ECUCGenerator:
         ET.SubElement(container_elem, 'SHORT-NAME').text = container.short_name
         
         # Add UUID
-        if container.uuid:
-            ET.SubElement(container_elem, 'UUID').text = container.uuid
+        path = f"{parent_path}/{container.short_name}"
+        ET.SubElement(container_elem, 'UUID').text = uuids.uuid_of(container, path)
         
         # Add DEFINITION-REF
         definition_ref = ET.SubElement(container_elem, 'DEFINITION-REF')
@@ -219,19 +306,21 @@ class ECUCGenerator:
             parameter_values = ET.SubElement(container_elem, 'PARAMETER-VALUES')
             
             for param in container.parameters:
-                self._generate_parameter(parameter_values, param)
+                self._generate_parameter(parameter_values, param, path, uuids)
         
         # Add sub-containers
         if container.sub_containers:
             sub_containers = ET.SubElement(container_elem, 'SUB-CONTAINERS')
             
             for sub_container in container.sub_containers:
-                self._generate_container(sub_containers, sub_container)
+                self._generate_container(sub_containers, sub_container, path, uuids)
     
     def _generate_parameter(
         self,
         parent: ET.Element,
-        param: ECUCParameterValue
+        param: ECUCParameterValue,
+        parent_path: str,
+        uuids: _UUIDResolver
     ) -> None:
         """Generate parameter value element based on type."""
         # Determine element name based on parameter type
@@ -252,8 +341,8 @@ class ECUCGenerator:
         ET.SubElement(param_elem, 'SHORT-NAME').text = param.short_name
         
         # Add UUID
-        if param.uuid:
-            ET.SubElement(param_elem, 'UUID').text = param.uuid
+        path = f"{parent_path}/{param.short_name}"
+        ET.SubElement(param_elem, 'UUID').text = uuids.uuid_of(param, path)
         
         # Add DEFINITION-REF
         definition_ref = ET.SubElement(param_elem, 'DEFINITION-REF')
@@ -342,7 +431,9 @@ class ECUCGenerator:
             
             self._generate_ecuc_value_collection(
                 main_package,
-                project.value_collection
+                project.value_collection,
+                f"/{project.short_name}",
+                self._uuid_resolver()
             )
             
             # Convert to string
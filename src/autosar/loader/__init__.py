@@ -6,8 +6,13 @@ Provides file loaders for various formats:
 - XLSX (Excel configurations)
 - ARXML (AUTOSAR XML)
 - LDF (LIN Description File)
+
+and a streaming decoder for candump/ASC CAN trace logs.
 """
 
+from typing import TYPE_CHECKING
+import importlib
+
 from .base_loader import (
     BaseLoader,
     CachedLoader,
@@ -16,16 +21,44 @@ from .base_loader import (
     ValidationError,
     ConversionError,
     UnsupportedFormatError,
+    ValidationMode,
 )
-from .dbc_loader import DBCLoader
-from .ldf_loader import LDFLoader
-from .xlsx_loader import XLSXLoader
-from .complete_xlsx_loader import CompleteXLSXLoader
+from .disk_cache import DiskCache
+from .model_cache import CacheInfo, ModelCache
+from .registry import LoaderRegistry, LoaderSpec
+
+if TYPE_CHECKING:
+    from .dbc_loader import DBCLoader
+    from .ldf_loader import LDFLoader
+    from .xlsx_loader import XLSXLoader
+    from .complete_xlsx_loader import CompleteXLSXLoader
+    from .trace_decoder import TraceDecoder, TraceFormat, TraceFrame, TraceBlock, TraceRecord
+
+# Loaders imported on first access (name -> submodule)
+_LAZY_LOADERS = {
+    "DBCLoader": ".dbc_loader",
+    "LDFLoader": ".ldf_loader",
+    "XLSXLoader": ".xlsx_loader",
+    "CompleteXLSXLoader": ".complete_xlsx_loader",
+    # CAN trace logs (require numpy)
+    "TraceDecoder": ".trace_decoder",
+    "TraceFormat": ".trace_decoder",
+    "TraceFrame": ".trace_decoder",
+    "TraceBlock": ".trace_decoder",
+    "TraceRecord": ".trace_decoder",
+}
 
 __all__ = [
     # Base classes
     "BaseLoader",
     "CachedLoader",
+    "DiskCache",
+    "ModelCache",
+    "CacheInfo",
+    "ValidationMode",
+    # Registry
+    "LoaderRegistry",
+    "LoaderSpec",
     # Exceptions
     "LoaderException",
     "ParserError",
@@ -37,4 +70,24 @@ __all__ = [
     "LDFLoader",
     "XLSXLoader",
     "CompleteXLSXLoader",
+    # CAN trace logs
+    "TraceDecoder",
+    "TraceFormat",
+    "TraceFrame",
+    "TraceBlock",
+    "TraceRecord",
 ]
+
+
+def __getattr__(name: str):
+    """Import loader modules on first access."""
+    module_name = _LAZY_LOADERS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
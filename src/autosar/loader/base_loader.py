@@ -5,9 +5,17 @@ Provides the foundation for all file loaders in the system.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Generic, TypeVar
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional, Generic, TypeVar, Union
 from pathlib import Path
+from types import ModuleType
+import copy
+import importlib
 import logging
+import os
+
+from .disk_cache import DiskCache
+from .model_cache import CacheInfo, ModelCache
 
 # Type variable for model types
 T = TypeVar('T')
@@ -43,6 +51,48 @@ class UnsupportedFormatError(LoaderException):
     pass
 
 
+def import_optional(module_name: str, feature: str) -> ModuleType:
+    """
+    Import a third-party dependency on first use.
+    
+    cantools and openpyxl take most of the package import time, so the
+    loaders import them only when a file is actually loaded.
+    
+    Args:
+        module_name: Name of the module to import (e.g., 'cantools')
+        feature: Feature needing the module, used in the error message
+        
+    Returns:
+        Imported module
+        
+    Raises:
+        ImportError: If the module is not installed
+    """
+    try:
+        return importlib.import_module(module_name)
+    except ImportError as e:
+        raise ImportError(
+            f"{module_name} is required for {feature}. "
+            f"Install with: pip install {module_name}"
+        ) from e
+
+
+class ValidationMode(str, Enum):
+    """How a loader builds models from parsed data."""
+    STRICT = "strict"    # Full pydantic validation of every model
+    TRUSTED = "trusted"  # construct_trusted(): no validation, values used as is
+
+
+def strip_text(text: Optional[str]) -> Optional[str]:
+    """Strip whitespace like the models' ``str_strip_whitespace`` setting."""
+    return text.strip() if isinstance(text, str) else text
+
+
+def _construct_validated(model_cls: type, **values: Any) -> Any:
+    """Build a model through its validating constructor."""
+    return model_cls(**values)
+
+
 class BaseLoader(ABC, Generic[T]):
     """
     Abstract base class for all file loaders.
@@ -56,16 +106,46 @@ class BaseLoader(ABC, Generic[T]):
     - load(): Parse file content
     - validate(): Validate parsed data
     - to_model(): Convert to model objects
+    
+    Models are built through ``self._construct(model_cls, **values)``, which
+    follows the loader's validation mode:
+    - strict (default): every model goes through full pydantic validation
+    - trusted: models are built with ``construct_trusted`` and not
+      validated. For input that has already been checked (cantools objects,
+      the loader's own parsed dicts); values must already have the field
+      types, so the loaders normalize them the way validation would.
     """
     
-    def __init__(self, logger: Optional[logging.Logger] = None):
+    def __init__(
+        self,
+        logger: Optional[logging.Logger] = None,
+        validation: Union[str, ValidationMode] = ValidationMode.STRICT
+    ):
         """
         Initialize loader.
         
         Args:
             logger: Optional logger instance. If None, creates default logger.
+            validation: Validation mode, 'strict' or 'trusted'
         """
         self.logger = logger or logging.getLogger(self.__class__.__name__)
+        self.validation = validation
+    
+    @property
+    def validation(self) -> ValidationMode:
+        """Validation mode used when building models."""
+        return self._validation
+    
+    @validation.setter
+    def validation(self, mode: Union[str, ValidationMode]) -> None:
+        self._validation = ValidationMode(mode)
+        self._construct: Callable[..., Any]
+        if self._validation is ValidationMode.TRUSTED:
+            # Imported here: pydantic is not needed to import the loaders
+            from ..model.base import construct_trusted
+            self._construct = construct_trusted
+        else:
+            self._construct = _construct_validated
     
     def _validate_file_exists(self, file_path: str) -> Path:
         """
@@ -172,16 +252,7 @@ class BaseLoader(ABC, Generic[T]):
         self.logger.info(f"Loading file: {file_path}")
         
         try:
-            # Load file
-            data = self.load(file_path)
-            self.logger.debug(f"Loaded data with {len(data)} top-level keys")
-            
-            # Validate
-            self.validate(data)
-            self.logger.debug("Data validation successful")
-            
-            # Convert to model
-            model = self.to_model(data)
+            model = self._load_model(file_path)
             self.logger.info("File loaded and converted successfully")
             
             return model
@@ -193,6 +264,30 @@ class BaseLoader(ABC, Generic[T]):
             # Wrap other exceptions
             self.logger.error(f"Unexpected error: {e}", exc_info=True)
             raise LoaderException(f"Failed to load file: {e}") from e
+    
+    def _load_model(self, file_path: str) -> T:
+        """
+        Run the load -> validate -> to_model pipeline for one file.
+        
+        Subclasses may override this to provide a faster conversion path
+        that skips the intermediate dictionary stage.
+        
+        Args:
+            file_path: Path to file to load
+            
+        Returns:
+            Model object(s)
+        """
+        # Load file
+        data = self.load(file_path)
+        self.logger.debug(f"Loaded data with {len(data)} top-level keys")
+        
+        # Validate
+        self.validate(data)
+        self.logger.debug("Data validation successful")
+        
+        # Convert to model
+        return self.to_model(data)
 
 
 class CachedLoader(BaseLoader[T]):
@@ -200,12 +295,73 @@ class CachedLoader(BaseLoader[T]):
     Base loader with caching support.
     
     Caches loaded files to avoid re-parsing the same file multiple times.
+    
+    Two cache levels are available:
+    - In-process: LRU cache keyed by resolved path, bounded by entry count
+      and approximate model size (messages + signals), invalidated when the
+      source file's mtime or size changes
+    - On-disk: results keyed by file content hash, loader class and package
+      version (enabled via ``cache_dir`` or the ``ECUC_CACHE_DIR``
+      environment variable), so warm loads survive process restarts
+    
+    The cache keeps its own instance of every model: each call returns a
+    deep copy, so callers may modify the result without affecting later
+    loads of the same file.
     """
     
-    def __init__(self, logger: Optional[logging.Logger] = None):
-        """Initialize cached loader."""
-        super().__init__(logger)
-        self._cache: Dict[str, T] = {}
+    CACHE_DIR_ENV = 'ECUC_CACHE_DIR'
+    
+    def __init__(
+        self,
+        logger: Optional[logging.Logger] = None,
+        cache_dir: Optional[str] = None,
+        max_cache_bytes: Optional[int] = None,
+        max_cache_entries: Optional[int] = 128,
+        max_cache_weight: Optional[int] = None,
+        validation: Union[str, ValidationMode] = ValidationMode.STRICT
+    ):
+        """
+        Initialize cached loader.
+        
+        Args:
+            logger: Optional logger instance
+            cache_dir: Directory for the persistent cache. If None, the
+                ``ECUC_CACHE_DIR`` environment variable is used; if that is
+                unset, only the in-process cache is active.
+            max_cache_bytes: Size bound for the persistent cache
+            max_cache_entries: Maximum number of models kept in memory
+                (None = unbounded)
+            max_cache_weight: Maximum total size of models kept in memory,
+                counted as messages + signals (None = unbounded)
+            validation: Validation mode, 'strict' or 'trusted'
+        """
+        super().__init__(logger, validation)
+        self._cache: ModelCache = ModelCache(
+            maxsize=max_cache_entries,
+            max_weight=max_cache_weight,
+            logger=self.logger,
+        )
+        
+        cache_dir = cache_dir or os.environ.get(self.CACHE_DIR_ENV)
+        self._disk_cache: Optional[DiskCache] = None
+        if cache_dir:
+            self._disk_cache = DiskCache(
+                cache_dir,
+                namespace=self._cache_namespace(),
+                max_bytes=max_cache_bytes,
+                logger=self.logger,
+            )
+    
+    @property
+    def disk_cache(self) -> Optional[DiskCache]:
+        """Persistent cache, or None if disabled."""
+        return self._disk_cache
+    
+    def _cache_namespace(self) -> str:
+        """Key prefix separating entries by loader class and package version."""
+        from .. import __version__
+        cls = self.__class__
+        return f"{cls.__module__}.{cls.__qualname__}:{__version__}"
     
     def load_and_convert(self, file_path: str, use_cache: bool = True) -> T:
         """
@@ -216,27 +372,66 @@ class CachedLoader(BaseLoader[T]):
             use_cache: If True, use cached result if available
             
         Returns:
-            Model object(s)
+            Model object(s), a copy of the cached instance when caching
         """
         # Resolve path for cache key
-        resolved_path = str(Path(file_path).resolve())
+        path = Path(file_path).resolve()
+        resolved_path = str(path)
         
         # Check cache
-        if use_cache and resolved_path in self._cache:
-            self.logger.debug(f"Using cached result for: {file_path}")
-            return self._cache[resolved_path]
+        if use_cache:
+            result = self._cache.get(resolved_path)
+            if result is not None:
+                self.logger.debug(f"Using cached result for: {file_path}")
+                return self._copy_model(result)
+        
+        # Check persistent cache
+        disk_cache = self._disk_cache if use_cache and path.is_file() else None
+        if disk_cache is not None:
+            found, result = disk_cache.get(path)
+            if found:
+                self._cache.put(resolved_path, result)
+                return self._copy_model(result)
         
         # Load and convert
         result = super().load_and_convert(file_path)
         
         # Store in cache
         if use_cache:
-            self._cache[resolved_path] = result
+            self._cache.put(resolved_path, result)
+            if disk_cache is not None:
+                disk_cache.put(path, result)
             self.logger.debug(f"Cached result for: {file_path}")
+            return self._copy_model(result)
         
         return result
     
-    def clear_cache(self) -> None:
-        """Clear the cache."""
+    @staticmethod
+    def _copy_model(model: T) -> T:
+        """Deep copy a cached model (far cheaper than parsing it again)."""
+        model_copy = getattr(model, 'model_copy', None)
+        if model_copy is not None:
+            return model_copy(deep=True)
+        return copy.deepcopy(model)
+    
+    def clear_cache(self, persistent: bool = False) -> None:
+        """
+        Clear the cache.
+        
+        Args:
+            persistent: If True, also remove all persistent cache entries
+        """
         self._cache.clear()
+        if persistent and self._disk_cache is not None:
+            self._disk_cache.clear()
         self.logger.debug("Cache cleared")
+    
+    def cache_info(self) -> CacheInfo:
+        """
+        Report in-process cache statistics.
+        
+        Returns:
+            CacheInfo with hits, misses, maxsize, currsize, evictions,
+            invalidations, weight and max_weight
+        """
+        return self._cache.cache_info()
@@ -5,33 +5,80 @@ This loader captures EVERY field from customer Excel files (Rx/Tx sheets),
 not just basic CAN data. Provides complete traceability and data preservation.
 """
 
-from typing import Dict, Any, List, Optional
+from typing import TYPE_CHECKING, Callable, Dict, Any, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 import logging
 from pathlib import Path
 
-try:
-    import openpyxl
-    from openpyxl.worksheet.worksheet import Worksheet
-except ImportError:
-    raise ImportError(
-        "openpyxl is required for XLSX loading. "
-        "Install with: pip install openpyxl"
-    )
-
-from .base_loader import BaseLoader, ParserError, ValidationError
+from .base_loader import (
+    CachedLoader, ParserError, ValidationError, ConversionError, ValidationMode,
+    import_optional,
+)
 from ..model import (
     CompleteXLSXDatabase,
     CompleteXLSXMessage,
     CompleteXLSXSignal,
-    MessageDirection,
     RxColumnMapping,
     TxColumnMapping,
     InvalidationPolicy,
     SignalStatus,
 )
+# Not the XLSXMessage enum exported by ..model: the complete models have their own
+from ..model.xlsx_complete_model import MessageDirection
+
+if TYPE_CHECKING:
+    import openpyxl
+    from openpyxl.worksheet.worksheet import Worksheet
+
+
+def _openpyxl():
+    """Import openpyxl on first use (it dominates the package import time)."""
+    return import_optional('openpyxl', 'XLSX loading')
+
 
+# Mapped columns describing the message rather than the signal
+MESSAGE_FIELDS = ('message_name', 'message_id')
 
-class CompleteXLSXLoader(BaseLoader[CompleteXLSXDatabase]):
+
+class SheetLayout(NamedTuple):
+    """
+    Column layout of an Rx/Tx sheet, compiled from its sub-header row.
+    
+    ``columns`` holds one (field, column index, converter) entry per signal
+    column found in the sheet; ``defaults`` holds the converted empty value
+    of mapped fields whose column is missing.
+    """
+    message_name_index: int
+    message_id_index: int
+    signal_name_index: int
+    columns: Tuple[Tuple[str, int, Optional[Callable[[Optional[str]], Any]]], ...]
+    defaults: Dict[str, Any]
+
+
+def _normalize_title(title: Any) -> str:
+    """Normalize a column title for matching (whitespace and case)."""
+    return ' '.join(str(title).split()).casefold() if title is not None else ''
+
+
+# Loader instances of the current worker process, reused across tasks
+_worker_loaders: Dict[type, 'CompleteXLSXLoader'] = {}
+
+
+def _parse_sheet_in_worker(
+    loader_cls: type,
+    file_path: str,
+    sheet_name: str,
+    direction: 'MessageDirection'
+) -> List[Dict[str, Any]]:
+    """Process pool task: parse one sheet of a workbook."""
+    loader = _worker_loaders.get(loader_cls)
+    if loader is None:
+        loader = _worker_loaders[loader_cls] = loader_cls()
+    return loader._parse_sheet_file(file_path, sheet_name, direction)
+
+
+class CompleteXLSXLoader(CachedLoader[CompleteXLSXDatabase]):
     """
     Complete XLSX Loader - Parses ALL 44 columns from Excel.
     
@@ -64,10 +111,52 @@ class CompleteXLSXLoader(BaseLoader[CompleteXLSXDatabase]):
     SUB_HEADER_ROW = 1    # Row 2: "CAN Message Name", etc.
     DATA_START_ROW = 2    # Row 3: First data row
     
-    def __init__(self, logger: Optional[logging.Logger] = None):
-        """Initialize complete XLSX loader."""
-        super().__init__(logger)
-        self._workbook: Optional[openpyxl.Workbook] = None
+    # Signal field -> name of the converter applied to its cell string
+    FIELD_CONVERTERS = {
+        'signal_name': '_parse_required_str',
+        'signal_size': '_parse_signal_size',
+        'has_sna': '_parse_yes_no',
+        'periodicity': '_parse_int',
+        'timeout': '_parse_int',
+        'start_bit': '_parse_int',
+        'status': '_parse_status',
+        'invalidation_policy': '_parse_invalidation_policy',
+        'invalidation_policy_scaled': '_parse_invalidation_policy',
+    }
+    
+    # Compiled layouts keyed by (loader class, mapping, header fingerprint)
+    _layouts: Dict[Tuple[type, type, Tuple[str, ...]], SheetLayout] = {}
+    
+    def __init__(
+        self,
+        logger: Optional[logging.Logger] = None,
+        streaming: bool = True,
+        workers: int = 1,
+        validation: Union[str, ValidationMode] = ValidationMode.STRICT,
+        **cache_options: Any
+    ):
+        """
+        Initialize complete XLSX loader.
+        
+        Args:
+            logger: Optional logger instance
+            streaming: If True, open workbooks read-only and stream rows
+                instead of loading the full cell model into memory
+            workers: Number of worker processes for load(). With more than
+                one, the Rx and Tx sheets are parsed concurrently in a
+                process pool. Every worker opens the workbook itself, so
+                this only pays off for workbooks with two large sheets on a
+                multi-core machine; the default parses them sequentially.
+            validation: 'strict' validates every model; 'trusted' builds them
+                from the parsed data without validation
+            **cache_options: Cache settings passed to CachedLoader
+                (``cache_dir``, ``max_cache_bytes``, ``max_cache_entries``,
+                ``max_cache_weight``)
+        """
+        super().__init__(logger, validation=validation, **cache_options)
+        self.streaming = streaming
+        self.workers = workers
+        self._workbook: Optional['openpyxl.Workbook'] = None
     
     def load(self, file_path: str) -> Dict[str, Any]:
         """
@@ -86,9 +175,14 @@ class CompleteXLSXLoader(BaseLoader[CompleteXLSXDatabase]):
         path = self._validate_file_exists(file_path)
         self._validate_file_extension(path, ['.xlsx', '.XLSX'])
         
+        if self.workers > 1:
+            return self._load_parallel(path)
+        
         try:
             self.logger.info(f"Loading complete XLSX: {path}")
-            self._workbook = openpyxl.load_workbook(str(path), data_only=True)
+            self._workbook = _openpyxl().load_workbook(
+                str(path), read_only=self.streaming, data_only=True
+            )
             
             data = {
                 'file_path': str(path),
@@ -116,129 +210,185 @@ class CompleteXLSXLoader(BaseLoader[CompleteXLSXDatabase]):
             
         except Exception as e:
             raise ParserError(f"Failed to parse XLSX: {e}")
+        finally:
+            # Read-only workbooks keep the file open until closed
+            if self.streaming and self._workbook is not None:
+                self._workbook.close()
     
-    def _parse_rx_sheet_complete(self, sheet: Worksheet) -> List[Dict[str, Any]]:
+    def _load_parallel(self, path: Path) -> Dict[str, Any]:
+        """
+        Parse the Rx and Tx sheets in worker processes.
+        
+        Each sheet is parsed by its own task, which opens the workbook
+        read-only and streams that sheet once. A missing sheet yields no
+        messages, as in load().
+        
+        Args:
+            path: Validated path to XLSX file
+            
+        Returns:
+            Dictionary with complete parsed data (same as load())
+        """
+        sheets = (
+            (self.RX_SHEET_NAME, MessageDirection.RX, 'rx_messages'),
+            (self.TX_SHEET_NAME, MessageDirection.TX, 'tx_messages'),
+        )
+        
+        try:
+            self.logger.info(f"Loading complete XLSX with {self.workers} workers: {path}")
+            with ProcessPoolExecutor(max_workers=min(self.workers, len(sheets))) as executor:
+                futures = [
+                    (key, executor.submit(
+                        _parse_sheet_in_worker, type(self), str(path), sheet_name, direction
+                    ))
+                    for sheet_name, direction, key in sheets
+                ]
+                data: Dict[str, Any] = {key: future.result() for key, future in futures}
+        except Exception as e:
+            raise ParserError(f"Failed to parse XLSX: {e}")
+        
+        data['file_path'] = str(path)
+        data['nodes'] = []
+        self.logger.info(
+            f"Parsed {len(data['rx_messages'])} RX messages, "
+            f"{len(data['tx_messages'])} TX messages"
+        )
+        return data
+    
+    def _parse_sheet_file(
+        self,
+        file_path: str,
+        sheet_name: str,
+        direction: MessageDirection
+    ) -> List[Dict[str, Any]]:
+        """
+        Open a workbook read-only and parse one of its sheets.
+        
+        Returns:
+            List of message dicts (empty if the sheet does not exist)
+        """
+        workbook = _openpyxl().load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            if sheet_name not in workbook.sheetnames:
+                return []
+            mapping = RxColumnMapping if direction == MessageDirection.RX else TxColumnMapping
+            return self._parse_sheet_complete(workbook[sheet_name], direction, mapping)
+        finally:
+            workbook.close()
+    
+    def _parse_rx_sheet_complete(self, sheet: 'Worksheet') -> List[Dict[str, Any]]:
         """
         Parse Rx sheet with ALL 44 columns.
         
         Returns list of message dicts with complete signal data.
         """
-        messages = {}
-        current_message_name = None
+        return self._parse_sheet_complete(sheet, MessageDirection.RX, RxColumnMapping)
+    
+    def _parse_tx_sheet_complete(self, sheet: 'Worksheet') -> List[Dict[str, Any]]:
+        """
+        Parse Tx sheet with ALL 43 columns.
         
-        # Iterate from data start row
-        for row_idx in range(self.DATA_START_ROW + 1, sheet.max_row + 1):
-            # Get message name (may be merged cell)
-            msg_name_cell = sheet.cell(row_idx, 1).value
-            if msg_name_cell and str(msg_name_cell).strip():
-                current_message_name = str(msg_name_cell).strip()
-            
-            if not current_message_name:
-                continue
-            
-            # Get signal name
-            signal_name_cell = sheet.cell(row_idx, 3).value
-            if not signal_name_cell or not str(signal_name_cell).strip():
-                continue
-            
-            signal_name = str(signal_name_cell).strip()
-            
-            # Initialize message if not exists
-            if current_message_name not in messages:
-                msg_id_str = self._get_cell_value(sheet, row_idx, 2)
-                messages[current_message_name] = {
-                    'message_name': current_message_name,
-                    'message_id': self._parse_message_id(msg_id_str) if msg_id_str else 0,
-                    'direction': MessageDirection.RX,
-                    'signals': []
-                }
+        Returns list of message dicts with complete signal data.
+        """
+        return self._parse_sheet_complete(sheet, MessageDirection.TX, TxColumnMapping)
+    
+    def _parse_sheet_complete(
+        self,
+        sheet: 'Worksheet',
+        direction: MessageDirection,
+        mapping: type
+    ) -> List[Dict[str, Any]]:
+        """
+        Parse an Rx or Tx sheet into message dicts.
+        
+        Blocks of a message name that appears more than once in the sheet
+        are merged into the first message of that name.
+        
+        Args:
+            sheet: Worksheet (regular or read-only)
+            direction: Direction of all messages in the sheet
+            mapping: RxColumnMapping or TxColumnMapping
             
-            # Parse complete signal data (ALL 44 columns)
-            signal_data = self._parse_rx_signal_complete(sheet, row_idx)
-            messages[current_message_name]['signals'].append(signal_data)
+        Returns:
+            List of message dicts with complete signal data
+        """
+        return self._merge_blocks(self._iter_sheet_complete(sheet, direction, mapping))
+    
+    @staticmethod
+    def _merge_blocks(blocks: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Merge message blocks by name, keeping order of first appearance."""
+        messages: Dict[str, Dict[str, Any]] = {}
+        
+        for block in blocks:
+            existing = messages.get(block['message_name'])
+            if existing is None:
+                messages[block['message_name']] = block
+            else:
+                existing['signals'].extend(block['signals'])
         
         return list(messages.values())
     
-    def _parse_rx_signal_complete(self, sheet: Worksheet, row: int) -> Dict[str, Any]:
-        """Parse RX signal with ALL 44 columns."""
+    def _iter_sheet_complete(
+        self,
+        sheet: 'Worksheet',
+        direction: MessageDirection,
+        mapping: type
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream message blocks from an Rx or Tx sheet in one pass.
         
-        # Helper to get cell value safely
-        def get_val(col_idx: int) -> Optional[str]:
-            val = self._get_cell_value(sheet, row, col_idx + 1)  # +1 for 1-based
-            return val if val and str(val).strip() not in ['-', ''] else None
+        The sub-header row is read first and resolved to a SheetLayout, so
+        sheets with reordered or additional columns are parsed correctly.
+        A message dict is yielded as soon as a row names a different message.
         
-        # Parse using RxColumnMapping
-        data = {
-            # Core fields (required)
-            'signal_name': get_val(RxColumnMapping.SIGNAL_NAME[2]) or '',
-            'signal_size': self._parse_int(get_val(RxColumnMapping.SIGNAL_SIZE[2])) or 1,
-            'direction': MessageDirection.RX,
-            
-            # DBC RX Data section
-            'units': get_val(RxColumnMapping.UNITS[2]),
-            'signal_group': get_val(RxColumnMapping.SIGNAL_GROUP[2]),
-            'has_sna': self._parse_yes_no(get_val(RxColumnMapping.HAS_SNA[2])),
-            'periodicity': self._parse_int(get_val(RxColumnMapping.PERIODICITY[2])),
-            'timeout': self._parse_int(get_val(RxColumnMapping.TIMEOUT[2])),
-            'dbc_comment': get_val(RxColumnMapping.DBC_COMMENT[2]),
-            'notes': get_val(RxColumnMapping.NOTES[2]),
-            
-            # Legacy names (RX-specific)
-            'legacy_rx_srd_name': get_val(RxColumnMapping.LEGACY_RX_SRD_NAME[2]),
-            'legacy_impl_name': get_val(RxColumnMapping.LEGACY_IMPL_NAME[2]),
-            
-            # Teams Responsible section
-            'start_bit': self._parse_int(get_val(RxColumnMapping.START_BIT[2])),
-            'main_function': get_val(RxColumnMapping.MAIN_FUNCTION[2]),
-            'consumer_swc': get_val(RxColumnMapping.CONSUMER_SWC[2]),
-            'status': self._parse_status(get_val(RxColumnMapping.STATUS[2])),
-            
-            # Received CAN Signal Raw Data section (BSW)
-            'data_element_name': get_val(RxColumnMapping.DATA_ELEMENT_NAME[2]),
-            'data_type': get_val(RxColumnMapping.DATA_TYPE[2]),
-            'data_struct_element': get_val(RxColumnMapping.DATA_STRUCT_ELEMENT[2]),
-            'data_constraint': get_val(RxColumnMapping.DATA_CONSTRAINT[2]),
-            'compu_method': get_val(RxColumnMapping.COMPU_METHOD[2]),
-            'invalid_value': get_val(RxColumnMapping.INVALID_VALUE[2]),
-            'type_reference': get_val(RxColumnMapping.TYPE_REFERENCE[2]),
-            'invalidation_policy': self._parse_invalidation_policy(get_val(RxColumnMapping.INVALIDATION_POLICY[2])),
-            'initial_value': get_val(RxColumnMapping.INITIAL_VALUE[2]),
-            'initial_value_const': get_val(RxColumnMapping.INITIAL_VALUE_CONST[2]),
-            'timeout_value': get_val(RxColumnMapping.TIMEOUT_VALUE[2]),
-            'conversion_function': get_val(RxColumnMapping.CONVERSION_FUNCTION[2]),
+        Args:
+            sheet: Worksheet (regular or read-only)
+            direction: Direction of all messages in the sheet
+            mapping: RxColumnMapping or TxColumnMapping
             
-            # Provided CAN Signal Scaled Data section (Application)
-            'long_name': get_val(RxColumnMapping.LONG_NAME[2]),
-            'port_name': get_val(RxColumnMapping.PORT_NAME[2]),
-            'data_type_scaled': get_val(RxColumnMapping.DATA_TYPE_SCALED[2]),
-            'data_struct_element_scaled': get_val(RxColumnMapping.DATA_STRUCT_ELEMENT_SCALED[2]),
-            'struct_element_type_ref': get_val(RxColumnMapping.STRUCT_ELEMENT_TYPE_REF[2]),
-            'mapped_idt': get_val(RxColumnMapping.MAPPED_IDT[2]),
-            'data_constraint_name': get_val(RxColumnMapping.DATA_CONSTRAINT_NAME[2]),
-            'signal_min_value': get_val(RxColumnMapping.SIGNAL_MIN_VALUE[2]),
-            'signal_max_value': get_val(RxColumnMapping.SIGNAL_MAX_VALUE[2]),
-            'compu_method_name': get_val(RxColumnMapping.COMPU_METHOD_NAME[2]),
-            'units_scaled': get_val(RxColumnMapping.UNITS_SCALED[2]),
-            'initial_value_scaled': get_val(RxColumnMapping.INITIAL_VALUE_SCALED[2]),
-            'invalid_value_scaled': get_val(RxColumnMapping.INVALID_VALUE_SCALED[2]),
-            'invalidation_policy_scaled': self._parse_invalidation_policy(get_val(RxColumnMapping.INVALIDATION_POLICY_SCALED[2])),
-            'ddf_unit': get_val(RxColumnMapping.DDF_UNIT[2]),
-        }
+        Yields:
+            Message dicts with complete signal data, one per message block
+        """
+        rows = sheet.iter_rows(min_row=self.SUB_HEADER_ROW + 1, values_only=True)
+        header = next(rows, ())
+        layout = self._get_layout(mapping, header)
         
-        return data
+        # Skip any rows between the sub-header and the first data row
+        rows = islice(rows, self.DATA_START_ROW - self.SUB_HEADER_ROW - 1, None)
+        
+        yield from self._iter_blocks(rows, layout, direction)
     
-    def _parse_tx_sheet_complete(self, sheet: Worksheet) -> List[Dict[str, Any]]:
+    def _iter_blocks(
+        self,
+        rows: Iterable[Tuple[Any, ...]],
+        layout: SheetLayout,
+        direction: MessageDirection
+    ) -> Iterator[Dict[str, Any]]:
         """
-        Parse Tx sheet with ALL 43 columns.
+        Group data rows into message blocks.
         
-        Returns list of message dicts with complete signal data.
+        Args:
+            rows: Data row tuples
+            layout: Compiled sheet layout
+            direction: Direction of all messages in the sheet
+            
+        Yields:
+            Message dicts, one per contiguous message block
         """
-        messages = {}
-        current_message_name = None
+        name_index = layout.message_name_index
+        id_index = layout.message_id_index
+        signal_index = layout.signal_name_index
+        min_width = max(name_index, id_index, signal_index) + 1
+        
+        current: Optional[Dict[str, Any]] = None
+        current_message_name: Optional[str] = None
         
-        for row_idx in range(self.DATA_START_ROW + 1, sheet.max_row + 1):
-            # Get message name
-            msg_name_cell = sheet.cell(row_idx, 1).value
+        for row in rows:
+            if len(row) < min_width:
+                continue
+            
+            # Get message name (may be merged cell)
+            msg_name_cell = row[name_index]
             if msg_name_cell and str(msg_name_cell).strip():
                 current_message_name = str(msg_name_cell).strip()
             
@@ -246,89 +396,190 @@ class CompleteXLSXLoader(BaseLoader[CompleteXLSXDatabase]):
                 continue
             
             # Get signal name
-            signal_name_cell = sheet.cell(row_idx, 3).value
+            signal_name_cell = row[signal_index]
             if not signal_name_cell or not str(signal_name_cell).strip():
                 continue
             
-            signal_name = str(signal_name_cell).strip()
-            
-            # Initialize message
-            if current_message_name not in messages:
-                msg_id_str = self._get_cell_value(sheet, row_idx, 2)
-                messages[current_message_name] = {
+            # Start a new message block
+            if current is None or current['message_name'] != current_message_name:
+                if current is not None:
+                    yield current
+                msg_id_cell = row[id_index]
+                msg_id_str = str(msg_id_cell).strip() if msg_id_cell is not None else None
+                current = {
                     'message_name': current_message_name,
                     'message_id': self._parse_message_id(msg_id_str) if msg_id_str else 0,
-                    'direction': MessageDirection.TX,
+                    'direction': direction,
                     'signals': []
                 }
             
-            # Parse complete signal
-            signal_data = self._parse_tx_signal_complete(sheet, row_idx)
-            messages[current_message_name]['signals'].append(signal_data)
+            # Parse complete signal data (all mapped columns)
+            current['signals'].append(self._parse_signal_row(row, layout, direction))
         
-        return list(messages.values())
+        if current is not None:
+            yield current
     
-    def _parse_tx_signal_complete(self, sheet: Worksheet, row: int) -> Dict[str, Any]:
-        """Parse TX signal with ALL 43 columns."""
+    def iter_messages(self, file_path: str) -> Iterator[CompleteXLSXMessage]:
+        """
+        Incrementally load complete messages from an XLSX file.
+        
+        The workbook is opened read-only and streamed; each
+        CompleteXLSXMessage is converted and yielded as soon as its block of
+        rows ends, Rx sheet first, then Tx. Only the current message is held
+        in memory.
         
-        def get_val(col_idx: int) -> Optional[str]:
-            val = self._get_cell_value(sheet, row, col_idx + 1)
-            return val if val and str(val).strip() not in ['-', ''] else None
+        Unlike load(), a message name that appears in several separate
+        blocks of a sheet is yielded once per block.
         
-        data = {
-            # Core fields
-            'signal_name': get_val(TxColumnMapping.SIGNAL_NAME[2]) or '',
-            'signal_size': self._parse_int(get_val(TxColumnMapping.SIGNAL_SIZE[2])) or 1,
-            'direction': MessageDirection.TX,
+        Args:
+            file_path: Path to XLSX file
             
-            # DBC Tx Data section
-            'signal_group': get_val(TxColumnMapping.SIGNAL_GROUP[2]),
-            'units': get_val(TxColumnMapping.UNITS[2]),
-            'has_sna': self._parse_yes_no(get_val(TxColumnMapping.HAS_SNA[2])),
-            'periodicity': self._parse_int(get_val(TxColumnMapping.PERIODICITY[2])),
-            'dbc_comment': get_val(TxColumnMapping.DBC_COMMENT[2]),
-            'notes': get_val(TxColumnMapping.NOTES[2]),
+        Yields:
+            CompleteXLSXMessage objects in sheet order
             
-            # Teams Responsible section
-            'start_bit': self._parse_int(get_val(TxColumnMapping.START_BIT[2])),
-            'main_function': get_val(TxColumnMapping.MAIN_FUNCTION[2]),
-            'legacy_srd_dd_name': get_val(TxColumnMapping.LEGACY_SRD_DD_NAME[2]),
-            'legacy_tx_accessor_name': get_val(TxColumnMapping.LEGACY_TX_ACCESSOR[2]),
-            'pmbd_phase': get_val(TxColumnMapping.PMBD_PHASE[2]),
-            'pmbd_coe_producer': get_val(TxColumnMapping.PMBD_COE_PRODUCER[2]),
-            'producer_swc': get_val(TxColumnMapping.PRODUCER_SWC[2]),
-            'status': self._parse_status(get_val(TxColumnMapping.STATUS[2])),
+        Raises:
+            FileNotFoundError: If file does not exist
+            ParserError: If the workbook cannot be opened
+            ConversionError: If a message cannot be converted
+        """
+        path = self._validate_file_exists(file_path)
+        self._validate_file_extension(path, ['.xlsx', '.XLSX'])
+        
+        try:
+            self.logger.info(f"Streaming complete XLSX: {path}")
+            workbook = _openpyxl().load_workbook(str(path), read_only=True, data_only=True)
+        except Exception as e:
+            raise ParserError(f"Failed to parse XLSX: {e}") from e
+        
+        sheets = (
+            (self.RX_SHEET_NAME, MessageDirection.RX, RxColumnMapping),
+            (self.TX_SHEET_NAME, MessageDirection.TX, TxColumnMapping),
+        )
+        
+        try:
+            for sheet_name, direction, mapping in sheets:
+                if sheet_name not in workbook.sheetnames:
+                    continue
+                
+                for block in self._iter_sheet_complete(workbook[sheet_name], direction, mapping):
+                    try:
+                        message = self._build_message(block, direction)
+                    except Exception as e:
+                        raise ConversionError(
+                            f"Failed to convert message '{block['message_name']}': {e}"
+                        ) from e
+                    yield message
+        finally:
+            workbook.close()
+    
+    def _get_layout(self, mapping: type, header: Tuple[Any, ...]) -> SheetLayout:
+        """
+        Get the compiled layout for a sub-header row, compiling it on first use.
+        
+        Args:
+            mapping: RxColumnMapping or TxColumnMapping
+            header: Sub-header row values
             
-            # Transmitted Raw Signal Data section (BSW)
-            'data_element_name': get_val(TxColumnMapping.DATA_ELEMENT_NAME[2]),
-            'data_type': get_val(TxColumnMapping.DATA_TYPE[2]),
-            'data_struct_element': get_val(TxColumnMapping.DATA_STRUCT_ELEMENT[2]),
-            'type_reference': get_val(TxColumnMapping.TYPE_REFERENCE[2]),
-            'data_constraint': get_val(TxColumnMapping.DATA_CONSTRAINT[2]),
-            'compu_method': get_val(TxColumnMapping.COMPU_METHOD[2]),
-            'invalid_value': get_val(TxColumnMapping.INVALID_VALUE[2]),
-            'initial_value': get_val(TxColumnMapping.INITIAL_VALUE[2]),
-            'initial_value_const': get_val(TxColumnMapping.INITIAL_VALUE_CONST[2]),
-            'invalidation_policy': self._parse_invalidation_policy(get_val(TxColumnMapping.INVALIDATION_POLICY[2])),
-            'conversion_function': get_val(TxColumnMapping.CONVERSION_FUNCTION[2]),
+        Returns:
+            SheetLayout for this header
+        """
+        fingerprint = tuple(_normalize_title(title) for title in header)
+        key = (type(self), mapping, fingerprint)
+        layout = self._layouts.get(key)
+        if layout is None:
+            layout = self._layouts[key] = self._compile_layout(mapping, fingerprint)
+        return layout
+    
+    def _compile_layout(self, mapping: type, fingerprint: Tuple[str, ...]) -> SheetLayout:
+        """
+        Match a mapping's column titles against a sub-header row.
+        
+        Columns are located by title; the first occurrence wins and extra
+        columns are ignored. If the message name, message ID or signal name
+        column cannot be found, the header is considered unusable and the
+        mapping's fixed column positions are used instead.
+        
+        Args:
+            mapping: RxColumnMapping or TxColumnMapping
+            fingerprint: Normalized sub-header titles
             
-            # Provided CAN Signal Values for TX section (Application)
-            'long_name': get_val(TxColumnMapping.LONG_NAME[2]),
-            'port_name': get_val(TxColumnMapping.PORT_NAME[2]),
-            'data_type_scaled': get_val(TxColumnMapping.DATA_TYPE_SCALED[2]),
-            'data_struct_element_scaled': get_val(TxColumnMapping.DATA_STRUCT_ELEMENT_SCALED[2]),
-            'struct_element_type_ref': get_val(TxColumnMapping.STRUCT_ELEMENT_TYPE_REF[2]),
-            'mapped_idt': get_val(TxColumnMapping.MAPPED_IDT[2]),
-            'data_constraint_scaled': get_val(TxColumnMapping.DATA_CONSTRAINT_SCALED[2]),
-            'signal_min_value': get_val(TxColumnMapping.SIGNAL_MIN_VALUE[2]),
-            'signal_max_value': get_val(TxColumnMapping.SIGNAL_MAX_VALUE[2]),
-            'compu_method_scaled': get_val(TxColumnMapping.COMPU_METHOD_SCALED[2]),
-            'units_scaled': get_val(TxColumnMapping.UNITS_SCALED[2]),
-            'initial_value_scaled': get_val(TxColumnMapping.INITIAL_VALUE_SCALED[2]),
-            'invalid_value_scaled': get_val(TxColumnMapping.INVALID_VALUE_SCALED[2]),
-            'invalidation_policy_scaled': self._parse_invalidation_policy(get_val(TxColumnMapping.INVALIDATION_POLICY_SCALED[2])),
+        Returns:
+            Compiled SheetLayout
+        """
+        positions: Dict[str, int] = {}
+        for index, title in enumerate(fingerprint):
+            if title:
+                positions.setdefault(title, index)
+        
+        columns = mapping.get_columns()
+        resolved = {
+            field: positions.get(_normalize_title(title))
+            for title, field, _ in columns
         }
         
+        required = ('message_name', 'message_id', 'signal_name')
+        if any(resolved[field] is None for field in required):
+            self.logger.warning(
+                f"{mapping.__name__}: sub-header row does not match, "
+                f"using default column positions"
+            )
+            resolved = {field: index for _, field, index in columns}
+        else:
+            missing = [field for field, index in resolved.items() if index is None]
+            if missing:
+                self.logger.warning(
+                    f"{mapping.__name__}: columns not found in sheet: {', '.join(missing)}"
+                )
+        
+        cls = type(self)
+        extractors = []
+        defaults: Dict[str, Any] = {}
+        for _, field, _ in columns:
+            if field in MESSAGE_FIELDS:
+                continue
+            converter_name = self.FIELD_CONVERTERS.get(field)
+            converter = getattr(cls, converter_name) if converter_name else None
+            index = resolved[field]
+            if index is None:
+                defaults[field] = converter(None) if converter else None
+            else:
+                extractors.append((field, index, converter))
+        
+        self.logger.debug(
+            f"Compiled {mapping.__name__} layout with {len(extractors)} columns"
+        )
+        return SheetLayout(
+            message_name_index=resolved['message_name'],
+            message_id_index=resolved['message_id'],
+            signal_name_index=resolved['signal_name'],
+            columns=tuple(extractors),
+            defaults=defaults,
+        )
+    
+    @staticmethod
+    def _parse_signal_row(
+        row: Tuple[Any, ...],
+        layout: SheetLayout,
+        direction: MessageDirection
+    ) -> Dict[str, Any]:
+        """
+        Extract one signal from a row tuple using a compiled layout.
+        
+        Cell values are stripped strings; empty cells and '-' become None
+        before the field's converter (if any) is applied.
+        """
+        width = len(row)
+        data = layout.defaults.copy()
+        
+        for field, index, convert in layout.columns:
+            value = row[index] if index < width else None
+            if value is not None:
+                value = str(value).strip()
+                if not value or value == '-':
+                    value = None
+            data[field] = value if convert is None else convert(value)
+        
+        data['direction'] = direction
         return data
     
     def validate(self, data: Dict[str, Any]) -> bool:
@@ -356,49 +607,49 @@ class CompleteXLSXLoader(BaseLoader[CompleteXLSXDatabase]):
         
         # Convert RX messages
         for msg_data in data.get('rx_messages', []):
-            signals = [CompleteXLSXSignal(**sig_data) for sig_data in msg_data['signals']]
-            
-            # Auto-detect extended frame
-            is_extended = msg_data['message_id'] > 0x7FF
-            
-            message = CompleteXLSXMessage(
-                message_name=msg_data['message_name'],
-                message_id=msg_data['message_id'],
-                is_extended=is_extended,
-                direction=MessageDirection.RX,
-                signals=signals,
-            )
-            messages.append(message)
+            messages.append(self._build_message(msg_data, MessageDirection.RX))
         
         # Convert TX messages
         for msg_data in data.get('tx_messages', []):
-            signals = [CompleteXLSXSignal(**sig_data) for sig_data in msg_data['signals']]
-            
-            is_extended = msg_data['message_id'] > 0x7FF
-            
-            message = CompleteXLSXMessage(
-                message_name=msg_data['message_name'],
-                message_id=msg_data['message_id'],
-                is_extended=is_extended,
-                direction=MessageDirection.TX,
-                signals=signals,
-            )
-            messages.append(message)
+            messages.append(self._build_message(msg_data, MessageDirection.TX))
         
         # Create database
-        database = CompleteXLSXDatabase(
+        database = self._construct(
+            CompleteXLSXDatabase,
             name=Path(data['file_path']).stem,
             messages=messages,
-            nodes=data.get('nodes', []),
+            nodes=list(data.get('nodes', [])),
         )
         
         return database
     
+    def _build_message(
+        self,
+        msg_data: Dict[str, Any],
+        direction: MessageDirection
+    ) -> CompleteXLSXMessage:
+        """Convert one parsed message dict to CompleteXLSXMessage."""
+        build = self._construct
+        signals = [build(CompleteXLSXSignal, **sig_data) for sig_data in msg_data['signals']]
+        
+        # Auto-detect extended frame
+        is_extended = msg_data['message_id'] > 0x7FF
+        
+        return build(
+            CompleteXLSXMessage,
+            message_name=msg_data['message_name'],
+            message_id=msg_data['message_id'],
+            is_extended=is_extended,
+            direction=direction,
+            signals=signals,
+        )
+    
     def load_complete(self, file_path: str) -> CompleteXLSXDatabase:
         """
         Load Excel file and return complete database model.
         
         Convenience method that combines load(), validate(), and to_model().
+        Results are served from the loader cache when available.
         
         Args:
             file_path: Path to Excel file
@@ -411,19 +662,10 @@ class CompleteXLSXLoader(BaseLoader[CompleteXLSXDatabase]):
             >>> db = loader.load_complete('CAN_ECM.xlsx')
             >>> print(db.get_statistics())
         """
-        data = self.load(file_path)
-        self.validate(data)
-        return self.to_model(data)
+        return self.load_and_convert(file_path)
     
     # ==================== Helper Methods ====================
     
-    def _get_cell_value(self, sheet: Worksheet, row: int, col: int) -> Optional[str]:
-        """Get cell value as string, handling None."""
-        cell = sheet.cell(row, col)
-        if cell.value is None:
-            return None
-        return str(cell.value).strip()
-    
     def _parse_message_id(self, id_str: Optional[str]) -> int:
         """Parse message ID from various formats."""
         if not id_str:
@@ -452,7 +694,18 @@ class CompleteXLSXLoader(BaseLoader[CompleteXLSXDatabase]):
             self.logger.warning(f"Could not parse message ID: {id_str}")
             return 0
     
-    def _parse_int(self, value: Optional[str]) -> Optional[int]:
+    @staticmethod
+    def _parse_required_str(value: Optional[str]) -> str:
+        """Parse a required string field, using '' for empty cells."""
+        return value or ''
+    
+    @staticmethod
+    def _parse_signal_size(value: Optional[str]) -> int:
+        """Parse signal size in bits, defaulting to 1."""
+        return CompleteXLSXLoader._parse_int(value) or 1
+    
+    @staticmethod
+    def _parse_int(value: Optional[str]) -> Optional[int]:
         """Parse integer value."""
         if not value:
             return None
@@ -461,14 +714,16 @@ class CompleteXLSXLoader(BaseLoader[CompleteXLSXDatabase]):
         except (ValueError, TypeError):
             return None
     
-    def _parse_yes_no(self, value: Optional[str]) -> bool:
+    @staticmethod
+    def _parse_yes_no(value: Optional[str]) -> bool:
         """Parse Yes/No to boolean."""
         if not value:
             return False
         value = str(value).strip().upper()
         return value in ['YES', 'Y', 'TRUE', '1']
     
-    def _parse_status(self, value: Optional[str]) -> Optional[SignalStatus]:
+    @staticmethod
+    def _parse_status(value: Optional[str]) -> Optional[SignalStatus]:
         """Parse signal status."""
         if not value:
             return None
@@ -483,7 +738,8 @@ class CompleteXLSXLoader(BaseLoader[CompleteXLSXDatabase]):
         
         return status_map.get(value)
     
-    def _parse_invalidation_policy(self, value: Optional[str]) -> Optional[InvalidationPolicy]:
+    @staticmethod
+    def _parse_invalidation_policy(value: Optional[str]) -> Optional[InvalidationPolicy]:
         """Parse invalidation policy."""
         if not value:
             return None
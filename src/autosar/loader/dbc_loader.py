@@ -4,37 +4,79 @@ DBC (CAN Database) file loader.
 Loads and parses DBC files using the cantools library.
 """
 
-from typing import Dict, Any, List, Optional
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Union
 import logging
 from pathlib import Path
 
-try:
-    import cantools
-except ImportError:
-    raise ImportError(
-        "cantools is required for DBC loading. "
-        "Install with: pip install cantools"
-    )
-
-from .base_loader import BaseLoader, ParserError, ValidationError, ConversionError
+from .base_loader import (
+    CachedLoader, ParserError, ValidationError, ConversionError, ValidationMode,
+    import_optional, strip_text,
+)
 from ..model import (
     CANDatabase, CANMessage, CANSignal, CANNode,
-    ValueTable, ValueTableEntry,
+    ValueTable,
+    LazyCANDatabase, LazyMessageList,
     ByteOrder, ValueType, SignalType
 )
+from ..model.base import construct_trusted
+
+if TYPE_CHECKING:
+    import cantools
+
+
+def _cantools():
+    """Import cantools on first use (it dominates the package import time)."""
+    return import_optional('cantools', 'DBC loading')
 
 
-class DBCLoader(BaseLoader[CANDatabase]):
+class DBCLoader(CachedLoader[CANDatabase]):
     """
     Loader for DBC (CAN Database) files.
     
     Uses cantools library to parse DBC format and converts to CANDatabase model.
+    
+    Two conversion paths are available:
+    - Staged: load() -> validate() -> to_model(), going through plain
+      dictionaries
+    - Direct: load_direct() / from_cantools(), building models straight from
+      the cantools objects
+    
+    Either path follows the loader's validation mode. In 'trusted' mode
+    (the default for ``direct=True``) models are built through
+    ``construct_trusted``: cantools has already validated the database, so
+    the models are not re-validated field by field.
+    
+    Example:
+        >>> loader = DBCLoader(direct=True)
+        >>> database = loader.load_and_convert('network.dbc')
     """
     
-    def __init__(self, logger: Optional[logging.Logger] = None):
-        """Initialize DBC loader."""
-        super().__init__(logger)
-        self._db: Optional[cantools.database.can.Database] = None
+    def __init__(
+        self,
+        logger: Optional[logging.Logger] = None,
+        direct: bool = False,
+        validation: Optional[Union[str, ValidationMode]] = None,
+        **cache_options: Any
+    ):
+        """
+        Initialize DBC loader.
+        
+        Args:
+            logger: Optional logger instance
+            direct: If True, load_and_convert() uses the single-pass direct
+                conversion instead of load()/validate()/to_model()
+            validation: 'strict' validates every model; 'trusted' builds them
+                without validation. Defaults to 'trusted' for the direct
+                conversion and 'strict' otherwise.
+            **cache_options: Cache settings passed to CachedLoader
+                (``cache_dir``, ``max_cache_bytes``, ``max_cache_entries``,
+                ``max_cache_weight``)
+        """
+        if validation is None:
+            validation = ValidationMode.TRUSTED if direct else ValidationMode.STRICT
+        super().__init__(logger, validation=validation, **cache_options)
+        self.direct = direct
+        self._db: Optional['cantools.database.can.Database'] = None
     
     def load(self, file_path: str) -> Dict[str, Any]:
         """
@@ -57,7 +99,7 @@ class DBCLoader(BaseLoader[CANDatabase]):
         try:
             # Load DBC using cantools
             self.logger.info(f"Parsing DBC file: {path}")
-            self._db = cantools.database.load_file(str(path))
+            self._db = _cantools().database.load_file(str(path))
             
             # Extract data into dictionary
             data = {
@@ -78,7 +120,7 @@ class DBCLoader(BaseLoader[CANDatabase]):
         except Exception as e:
             raise ParserError(f"Failed to parse DBC file: {e}") from e
     
-    def _extract_message(self, msg: cantools.database.can.Message) -> Dict[str, Any]:
+    def _extract_message(self, msg: 'cantools.database.can.Message') -> Dict[str, Any]:
         """Extract message data from cantools Message object."""
         return {
             'name': msg.name,
@@ -91,8 +133,8 @@ class DBCLoader(BaseLoader[CANDatabase]):
             'signals': [self._extract_signal(sig) for sig in msg.signals],
         }
     
-    def _extract_signal(self, sig: cantools.database.can.Signal) -> Dict[str, Any]:
-        """Extract signal data from cantools Signal object."""
+    def _signal_kinds(self, sig: 'cantools.database.can.Signal'):
+        """Map cantools signal flags to (ByteOrder, ValueType, SignalType)."""
         # Determine byte order
         byte_order = ByteOrder.LITTLE_ENDIAN if sig.byte_order == 'little_endian' else ByteOrder.BIG_ENDIAN
         
@@ -112,6 +154,29 @@ class DBCLoader(BaseLoader[CANDatabase]):
         else:
             signal_type = SignalType.STANDARD
         
+        return byte_order, value_type, signal_type
+    
+    @staticmethod
+    def _multiplex_indicator(sig: 'cantools.database.can.Signal') -> Optional[str]:
+        """
+        Get the DBC multiplexer indicator of a signal.
+        
+        Returns:
+            'M' for the multiplexer, 'm<n>' for a signal multiplexed on value
+            n ('m<n>M' if it is itself a multiplexer), None for plain signals
+            and for signals on several values (extended multiplexing)
+        """
+        ids = sig.multiplexer_ids
+        if ids and len(ids) == 1:
+            return f"m{ids[0]}M" if sig.is_multiplexer else f"m{ids[0]}"
+        if sig.is_multiplexer and not ids:
+            return 'M'
+        return None
+    
+    def _extract_signal(self, sig: 'cantools.database.can.Signal') -> Dict[str, Any]:
+        """Extract signal data from cantools Signal object."""
+        byte_order, value_type, signal_type = self._signal_kinds(sig)
+        
         return {
             'name': sig.name,
             'start_bit': sig.start,
@@ -119,6 +184,7 @@ class DBCLoader(BaseLoader[CANDatabase]):
             'byte_order': byte_order,
             'value_type': value_type,
             'signal_type': signal_type,
+            'multiplex_indicator': self._multiplex_indicator(sig),
             'factor': sig.scale,
             'offset': sig.offset,
             'min_value': sig.minimum,
@@ -130,13 +196,249 @@ class DBCLoader(BaseLoader[CANDatabase]):
             'choices': sig.choices,  # Value table
         }
     
-    def _extract_node(self, node: cantools.database.can.Node) -> Dict[str, Any]:
+    def _extract_node(self, node: 'cantools.database.can.Node') -> Dict[str, Any]:
         """Extract node data from cantools Node object."""
         return {
             'name': node.name,
             'comment': node.comment,
         }
     
+    # ==================== Direct Conversion ====================
+    
+    def _load_model(self, file_path: str) -> CANDatabase:
+        """Use the direct conversion path when enabled."""
+        if self.direct:
+            return self.load_direct(file_path)
+        return super()._load_model(file_path)
+    
+    def load_direct(self, file_path: str) -> CANDatabase:
+        """
+        Load DBC file and convert it to CANDatabase in a single pass.
+        
+        Skips the intermediate dictionary stage of load()/to_model().
+        
+        Args:
+            file_path: Path to DBC file
+            
+        Returns:
+            CANDatabase model object
+            
+        Raises:
+            FileNotFoundError: If file does not exist
+            ParserError: If DBC parsing fails
+            ConversionError: If conversion fails
+        """
+        path = self._validate_file_exists(file_path)
+        self._validate_file_extension(path, ['.dbc', '.DBC'])
+        
+        try:
+            self.logger.info(f"Parsing DBC file: {path}")
+            self._db = _cantools().database.load_file(str(path))
+        except Exception as e:
+            raise ParserError(f"Failed to parse DBC file: {e}") from e
+        
+        return self.from_cantools(self._db, name=path.stem)
+    
+    def from_cantools(
+        self,
+        db: 'cantools.database.can.Database',
+        name: str = 'database'
+    ) -> CANDatabase:
+        """
+        Convert a cantools Database straight to a CANDatabase model.
+        
+        Produces the same content as to_model() on the staged data. In
+        trusted mode the models are built with ``construct_trusted`` (no
+        per-field validation).
+        
+        Args:
+            db: Parsed cantools database
+            name: Database name
+            
+        Returns:
+            CANDatabase model object
+            
+        Raises:
+            ConversionError: If conversion fails
+        """
+        version = getattr(db, 'version', '1.0')
+        try:
+            database = self._construct(
+                CANDatabase,
+                name=name,
+                version='1.0' if version is None else version,
+                messages=[self._build_message(msg) for msg in db.messages],
+                nodes=[self._build_node(node) for node in db.nodes],
+            )
+        except Exception as e:
+            raise ConversionError(f"Failed to convert to model: {e}") from e
+        
+        self.logger.info(
+            f"Converted to CANDatabase: {database.name} "
+            f"({len(database.messages)} messages)"
+        )
+        return database
+    
+    def load_lazy(self, file_path: str) -> LazyCANDatabase:
+        """
+        Load DBC file into a LazyCANDatabase.
+        
+        The cantools database is kept and each CANMessage (with its signals
+        and value tables) is built only when first accessed through
+        get_message_by_id(), get_message_by_name(), indexing or iteration.
+        
+        Args:
+            file_path: Path to DBC file
+            
+        Returns:
+            LazyCANDatabase model object
+            
+        Raises:
+            FileNotFoundError: If file does not exist
+            ParserError: If DBC parsing fails
+            ConversionError: If conversion fails
+        """
+        path = self._validate_file_exists(file_path)
+        self._validate_file_extension(path, ['.dbc', '.DBC'])
+        
+        try:
+            self.logger.info(f"Parsing DBC file: {path}")
+            db = _cantools().database.load_file(str(path))
+        except Exception as e:
+            raise ParserError(f"Failed to parse DBC file: {e}") from e
+        
+        source = db.messages
+        build_message = self._build_message
+        
+        def factory(index: int) -> CANMessage:
+            return build_message(source[index])
+        
+        version = getattr(db, 'version', '1.0')
+        try:
+            database = construct_trusted(
+                LazyCANDatabase,
+                name=path.stem,
+                version='1.0' if version is None else version,
+                messages=LazyMessageList(
+                    [(msg.frame_id, msg.name) for msg in source],
+                    factory,
+                ),
+                nodes=[self._build_node(node) for node in db.nodes],
+            )
+        except Exception as e:
+            raise ConversionError(f"Failed to convert to model: {e}") from e
+        
+        self.logger.info(
+            f"Indexed {len(source)} messages for lazy CANDatabase: {database.name}"
+        )
+        return database
+    
+    def _build_message(self, msg: 'cantools.database.can.Message') -> CANMessage:
+        """Build CANMessage directly from cantools Message object."""
+        comment = strip_text(msg.comment)
+        return self._construct(
+            CANMessage,
+            name=msg.name,
+            short_name=msg.name,
+            message_id=msg.frame_id,
+            is_extended=msg.is_extended_frame,
+            dlc=msg.length,
+            signals=[self._build_signal(sig) for sig in msg.signals],
+            cycle_time=msg.cycle_time,
+            sender=msg.senders[0] if msg.senders else None,
+            comment=comment,
+            description=comment,
+        )
+    
+    def _build_signal(self, sig: 'cantools.database.can.Signal') -> CANSignal:
+        """Build CANSignal directly from cantools Signal object."""
+        byte_order, value_type, signal_type = self._signal_kinds(sig)
+        
+        return self._make_signal(
+            name=sig.name,
+            start_bit=sig.start,
+            length=sig.length,
+            byte_order=byte_order,
+            value_type=value_type,
+            signal_type=signal_type,
+            multiplex_indicator=self._multiplex_indicator(sig),
+            factor=sig.scale,
+            offset=sig.offset,
+            min_value=sig.minimum,
+            max_value=sig.maximum,
+            unit=sig.unit,
+            initial_value=getattr(sig, 'initial_value', None),
+            receivers=sig.receivers,
+            choices=sig.choices,
+            comment=sig.comment,
+        )
+    
+    def _make_signal(
+        self,
+        name: str,
+        start_bit: int,
+        length: int,
+        byte_order: ByteOrder,
+        value_type: ValueType,
+        signal_type: SignalType,
+        multiplex_indicator: Optional[str],
+        factor: float,
+        offset: float,
+        min_value: Any,
+        max_value: Any,
+        unit: Optional[str],
+        initial_value: Any,
+        receivers: Optional[List[str]],
+        choices: Optional[Dict[int, Any]],
+        comment: Optional[str],
+    ) -> CANSignal:
+        """
+        Build CANSignal (and its value table) from cantools-typed values.
+        
+        Values are normalized the way validation would (float scale, stripped
+        strings, copied lists) so both validation modes give the same model.
+        """
+        value_table = None
+        if choices:
+            value_table = self._construct(
+                ValueTable,
+                name=f"{name}_values",
+                # Labels can be NamedSignalValue objects
+                choices={val: str(label).strip() for val, label in choices.items()},
+            )
+        
+        return self._construct(
+            CANSignal,
+            name=name,
+            short_name=name,
+            start_bit=start_bit,
+            length=length,
+            byte_order=byte_order,
+            value_type=value_type,
+            signal_type=signal_type,
+            multiplex_indicator=multiplex_indicator,
+            factor=float(factor),
+            offset=float(offset),
+            min_value=min_value,
+            max_value=max_value,
+            unit=strip_text(unit),
+            initial_value=initial_value,
+            receivers=list(receivers) if receivers else [],
+            value_table=value_table,
+            description=strip_text(comment),
+        )
+    
+    def _build_node(self, node: 'cantools.database.can.Node') -> CANNode:
+        """Build CANNode directly from cantools Node object."""
+        comment = strip_text(node.comment)
+        return self._construct(
+            CANNode,
+            name=node.name,
+            short_name=node.name,
+            comment=comment,
+            description=comment,
+        )
+    
     def validate(self, data: Dict[str, Any]) -> bool:
         """
         Validate parsed DBC data.
@@ -180,37 +482,21 @@ class DBCLoader(BaseLoader[CANDatabase]):
         Raises:
             ConversionError: If conversion fails
         """
+        build = self._construct
         try:
             # Convert messages
             messages = []
             for msg_data in data['messages']:
-                # Convert signals first
-                signals = []
-                for sig_data in msg_data['signals']:
-                    # Handle value table (choices)
-                    value_table = None
-                    if sig_data.get('choices'):
-                        entries = [
-                            ValueTableEntry(
-                                name=f"{sig_data['name']}_entry_{val}",
-                                value=val,
-                                label=str(label)  # Convert to string (can be NamedSignalValue)
-                            )
-                            for val, label in sig_data['choices'].items()
-                        ]
-                        value_table = ValueTable(
-                            name=f"{sig_data['name']}_values",
-                            entries=entries
-                        )
-                    
-                    signal = CANSignal(
+                # Convert signals (with their value tables)
+                signals = [
+                    self._make_signal(
                         name=sig_data['name'],
-                        short_name=sig_data['name'],
                         start_bit=sig_data['start_bit'],
                         length=sig_data['length'],
                         byte_order=sig_data['byte_order'],
                         value_type=sig_data['value_type'],
                         signal_type=sig_data['signal_type'],
+                        multiplex_indicator=sig_data.get('multiplex_indicator'),
                         factor=sig_data['factor'],
                         offset=sig_data['offset'],
                         min_value=sig_data.get('min_value'),
@@ -218,14 +504,17 @@ class DBCLoader(BaseLoader[CANDatabase]):
                         unit=sig_data.get('unit'),
                         initial_value=sig_data.get('initial_value'),
                         receivers=sig_data['receivers'],
-                        value_table=value_table,
-                        description=sig_data.get('comment'),
+                        choices=sig_data.get('choices'),
+                        comment=sig_data.get('comment'),
                     )
-                    signals.append(signal)
+                    for sig_data in msg_data['signals']
+                ]
                 
                 # Create message
                 sender = msg_data['senders'][0] if msg_data['senders'] else None
-                message = CANMessage(
+                comment = strip_text(msg_data.get('comment'))
+                message = build(
+                    CANMessage,
                     name=msg_data['name'],
                     short_name=msg_data['name'],
                     message_id=msg_data['message_id'],
@@ -234,25 +523,28 @@ class DBCLoader(BaseLoader[CANDatabase]):
                     signals=signals,
                     cycle_time=msg_data.get('cycle_time'),
                     sender=sender,
-                    comment=msg_data.get('comment'),
-                    description=msg_data.get('comment'),
+                    comment=comment,
+                    description=comment,
                 )
                 messages.append(message)
             
             # Convert nodes
             nodes = []
             for node_data in data['nodes']:
-                node = CANNode(
+                comment = strip_text(node_data.get('comment'))
+                node = build(
+                    CANNode,
                     name=node_data['name'],
                     short_name=node_data['name'],
-                    comment=node_data.get('comment'),
-                    description=node_data.get('comment'),
+                    comment=comment,
+                    description=comment,
                 )
                 nodes.append(node)
             
             # Create database
             file_name = Path(data['file_path']).stem if 'file_path' in data else 'database'
-            database = CANDatabase(
+            database = build(
+                CANDatabase,
                 name=file_name,
                 version=data['version'],
                 messages=messages,
@@ -0,0 +1,334 @@
+"""
+Persistent on-disk cache for converted loader models.
+
+Entries are content-addressed: the key is derived from the SHA-256 digest of
+the source file, the loader class and the package version, so a cached model
+is reused across processes and invalidated automatically when any of those
+change.
+"""
+
+from typing import Any, Callable, Dict, Iterator, Optional, Set, Tuple
+from contextlib import contextmanager
+from pathlib import Path
+import hashlib
+import json
+import logging
+import os
+import pickle
+import tempfile
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+class DiskCache:
+    """
+    Content-addressed, size-bounded on-disk model cache.
+
+    A small index maps each source path to its last seen (mtime, size,
+    digest) triple. Lookups first compare mtime and size against the index
+    and only re-hash the file when they differ, so a warm lookup costs one
+    ``stat()`` and one unpickle. Index updates are made under a lock file
+    and merged with the index on disk, so several processes can share one
+    cache directory.
+
+    When the total size of stored entries exceeds ``max_bytes``, the least
+    recently used entries are evicted (entry file mtime is refreshed on
+    every hit) together with their index records.
+
+    Example:
+        >>> cache = DiskCache('.ecuc_cache', namespace='DBCLoader:0.1.0')
+        >>> found, model = cache.get(Path('network.dbc'))
+        >>> if not found:
+        ...     model = parse(...)
+        ...     cache.put(Path('network.dbc'), model)
+    """
+
+    DEFAULT_MAX_BYTES = 512 * 1024 * 1024  # 512 MB
+    INDEX_FILE = 'index.json'
+    LOCK_FILE = 'index.lock'
+    ENTRY_SUFFIX = '.pickle'
+    HASH_CHUNK_SIZE = 1024 * 1024
+
+    def __init__(
+        self,
+        cache_dir: str,
+        namespace: str = '',
+        max_bytes: Optional[int] = None,
+        logger: Optional[logging.Logger] = None
+    ):
+        """
+        Initialize disk cache.
+
+        Args:
+            cache_dir: Directory holding cache entries (created if missing)
+            namespace: Key prefix, typically loader class and package version
+            max_bytes: Maximum total size of stored entries (default 512 MB)
+            logger: Optional logger instance
+        """
+        self.cache_dir = Path(cache_dir).expanduser().resolve()
+        self.namespace = namespace
+        self.max_bytes = self.DEFAULT_MAX_BYTES if max_bytes is None else max_bytes
+        self.logger = logger or logging.getLogger(self.__class__.__name__)
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._index: Optional[Dict[str, Dict[str, Any]]] = None
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self.hashes = 0
+
+    # ==================== Public API ====================
+
+    def get(self, file_path: Path) -> Tuple[bool, Any]:
+        """
+        Look up the cached model for a source file.
+
+        Args:
+            file_path: Path to the source file
+
+        Returns:
+            Tuple of (found, model). ``model`` is None when not found.
+        """
+        entry = self._entry_path(self._content_digest(file_path))
+
+        try:
+            with entry.open('rb') as f:
+                value = pickle.load(f)
+        except FileNotFoundError:
+            self.misses += 1
+            return False, None
+        except Exception as e:
+            # Corrupt or incompatible entry - drop it and treat as a miss
+            self.logger.warning(f"Discarding unreadable cache entry {entry.name}: {e}")
+            self._remove(entry)
+            self.misses += 1
+            return False, None
+
+        self.hits += 1
+        self._touch(entry)
+        self.logger.debug(f"Disk cache hit for: {file_path}")
+        return True, value
+
+    def put(self, file_path: Path, value: Any) -> None:
+        """
+        Store the converted model for a source file.
+
+        Args:
+            file_path: Path to the source file
+            value: Picklable model object
+        """
+        entry = self._entry_path(self._content_digest(file_path))
+
+        try:
+            payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            self.logger.warning(f"Model for {file_path} is not cacheable: {e}")
+            return
+
+        if len(payload) > self.max_bytes:
+            self.logger.debug(f"Cache entry for {file_path} exceeds max_bytes, skipping")
+            return
+
+        self._atomic_write(entry, payload)
+        self.stores += 1
+        self.logger.debug(f"Stored disk cache entry for: {file_path}")
+
+        self._evict(keep=entry)
+
+    def clear(self) -> None:
+        """Remove all cache entries and the index."""
+        with self._index_lock():
+            for entry in self.cache_dir.glob(f'*{self.ENTRY_SUFFIX}'):
+                self._remove(entry)
+            self._remove(self.cache_dir / self.INDEX_FILE)
+            self._index = {}
+        self.logger.debug(f"Disk cache cleared: {self.cache_dir}")
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hit/miss/store/eviction counters, the number of
+            files hashed, and the current entry count and total size.
+        """
+        entries = list(self._iter_entries())
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'stores': self.stores,
+            'evictions': self.evictions,
+            'hashes': self.hashes,
+            'entries': len(entries),
+            'size_bytes': sum(size for _, size, _ in entries),
+            'max_bytes': self.max_bytes,
+        }
+
+    # ==================== Key Computation ====================
+
+    def _content_digest(self, file_path: Path) -> str:
+        """Get SHA-256 of file content, re-hashing only on mtime/size change."""
+        path = Path(file_path).resolve()
+        st = path.stat()
+        index = self._load_index()
+        key = str(path)
+
+        record = index.get(key)
+        if record and record['mtime_ns'] == st.st_mtime_ns and record['size'] == st.st_size:
+            return record['digest']
+
+        digest = self._hash_file(path)
+        record = {
+            'mtime_ns': st.st_mtime_ns,
+            'size': st.st_size,
+            'digest': digest,
+        }
+        self._update_index(lambda index: index.__setitem__(key, record))
+        return digest
+
+    def _hash_file(self, path: Path) -> str:
+        """Compute SHA-256 of file content."""
+        self.hashes += 1
+        sha = hashlib.sha256()
+        with path.open('rb') as f:
+            for chunk in iter(lambda: f.read(self.HASH_CHUNK_SIZE), b''):
+                sha.update(chunk)
+        return sha.hexdigest()
+
+    def _entry_path(self, content_digest: str) -> Path:
+        """Get entry file path for a content digest within this namespace."""
+        key = hashlib.sha256(
+            f"{self.namespace}\0{content_digest}".encode('utf-8')
+        ).hexdigest()
+        return self.cache_dir / f"{key}{self.ENTRY_SUFFIX}"
+
+    # ==================== Index ====================
+
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        """Load path index from disk (once per instance)."""
+        if self._index is None:
+            self._index = self._read_index()
+        return self._index
+
+    def _read_index(self) -> Dict[str, Dict[str, Any]]:
+        """Read the path index file (empty if missing or unreadable)."""
+        try:
+            with (self.cache_dir / self.INDEX_FILE).open('r', encoding='utf-8') as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return index if isinstance(index, dict) else {}
+
+    def _update_index(self, update: Callable[[Dict[str, Dict[str, Any]]], None]) -> None:
+        """
+        Apply a change to the index on disk and persist it.
+
+        The index is re-read under the lock so records written by other
+        processes since it was loaded are kept.
+
+        Args:
+            update: Function modifying the index dict in place
+        """
+        with self._index_lock():
+            index = self._read_index()
+            update(index)
+            payload = json.dumps(index, sort_keys=True).encode('utf-8')
+            self._atomic_write(self.cache_dir / self.INDEX_FILE, payload)
+            self._index = index
+
+    @contextmanager
+    def _index_lock(self) -> Iterator[None]:
+        """Hold an exclusive lock on the index across processes."""
+        with open(self.cache_dir / self.LOCK_FILE, 'a+b') as f:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            else:
+                # Retries for about 10 seconds before raising OSError
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+                else:
+                    f.seek(0)
+                    msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+    # ==================== Eviction ====================
+
+    def _iter_entries(self):
+        """Yield (path, size, mtime) for every stored entry."""
+        for entry in self.cache_dir.glob(f'*{self.ENTRY_SUFFIX}'):
+            try:
+                st = entry.stat()
+            except OSError:
+                continue
+            yield entry, st.st_size, st.st_mtime
+
+    def _evict(self, keep: Optional[Path] = None) -> None:
+        """Evict least recently used entries (except ``keep``) until under max_bytes."""
+        entries = list(self._iter_entries())
+        total = sum(size for _, size, _ in entries)
+        if total <= self.max_bytes:
+            return
+
+        # Oldest access first
+        entries.sort(key=lambda item: item[2])
+        evicted: Set[Path] = set()
+        for entry, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            if entry == keep:
+                continue
+            self._remove(entry)
+            evicted.add(entry)
+            total -= size
+            self.evictions += 1
+            self.logger.debug(f"Evicted disk cache entry: {entry.name}")
+
+        if evicted:
+            self._update_index(lambda index: self._prune_index(index, evicted))
+
+    def _prune_index(self, index: Dict[str, Dict[str, Any]], evicted: Set[Path]) -> None:
+        """Drop the index records of evicted entries."""
+        for key, record in list(index.items()):
+            if self._entry_path(record.get('digest', '')) in evicted:
+                del index[key]
+
+    # ==================== File Helpers ====================
+
+    def _atomic_write(self, target: Path, payload: bytes) -> None:
+        """Write file via temp file + rename so readers never see partial data."""
+        fd, tmp_name = tempfile.mkstemp(dir=str(self.cache_dir), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_name, str(target))
+        except BaseException:
+            self._remove(Path(tmp_name))
+            raise
+
+    def _touch(self, entry: Path) -> None:
+        """Refresh entry mtime to mark it as recently used."""
+        try:
+            os.utime(str(entry), None)
+        except OSError:
+            pass
+
+    def _remove(self, path: Path) -> None:
+        """Remove a file, ignoring errors."""
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+
+__all__ = ['DiskCache']
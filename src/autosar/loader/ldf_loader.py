@@ -2,21 +2,156 @@
 LDF (LIN Description File) loader.
 
 Loads and parses LDF files for LIN network configuration.
+
+Parsing is done in a single linear pass: the file is tokenized once
+(comments and string literals handled by the tokenizer), split into
+top-level sections by brace depth, and each section's tokens are fed to a
+small section parser.
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional, Tuple, Union
 import logging
 from pathlib import Path
 import re
 
-from .base_loader import BaseLoader, ParserError, ValidationError, ConversionError
+from .base_loader import (
+    CachedLoader, ParserError, ValidationError, ConversionError, ValidationMode,
+)
 from ..model import (
     LINNetwork, LINFrame, LINSignal, LINNode,
     LINNodeType, FrameType, ScheduleTable, ScheduleEntry
 )
 
 
-class LDFLoader(BaseLoader[LINNetwork]):
+# Whitespace, or one token: punctuation, string literal, or a bare word
+_TOKEN_RE = re.compile(r'\s+|([{};,:=])|("[^"]*"?)|([^\s{};,:="/]+|/)')
+
+
+def _tokenize(content: str) -> List[str]:
+    """
+    Split LDF text into tokens in one pass.
+    
+    Tokens are punctuation characters (``{ } ; , : =``), string literals
+    (with their quotes) and bare words (identifiers, numbers, units).
+    ``/* */`` and ``//`` comments are dropped; an unterminated block
+    comment runs to the end of the file.
+    
+    Args:
+        content: LDF file content
+        
+    Returns:
+        List of tokens
+    """
+    tokens: List[str] = []
+    append = tokens.append
+    match = _TOKEN_RE.match
+    pos = 0
+    end = len(content)
+    
+    while pos < end:
+        if content.startswith('/*', pos):
+            close = content.find('*/', pos + 2)
+            pos = end if close < 0 else close + 2
+            continue
+        if content.startswith('//', pos):
+            newline = content.find('\n', pos + 2)
+            pos = end if newline < 0 else newline + 1
+            continue
+        
+        m = match(content, pos)
+        token = m.group(1) or m.group(2) or m.group(3)
+        if token:
+            append(token)
+        pos = m.end()
+    
+    return tokens
+
+
+def _iter_items(tokens: List[str]) -> Iterator[Tuple[List[str], Optional[List[str]]]]:
+    """
+    Walk a token list at brace depth 0.
+    
+    Yields ``(head, body)`` for every ``head { body }`` block and
+    ``(statement, None)`` for every ``statement ;``. Nested braces inside a
+    body are kept intact.
+    """
+    head: List[str] = []
+    index = 0
+    count = len(tokens)
+    
+    while index < count:
+        token = tokens[index]
+        if token == ';':
+            if head:
+                yield head, None
+            head = []
+        elif token == '{':
+            depth = 1
+            body_start = index + 1
+            while depth and index + 1 < count:
+                index += 1
+                if tokens[index] == '{':
+                    depth += 1
+                elif tokens[index] == '}':
+                    depth -= 1
+            body_end = index if depth == 0 else count
+            yield head, tokens[body_start:body_end]
+            head = []
+        elif token != '}':
+            head.append(token)
+        index += 1
+    
+    if head:
+        yield head, None
+
+
+def _split_statements(tokens: List[str]) -> List[List[str]]:
+    """Split tokens at depth-0 semicolons, keeping nested braces intact."""
+    statements: List[List[str]] = []
+    current: List[str] = []
+    depth = 0
+    
+    for token in tokens:
+        if token == ';' and depth == 0:
+            if current:
+                statements.append(current)
+            current = []
+            continue
+        if token == '{':
+            depth += 1
+        elif token == '}':
+            depth = max(depth - 1, 0)
+        current.append(token)
+    
+    if current:
+        statements.append(current)
+    return statements
+
+
+def _split_commas(tokens: List[str]) -> List[List[str]]:
+    """Split tokens at depth-0 commas."""
+    fields: List[List[str]] = [[]]
+    depth = 0
+    
+    for token in tokens:
+        if token == ',' and depth == 0:
+            fields.append([])
+            continue
+        if token == '{':
+            depth += 1
+        elif token == '}':
+            depth = max(depth - 1, 0)
+        fields[-1].append(token)
+    
+    return fields
+
+
+def _parse_int(token: str) -> int:
+    """Parse a decimal or hexadecimal integer token."""
+    return int(token, 0) if token[:2] in ('0x', '0X') else int(token)
+
+
+class LDFLoader(CachedLoader[LINNetwork]):
     """
     Loader for LDF (LIN Description File) files.
     
@@ -25,9 +160,27 @@ class LDFLoader(BaseLoader[LINNetwork]):
     consider using a dedicated LDF parser library.
     """
     
-    def __init__(self, logger: Optional[logging.Logger] = None):
-        """Initialize LDF loader."""
-        super().__init__(logger)
+    # Encodings tried in order when reading an LDF file
+    ENCODINGS = ('utf-8', 'latin-1')
+    
+    def __init__(
+        self,
+        logger: Optional[logging.Logger] = None,
+        validation: Union[str, ValidationMode] = ValidationMode.STRICT,
+        **cache_options: Any
+    ):
+        """
+        Initialize LDF loader.
+        
+        Args:
+            logger: Optional logger instance
+            validation: 'strict' validates every model; 'trusted' builds them
+                from the parsed data without validation
+            **cache_options: Cache settings passed to CachedLoader
+                (``cache_dir``, ``max_cache_bytes``, ``max_cache_entries``,
+                ``max_cache_weight``)
+        """
+        super().__init__(logger, validation=validation, **cache_options)
         self._content: str = ""
     
     def load(self, file_path: str) -> Dict[str, Any]:
@@ -51,18 +204,10 @@ class LDFLoader(BaseLoader[LINNetwork]):
         try:
             # Read file content
             self.logger.info(f"Parsing LDF file: {path}")
-            with path.open('r', encoding='utf-8') as f:
-                self._content = f.read()
+            self._content = self._read_text(path)
             
-            # Parse LDF sections
-            data = {
-                'file_path': str(path),
-                'header': self._parse_header(),
-                'nodes': self._parse_nodes(),
-                'signals': self._parse_signals(),
-                'frames': self._parse_frames(),
-                'schedule_tables': self._parse_schedule_tables(),
-            }
+            data = self.parse(self._content)
+            data['file_path'] = str(path)
             
             self.logger.info(
                 f"Loaded {len(data['frames'])} frames, "
@@ -75,214 +220,197 @@ class LDFLoader(BaseLoader[LINNetwork]):
         except Exception as e:
             raise ParserError(f"Failed to parse LDF file: {e}") from e
     
-    def _parse_header(self) -> Dict[str, str]:
-        """Parse LDF header section."""
-        header = {}
-        
-        # Parse LIN protocol version
-        match = re.search(r'LIN_protocol_version\s*=\s*"([^"]+)"', self._content)
-        if match:
-            header['protocol_version'] = match.group(1)
-        
-        # Parse language version
-        match = re.search(r'LIN_language_version\s*=\s*"([^"]+)"', self._content)
-        if match:
-            header['language_version'] = match.group(1)
+    def parse(self, content: str) -> Dict[str, Any]:
+        """
+        Parse LDF text in a single pass.
         
-        # Parse speed
-        match = re.search(r'LIN_speed\s*=\s*([\d.]+)\s*kbps', self._content)
-        if match:
-            header['speed'] = float(match.group(1))
+        Args:
+            content: LDF file content
+            
+        Returns:
+            Dictionary with header, nodes, signals, frames and schedule_tables
+        """
+        header_statements: List[List[str]] = []
+        sections: Dict[str, List[str]] = {}
+        
+        for head, body in _iter_items(_tokenize(content)):
+            if body is None:
+                header_statements.append(head)
+            elif head:
+                # First occurrence wins, like the former regex search
+                sections.setdefault(head[0], body)
+        
+        return {
+            'header': self._parse_header(header_statements),
+            'nodes': self._parse_nodes(sections.get('Nodes', [])),
+            'signals': self._parse_signals(sections.get('Signals', [])),
+            'frames': self._parse_frames(sections.get('Frames', [])),
+            'schedule_tables': self._parse_schedule_tables(
+                sections.get('Schedule_tables', [])
+            ),
+        }
+    
+    def _read_text(self, path: Path) -> str:
+        """Read file text, falling back to Latin-1 for non-UTF-8 files."""
+        raw = path.read_bytes()
+        for encoding in self.ENCODINGS[:-1]:
+            try:
+                return raw.decode(encoding)
+            except UnicodeDecodeError:
+                self.logger.debug(f"{path.name} is not valid {encoding}, trying next encoding")
+        return raw.decode(self.ENCODINGS[-1])
+    
+    def _parse_header(self, statements: List[List[str]]) -> Dict[str, Any]:
+        """Parse top-level ``key = value ;`` statements."""
+        header: Dict[str, Any] = {}
+        
+        for statement in statements:
+            if len(statement) < 3 or statement[1] != '=':
+                continue
+            key, value = statement[0], statement[2]
+            
+            if key == 'LIN_protocol_version':
+                header['protocol_version'] = value.strip('"')
+            elif key == 'LIN_language_version':
+                header['language_version'] = value.strip('"')
+            elif key == 'LIN_speed':
+                try:
+                    header['speed'] = float(value)
+                except ValueError:
+                    self.logger.warning(f"Invalid LIN_speed: {value}")
         
         return header
     
-    def _parse_nodes(self) -> List[Dict[str, Any]]:
+    def _parse_nodes(self, tokens: List[str]) -> List[Dict[str, Any]]:
         """Parse nodes section."""
         nodes = []
         
-        # Find Nodes section
-        nodes_match = re.search(
-            r'Nodes\s*\{([^}]+)\}',
-            self._content,
-            re.DOTALL
-        )
-        
-        if not nodes_match:
-            return nodes
-        
-        nodes_content = nodes_match.group(1)
-        
-        # Parse Master
-        master_match = re.search(
-            r'Master:\s*(\w+)',
-            nodes_content
-        )
-        if master_match:
-            nodes.append({
-                'name': master_match.group(1),
-                'type': 'master',
-            })
-        
-        # Parse Slaves
-        slaves_match = re.search(
-            r'Slaves:\s*([^;]+);',
-            nodes_content
-        )
-        if slaves_match:
-            slave_names = slaves_match.group(1).split(',')
-            for name in slave_names:
-                name = name.strip()
-                if name:
-                    nodes.append({
-                        'name': name,
-                        'type': 'slave',
-                    })
+        for statement in _split_statements(tokens):
+            if len(statement) < 3 or statement[1] != ':':
+                continue
+            kind, values = statement[0], statement[2:]
+            
+            if kind == 'Master':
+                # Master: name, time_base ms, jitter ms
+                nodes.append({
+                    'name': values[0],
+                    'type': 'master',
+                })
+            elif kind == 'Slaves':
+                for field in _split_commas(values):
+                    if field:
+                        nodes.append({
+                            'name': field[0],
+                            'type': 'slave',
+                        })
         
         return nodes
     
-    def _parse_signals(self) -> List[Dict[str, Any]]:
+    def _parse_signals(self, tokens: List[str]) -> List[Dict[str, Any]]:
         """Parse signals section."""
         signals = []
         
-        # Find Signals section
-        signals_match = re.search(
-            r'Signals\s*\{([^}]+)\}',
-            self._content,
-            re.DOTALL
-        )
-        
-        if not signals_match:
-            return signals
-        
-        signals_content = signals_match.group(1)
-        
-        # Parse individual signals
         # Format: SignalName: size, init_value, Publisher, Subscriber1, Subscriber2;
-        signal_pattern = r'(\w+):\s*(\d+)\s*,\s*(\d+)\s*,\s*(\w+)(?:\s*,\s*([^;]+))?;'
-        
-        for match in re.finditer(signal_pattern, signals_content):
-            name = match.group(1)
-            size = int(match.group(2))
-            init_value = int(match.group(3))
-            publisher = match.group(4)
-            subscribers_str = match.group(5) if match.group(5) else ""
+        # init_value is a number or a byte array such as {0, 0}
+        for statement in _split_statements(tokens):
+            if len(statement) < 3 or statement[1] != ':':
+                continue
+            fields = _split_commas(statement[2:])
+            if len(fields) < 3 or not fields[0] or not fields[2]:
+                continue
             
-            subscribers = []
-            if subscribers_str:
-                subscribers = [s.strip() for s in subscribers_str.split(',') if s.strip()]
+            try:
+                size = _parse_int(fields[0][0])
+                init_value = self._parse_init_value(fields[1])
+            except (ValueError, IndexError):
+                self.logger.warning(f"Skipping malformed signal: {statement[0]}")
+                continue
             
             signals.append({
-                'name': name,
+                'name': statement[0],
                 'length': size,
                 'initial_value': init_value,
-                'publisher': publisher,
-                'subscribers': subscribers,
+                'publisher': fields[2][0],
+                'subscribers': [field[0] for field in fields[3:] if field],
             })
         
         return signals
     
-    def _parse_frames(self) -> List[Dict[str, Any]]:
+    @staticmethod
+    def _parse_init_value(tokens: List[str]) -> int:
+        """Parse a scalar or byte array initial value (byte 0 first)."""
+        if tokens and tokens[0] == '{':
+            values = [_parse_int(t) for t in tokens if t not in ('{', '}', ',')]
+            return sum((value & 0xFF) << (8 * i) for i, value in enumerate(values))
+        return _parse_int(tokens[0])
+    
+    def _parse_frames(self, tokens: List[str]) -> List[Dict[str, Any]]:
         """Parse frames section."""
         frames = []
         
-        # Find Frames section
-        frames_match = re.search(
-            r'Frames\s*\{(.+?)\n\}',
-            self._content,
-            re.DOTALL
-        )
-        
-        if not frames_match:
-            return frames
-        
-        frames_content = frames_match.group(1)
-        
-        # Parse individual frames - more flexible pattern
         # Format: FrameName: id, Publisher, size { signal1, offset; signal2, offset; }
-        # Split by frame definitions (looking for pattern: word: number)
-        frame_pattern = r'(\w+):\s*(0x[\da-fA-F]+|\d+)\s*,\s*(\w+)\s*,\s*(\d+)\s*\{([^}]+)\}'
-        
-        for match in re.finditer(frame_pattern, frames_content, re.DOTALL):
-            name = match.group(1)
-            frame_id_str = match.group(2).strip()
+        for head, body in _iter_items(tokens):
+            if body is None or len(head) < 3 or head[1] != ':':
+                continue
+            fields = _split_commas(head[2:])
+            if len(fields) < 3 or not all(fields[:3]):
+                continue
             
-            # Parse frame ID (can be decimal or hex)
-            if frame_id_str.startswith('0x') or frame_id_str.startswith('0X'):
-                frame_id = int(frame_id_str, 16)
-            else:
-                frame_id = int(frame_id_str)
+            try:
+                frame_id = _parse_int(fields[0][0])
+                length = _parse_int(fields[2][0])
+            except ValueError:
+                self.logger.warning(f"Skipping malformed frame: {head[0]}")
+                continue
             
-            publisher = match.group(3).strip()
-            length = int(match.group(4).strip())
-            signals_str = match.group(5)
-            
-            # Parse signals in frame
+            # Parse signals in frame: SignalName, offset;
             frame_signals = []
-            # Remove comments and whitespace, split by semicolons
-            signal_lines = [line.strip() for line in signals_str.split(';') if line.strip()]
-            
-            for sig_line in signal_lines:
-                # Parse: SignalName, offset
-                sig_match = re.match(r'(\w+)\s*,\s*(\d+)', sig_line.strip())
-                if sig_match:
+            for statement in _split_statements(body):
+                if len(statement) >= 3 and statement[1] == ',':
+                    try:
+                        offset = _parse_int(statement[2])
+                    except ValueError:
+                        continue
                     frame_signals.append({
-                        'name': sig_match.group(1),
-                        'offset': int(sig_match.group(2)),
+                        'name': statement[0],
+                        'offset': offset,
                     })
             
             frames.append({
-                'name': name,
+                'name': head[0],
                 'frame_id': frame_id,
-                'publisher': publisher,
+                'publisher': fields[1][0],
                 'length': length,
                 'signals': frame_signals,
             })
         
         return frames
     
-    def _parse_schedule_tables(self) -> List[Dict[str, Any]]:
+    def _parse_schedule_tables(self, tokens: List[str]) -> List[Dict[str, Any]]:
         """Parse schedule tables section."""
         schedule_tables = []
         
-        # Find Schedule_tables section
-        schedule_match = re.search(
-            r'Schedule_tables\s*\{(.+)\}',
-            self._content,
-            re.DOTALL
-        )
-        
-        if not schedule_match:
-            return schedule_tables
-        
-        schedule_content = schedule_match.group(1)
-        
-        # Parse individual schedule tables
-        # Format: TableName { frame1 delay ms; frame2 delay ms; }
-        table_pattern = r'(\w+)\s*\{([^}]+)\}'
-        
-        for match in re.finditer(table_pattern, schedule_content):
-            table_name = match.group(1)
-            entries_str = match.group(2)
+        # Format: TableName { frame1 delay 10 ms; AssignNAD { node } delay 10 ms; }
+        for head, body in _iter_items(tokens):
+            if body is None or not head:
+                continue
             
             entries = []
-            position = 0
-            
-            # Parse entries: FrameName delay ms;
-            entry_pattern = r'(\w+)\s+delay\s+([\d.]+)\s*ms'
-            
-            for entry_match in re.finditer(entry_pattern, entries_str):
-                frame_name = entry_match.group(1)
-                delay = float(entry_match.group(2))
+            for statement in _split_statements(body):
+                try:
+                    delay_index = statement.index('delay')
+                    delay = float(statement[delay_index + 1])
+                except (ValueError, IndexError):
+                    continue
                 
                 entries.append({
-                    'frame_name': frame_name,
+                    'frame_name': statement[0],
                     'delay': delay,
-                    'position': position,
+                    'position': len(entries),
                 })
-                position += 1
             
             schedule_tables.append({
-                'name': table_name,
+                'name': head[0],
                 'entries': entries,
             })
         
@@ -336,6 +464,7 @@ class LDFLoader(BaseLoader[LINNetwork]):
         Raises:
             ConversionError: If conversion fails
         """
+        build = self._construct
         try:
             # Parse header info
             header = data.get('header', {})
@@ -346,14 +475,15 @@ class LDFLoader(BaseLoader[LINNetwork]):
             # Convert signals
             signals_by_name = {}
             for sig_data in data['signals']:
-                signal = LINSignal(
+                signal = build(
+                    LINSignal,
                     name=sig_data['name'],
                     short_name=sig_data['name'],
                     start_bit=0,  # Will be set by frame
                     length=sig_data['length'],
                     initial_value=sig_data.get('initial_value'),
                     publisher=sig_data.get('publisher'),
-                    subscribers=sig_data.get('subscribers', []),
+                    subscribers=list(sig_data.get('subscribers', [])),
                 )
                 signals_by_name[sig_data['name']] = signal
             
@@ -367,18 +497,20 @@ class LDFLoader(BaseLoader[LINNetwork]):
                     if sig_name in signals_by_name:
                         # Create a copy with updated start_bit
                         sig = signals_by_name[sig_name]
-                        frame_signal = LINSignal(
+                        frame_signal = build(
+                            LINSignal,
                             name=sig.name,
                             short_name=sig.short_name,
                             start_bit=sig_info['offset'],
                             length=sig.length,
                             initial_value=sig.initial_value,
                             publisher=sig.publisher,
-                            subscribers=sig.subscribers,
+                            subscribers=list(sig.subscribers),
                         )
                         frame_signals.append(frame_signal)
                 
-                frame = LINFrame(
+                frame = build(
+                    LINFrame,
                     name=frame_data['name'],
                     short_name=frame_data['name'],
                     frame_id=frame_data['frame_id'],
@@ -395,7 +527,8 @@ class LDFLoader(BaseLoader[LINNetwork]):
             for node_data in data['nodes']:
                 node_type = LINNodeType.MASTER if node_data['type'] == 'master' else LINNodeType.SLAVE
                 
-                node = LINNode(
+                node = build(
+                    LINNode,
                     name=node_data['name'],
                     short_name=node_data['name'],
                     node_type=node_type,
@@ -412,7 +545,8 @@ class LDFLoader(BaseLoader[LINNetwork]):
             for table_data in data['schedule_tables']:
                 entries = []
                 for entry_data in table_data['entries']:
-                    entry = ScheduleEntry(
+                    entry = build(
+                        ScheduleEntry,
                         name=f"{table_data['name']}_entry_{entry_data['position']}",
                         frame_name=entry_data['frame_name'],
                         delay=entry_data['delay'],
@@ -420,7 +554,8 @@ class LDFLoader(BaseLoader[LINNetwork]):
                     )
                     entries.append(entry)
                 
-                schedule_table = ScheduleTable(
+                schedule_table = build(
+                    ScheduleTable,
                     name=table_data['name'],
                     short_name=table_data['name'],
                     entries=entries,
@@ -429,7 +564,8 @@ class LDFLoader(BaseLoader[LINNetwork]):
             
             # Create network
             file_name = Path(data['file_path']).stem if 'file_path' in data else 'lin_network'
-            network = LINNetwork(
+            network = build(
+                LINNetwork,
                 name=file_name,
                 protocol_version=protocol_version,
                 language_version=language_version,
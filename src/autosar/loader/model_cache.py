@@ -0,0 +1,208 @@
+"""
+Bounded in-process cache for converted loader models.
+
+Provides LRU eviction by entry count and by approximate model size, with
+``functools.lru_cache``-style statistics.
+"""
+
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple
+from collections import OrderedDict
+from pathlib import Path
+import logging
+import threading
+
+
+class CacheInfo(NamedTuple):
+    """Cache statistics, modelled after ``functools.lru_cache``'s CacheInfo."""
+    hits: int
+    misses: int
+    maxsize: Optional[int]
+    currsize: int
+    evictions: int
+    invalidations: int
+    weight: int
+    max_weight: Optional[int]
+
+
+def estimate_model_weight(model: Any) -> int:
+    """
+    Estimate the in-memory size of a loaded model.
+
+    The weight is the number of messages (or LIN frames) plus the number of
+    signals they contain, which dominates the memory footprint of every
+    database model produced by the loaders.
+
+    Args:
+        model: CANDatabase, LINNetwork, XLSXDatabase or CompleteXLSXDatabase
+
+    Returns:
+        Approximate weight (at least 1)
+    """
+    containers = getattr(model, 'messages', None)
+    if containers is None:
+        containers = getattr(model, 'frames', None)
+    if not containers:
+        return 1
+
+    weight = len(containers)
+    for item in containers:
+        weight += len(getattr(item, 'signals', ()))
+    return max(weight, 1)
+
+
+class ModelCache:
+    """
+    LRU cache of loaded models keyed by resolved file path.
+
+    Entries remember the source file's mtime and size; a lookup whose file
+    has changed on disk is treated as a miss and the stale entry is dropped.
+    The cache is bounded both by entry count (``maxsize``) and by the sum of
+    entry weights (``max_weight``); either bound may be None (unbounded).
+
+    Example:
+        >>> cache = ModelCache(maxsize=32, max_weight=200_000)
+        >>> model = cache.get(path)
+        >>> if model is None:
+        ...     model = loader.load_and_convert(path)
+        ...     cache.put(path, model)
+        >>> cache.cache_info()
+        CacheInfo(hits=0, misses=1, maxsize=32, currsize=1, ...)
+    """
+
+    def __init__(
+        self,
+        maxsize: Optional[int] = 128,
+        max_weight: Optional[int] = None,
+        weigher: Callable[[Any], int] = estimate_model_weight,
+        logger: Optional[logging.Logger] = None
+    ):
+        """
+        Initialize model cache.
+
+        Args:
+            maxsize: Maximum number of entries (None = unbounded)
+            max_weight: Maximum total weight of entries (None = unbounded)
+            weigher: Function estimating the weight of a model
+            logger: Optional logger instance
+        """
+        self.maxsize = maxsize
+        self.max_weight = max_weight
+        self._weigher = weigher
+        self.logger = logger or logging.getLogger(self.__class__.__name__)
+
+        # key -> (model, (mtime_ns, size), weight)
+        self._entries: 'OrderedDict[str, Tuple[Any, Tuple[int, int], int]]' = OrderedDict()
+        self._weight = 0
+        self._lock = threading.RLock()
+
+        # Statistics
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get cached model for a resolved file path.
+
+        Args:
+            key: Resolved file path
+
+        Returns:
+            Cached model, or None on miss or if the file changed
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            model, signature, _ = entry
+            if self._file_signature(key) != signature:
+                self._discard(key)
+                self._invalidations += 1
+                self._misses += 1
+                self.logger.debug(f"Invalidated stale cache entry: {key}")
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return model
+
+    def put(self, key: str, model: Any) -> None:
+        """
+        Store a model, evicting least recently used entries if needed.
+
+        Args:
+            key: Resolved file path
+            model: Loaded model
+        """
+        signature = self._file_signature(key)
+        weight = self._weigher(model)
+
+        with self._lock:
+            if key in self._entries:
+                self._discard(key)
+
+            if self.max_weight is not None and weight > self.max_weight:
+                self.logger.debug(f"Model for {key} exceeds max_weight, not cached")
+                return
+
+            self._entries[key] = (model, signature, weight)
+            self._weight += weight
+            self._evict()
+
+    def clear(self) -> None:
+        """Remove all entries and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._weight = 0
+            self._hits = self._misses = self._evictions = self._invalidations = 0
+
+    def cache_info(self) -> CacheInfo:
+        """Report cache statistics."""
+        with self._lock:
+            return CacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                maxsize=self.maxsize,
+                currsize=len(self._entries),
+                evictions=self._evictions,
+                invalidations=self._invalidations,
+                weight=self._weight,
+                max_weight=self.max_weight,
+            )
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until both bounds hold."""
+        while self._entries and (
+            (self.maxsize is not None and len(self._entries) > self.maxsize)
+            or (self.max_weight is not None and self._weight > self.max_weight)
+        ):
+            key, (_, _, weight) = self._entries.popitem(last=False)
+            self._weight -= weight
+            self._evictions += 1
+            self.logger.debug(f"Evicted cache entry: {key}")
+
+    def _discard(self, key: str) -> None:
+        """Remove a single entry."""
+        _, _, weight = self._entries.pop(key)
+        self._weight -= weight
+
+    @staticmethod
+    def _file_signature(key: str) -> Tuple[int, int]:
+        """Get (mtime_ns, size) of a file, or (-1, -1) if it is missing."""
+        try:
+            st = Path(key).stat()
+        except OSError:
+            return (-1, -1)
+        return (st.st_mtime_ns, st.st_size)
+
+
+__all__ = ['CacheInfo', 'ModelCache', 'estimate_model_weight']
@@ -0,0 +1,341 @@
+"""
+Loader registry: pick the loader for a file by extension or content.
+
+Maps file formats to loader classes without importing them: built-in
+loaders are referenced as ``'module:Class'`` strings and imported, then
+instantiated, only when their format is first used. Third-party formats
+register through the ``ecuc_configurator.loaders`` entry point group.
+"""
+
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple, Type, Union
+from pathlib import Path
+import importlib
+import logging
+import re
+import threading
+
+from .base_loader import BaseLoader, UnsupportedFormatError
+
+# Loader class, or 'package.module:ClassName' imported on first use
+LoaderRef = Union[str, Type[BaseLoader]]
+
+# Content sniffer: receives the first bytes of a file
+Sniffer = Callable[[bytes], bool]
+
+
+class LoaderSpec(NamedTuple):
+    """A file format known to a LoaderRegistry."""
+    name: str
+    loader: LoaderRef
+    extensions: Tuple[str, ...] = ()
+    network_type: Optional[str] = None
+    sniff: Optional[Sniffer] = None
+
+
+_DBC_KEYWORD_RE = re.compile(rb'^\s*(VERSION|NS_|BU_|BO_|BS_)\b', re.MULTILINE)
+
+
+def sniff_dbc(head: bytes) -> bool:
+    """Detect DBC content by its section keywords."""
+    return _DBC_KEYWORD_RE.search(head) is not None
+
+
+def sniff_ldf(head: bytes) -> bool:
+    """Detect LDF content by its mandatory header statement."""
+    return b'LIN_description_file' in head
+
+
+def sniff_xlsx(head: bytes) -> bool:
+    """Detect an Office Open XML workbook (a ZIP archive)."""
+    return head.startswith(b'PK\x03\x04')
+
+
+BUILTIN_LOADERS = (
+    LoaderSpec('dbc', 'autosar.loader.dbc_loader:DBCLoader', ('.dbc',), 'CAN', sniff_dbc),
+    LoaderSpec('ldf', 'autosar.loader.ldf_loader:LDFLoader', ('.ldf',), 'LIN', sniff_ldf),
+    LoaderSpec('xlsx', 'autosar.loader.xlsx_loader:XLSXLoader', ('.xlsx',), 'CAN', sniff_xlsx),
+    # Same files as 'xlsx' but a different model; only selected by name
+    LoaderSpec('xlsx-complete', 'autosar.loader.complete_xlsx_loader:CompleteXLSXLoader'),
+)
+
+
+def resolve_loader_class(loader: LoaderRef) -> Type[BaseLoader]:
+    """
+    Import a loader class referenced as ``'module:Class'``.
+
+    Args:
+        loader: Loader class or import reference
+
+    Returns:
+        Loader class
+    """
+    if not isinstance(loader, str):
+        return loader
+    module_name, _, attr = loader.partition(':')
+    return getattr(importlib.import_module(module_name), attr)
+
+
+class LoaderRegistry:
+    """
+    Registry of file formats and their loaders.
+
+    A file is matched by extension first. If no format claims the
+    extension, or several do, the first ``SNIFF_BYTES`` of the file are
+    offered to the candidates' sniffers in registration order.
+
+    Loader classes are imported and instantiated once per format, on first
+    use, and the instances are reused so their caches stay warm.
+
+    Plugins are distributions exposing an entry point in the
+    ``ecuc_configurator.loaders`` group that resolves to either a
+    LoaderSpec or a BaseLoader subclass declaring ``EXTENSIONS`` (and
+    optionally ``NETWORK_TYPE`` and a static ``sniff(head)``):
+
+        [project.entry-points."ecuc_configurator.loaders"]
+        arxml = "my_package.arxml_loader:ARXMLLoader"
+
+    Example:
+        >>> registry = LoaderRegistry()
+        >>> network = registry.load('network.dbc')
+        >>> registry.spec_for('body.ldf').network_type
+        'LIN'
+    """
+
+    ENTRY_POINT_GROUP = 'ecuc_configurator.loaders'
+    SNIFF_BYTES = 8192
+
+    def __init__(
+        self,
+        loader_kwargs: Optional[Dict[str, Any]] = None,
+        discover_plugins: bool = True,
+        logger: Optional[logging.Logger] = None
+    ):
+        """
+        Initialize registry with the built-in formats.
+
+        Args:
+            loader_kwargs: Keyword arguments for every loader instantiated
+                by the registry (e.g., ``{'logger': logger}``)
+            discover_plugins: If True, register entry point plugins on first
+                lookup
+            logger: Optional logger instance
+        """
+        self.loader_kwargs = dict(loader_kwargs or {})
+        self.logger = logger or logging.getLogger(self.__class__.__name__)
+
+        self._specs: Dict[str, LoaderSpec] = {}
+        self._loaders: Dict[str, BaseLoader] = {}
+        self._plugins_pending = discover_plugins
+        self._lock = threading.RLock()
+
+        for spec in BUILTIN_LOADERS:
+            self.register(spec)
+
+    # ==================== Registration ====================
+
+    def register(self, spec: LoaderSpec, replace: bool = False) -> None:
+        """
+        Register a file format.
+
+        Args:
+            spec: Format description
+            replace: If True, replace an existing format with the same name
+
+        Raises:
+            ValueError: If the name is taken and ``replace`` is False
+        """
+        with self._lock:
+            if spec.name in self._specs and not replace:
+                raise ValueError(f"Loader format already registered: {spec.name}")
+            self._specs[spec.name] = spec._replace(
+                extensions=tuple(ext.lower() for ext in spec.extensions)
+            )
+            self._loaders.pop(spec.name, None)
+
+    def unregister(self, name: str) -> None:
+        """Remove a file format (no-op if unknown)."""
+        with self._lock:
+            self._specs.pop(name, None)
+            self._loaders.pop(name, None)
+
+    def formats(self) -> List[LoaderSpec]:
+        """Get all registered formats, in registration order."""
+        self._discover_plugins()
+        return list(self._specs.values())
+
+    @property
+    def extensions(self) -> Tuple[str, ...]:
+        """All extensions claimed by a registered format."""
+        return tuple(dict.fromkeys(
+            ext for spec in self.formats() for ext in spec.extensions
+        ))
+
+    # ==================== Lookup ====================
+
+    def spec(self, name: str) -> LoaderSpec:
+        """
+        Get a format by name.
+
+        Raises:
+            UnsupportedFormatError: If the format is not registered
+        """
+        self._discover_plugins()
+        try:
+            return self._specs[name]
+        except KeyError:
+            raise UnsupportedFormatError(f"Unknown loader format: {name}") from None
+
+    def spec_for(self, file_path: Union[str, Path]) -> LoaderSpec:
+        """
+        Get the format of a file, by extension or content.
+
+        Args:
+            file_path: Path to file
+
+        Returns:
+            Matching format
+
+        Raises:
+            UnsupportedFormatError: If no registered format matches
+        """
+        path = Path(file_path)
+        suffix = path.suffix.lower()
+        formats = self.formats()
+
+        candidates = [spec for spec in formats if suffix and suffix in spec.extensions]
+        if len(candidates) == 1:
+            return candidates[0]
+
+        sniffable = [spec for spec in (candidates or formats) if spec.sniff is not None]
+        if sniffable:
+            head = self._read_head(path)
+            for spec in sniffable:
+                if head and spec.sniff(head):
+                    return spec
+
+        if candidates:
+            return candidates[0]
+        raise UnsupportedFormatError(f"Unsupported file type: {path.suffix or path.name}")
+
+    def loader(self, name: str) -> BaseLoader:
+        """
+        Get the loader instance of a format, creating it on first use.
+
+        Args:
+            name: Format name (e.g., 'dbc')
+
+        Returns:
+            Shared loader instance
+        """
+        with self._lock:
+            loader = self._loaders.get(name)
+            if loader is None:
+                spec = self.spec(name)
+                loader_cls = resolve_loader_class(spec.loader)
+                loader = self._loaders[name] = loader_cls(**self.loader_kwargs)
+                self.logger.debug(f"Created {loader_cls.__name__} for format '{name}'")
+            return loader
+
+    def loader_for(self, file_path: Union[str, Path]) -> BaseLoader:
+        """Get the loader instance for a file."""
+        return self.loader(self.spec_for(file_path).name)
+
+    def load(self, file_path: Union[str, Path]) -> Any:
+        """
+        Load a file with the loader matching its format.
+
+        Args:
+            file_path: Path to file
+
+        Returns:
+            Model produced by the loader
+
+        Raises:
+            UnsupportedFormatError: If no registered format matches
+            LoaderException: If loading fails
+        """
+        return self.loader_for(file_path).load_and_convert(str(file_path))
+
+    def find_files(self, directory: Union[str, Path], recursive: bool = True) -> List[Path]:
+        """
+        List files in a directory with a registered extension.
+
+        Args:
+            directory: Directory to scan
+            recursive: If True, include subdirectories
+
+        Returns:
+            Matching files, sorted by path
+        """
+        extensions = set(self.extensions)
+        pattern = '**/*' if recursive else '*'
+        return sorted(
+            path for path in Path(directory).glob(pattern)
+            if path.suffix.lower() in extensions and path.is_file()
+        )
+
+    def loaded_formats(self) -> List[str]:
+        """Names of formats whose loader has been instantiated."""
+        return list(self._loaders)
+
+    def clear_caches(self) -> None:
+        """Clear the caches of all instantiated loaders."""
+        for loader in list(self._loaders.values()):
+            if hasattr(loader, 'clear_cache'):
+                loader.clear_cache()
+
+    # ==================== Internals ====================
+
+    def _read_head(self, path: Path) -> bytes:
+        """Read the first SNIFF_BYTES of a file (empty if unreadable)."""
+        try:
+            with path.open('rb') as f:
+                return f.read(self.SNIFF_BYTES)
+        except OSError:
+            return b''
+
+    def _discover_plugins(self) -> None:
+        """Register entry point plugins (once)."""
+        if not self._plugins_pending:
+            return
+        with self._lock:
+            if not self._plugins_pending:
+                return
+            self._plugins_pending = False
+            for entry_point in _iter_entry_points(self.ENTRY_POINT_GROUP):
+                try:
+                    spec = _plugin_spec(entry_point.name, entry_point.load())
+                    self.register(spec)
+                except Exception as e:
+                    self.logger.warning(f"Skipping loader plugin '{entry_point.name}': {e}")
+                else:
+                    self.logger.debug(f"Registered loader plugin '{spec.name}'")
+
+
+def _iter_entry_points(group: str) -> Iterator[Any]:
+    """Yield installed entry points of a group (Python 3.8+ compatible)."""
+    from importlib import metadata
+
+    entry_points = metadata.entry_points()
+    if hasattr(entry_points, 'select'):
+        yield from entry_points.select(group=group)
+    else:
+        yield from entry_points.get(group, ())
+
+
+def _plugin_spec(name: str, obj: Any) -> LoaderSpec:
+    """Build the LoaderSpec of an entry point object."""
+    if isinstance(obj, LoaderSpec):
+        return obj
+    if isinstance(obj, type) and issubclass(obj, BaseLoader):
+        return LoaderSpec(
+            name=name,
+            loader=obj,
+            extensions=tuple(getattr(obj, 'EXTENSIONS', ())),
+            network_type=getattr(obj, 'NETWORK_TYPE', None),
+            sniff=getattr(obj, 'sniff', None),
+        )
+    raise TypeError(f"expected a LoaderSpec or BaseLoader subclass, got {obj!r}")
+
+
+__all__ = ['LoaderRegistry', 'LoaderSpec', 'resolve_loader_class']
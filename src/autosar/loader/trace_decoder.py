@@ -0,0 +1,442 @@
+"""
+Streaming decoder for text CAN trace logs (candump and Vector ASC).
+
+Logs are read lazily in fixed-size chunks, so multi-GB traces decode in
+constant memory. The frames of each chunk are dispatched to their
+CANMessage through a frame-ID hash map built once from the database,
+batched per message and decoded with the message's vectorized codec
+(``CANMessage.decode_batch``). Results come out as per-message column
+blocks (fast) or as per-frame records in log order.
+
+Supported line formats:
+
+    candump -l:  (1436509052.249713) can0 123#11223344
+                 (1436509052.249713) can0 18DAF110##1112233...   (CAN FD)
+                 (1436509052.249713) can0 123#11223344 R        (-x direction)
+    Vector ASC:  0.004000 1  123x  Rx   d 8 00 01 02 03 04 05 06 07 ...
+                 0.004000 CANFD 1 Rx 123 Name 1 0 d 64 00 01 ...
+
+Remote, error and event lines are skipped. Requires numpy.
+"""
+
+from typing import (
+    TYPE_CHECKING, Callable, Dict, Iterator, List, NamedTuple, Optional, Set, Tuple, Union,
+)
+from enum import Enum
+from itertools import repeat
+from pathlib import Path
+import re
+
+from ..model.signal_table import _mux_value, _numpy
+
+if TYPE_CHECKING:
+    import numpy as np
+    from ..model.can_model import CANDatabase, CANMessage
+    from ..model.signal_codec import DecodedBatch
+
+
+class TraceFormat(str, Enum):
+    """Text CAN log formats."""
+    CANDUMP = "candump"  # Linux can-utils ``candump -l`` log files
+    ASC = "asc"          # Vector ASCII logging format
+
+
+class TraceFrame(NamedTuple):
+    """One CAN frame of a trace log."""
+    timestamp: float
+    channel: str
+    frame_id: int
+    is_extended: bool
+    data: bytes
+
+
+class TraceBlock(NamedTuple):
+    """
+    Decoded frames of one message from one chunk of the log.
+
+    Every signal is decoded for every frame: the column of a multiplexed
+    signal is only meaningful in the rows where the multiplexer's raw value
+    equals the signal's multiplexer value.
+    """
+    message: 'CANMessage'
+    timestamps: 'np.ndarray'    # float64, in log order
+    channels: 'np.ndarray'      # object array of channel names
+    signals: 'DecodedBatch'     # raw and physical column per signal
+
+
+class TraceRecord(NamedTuple):
+    """One decoded frame: physical values of the signals present in it, by name."""
+    timestamp: float
+    channel: str
+    message: str
+    signals: Dict[str, float]
+
+
+# (timestamp, channel, id, hex data); 3-digit IDs are standard, 8-digit extended.
+# Trailing fields after the data (e.g. the R/T direction of ``candump -x``)
+# are ignored.
+_CANDUMP_RE = re.compile(
+    r'^\((\d+\.\d+)\)[ \t]+(\S+)[ \t]+([0-9A-Fa-f]{3}|[0-9A-Fa-f]{8})'
+    r'#(?:#[0-9A-Fa-f])?([0-9A-Fa-f]*)(?:[ \t]+[^ \t\r\n]+)*[ \t\r]*$',
+    re.MULTILINE,
+)
+
+# (timestamp, FD channel, FD id, FD length, channel, id, dlc, data)
+_ASC_RE = re.compile(
+    r'^[ \t]*(\d+\.\d+)[ \t]+(?:'
+    r'CANFD[ \t]+(\d+)[ \t]+[RT]x[ \t]+([0-9A-Fa-f]+x?)[ \t]+(?:[A-Za-z_]\S*[ \t]+)?'
+    r'[01][ \t]+[01][ \t]+[0-9A-Fa-f][ \t]+(\d+)'
+    r'|(\d+)[ \t]+([0-9A-Fa-f]+x?)[ \t]+[RT]x[ \t]+d[ \t]+([0-9A-Fa-f])'
+    r')((?:[ \t]+[0-9A-Fa-f]{2}(?![^ \t\r\n]))*)',
+    re.MULTILINE,
+)
+
+_ASC_BASE_RE = re.compile(rb'^\s*base\s+(hex|dec)\b', re.MULTILINE)
+_CANDUMP_HEAD_RE = re.compile(rb'^\(\d+\.\d+\)\s', re.MULTILINE)
+
+# Parsed frame: (timestamp text, channel, ID text, payload as hex text or bytes).
+# Conversions are deferred so they run once per message batch.
+_Frame = Tuple[str, str, str, Union[str, bytes]]
+
+
+class _LogSyntax(NamedTuple):
+    """Line parser and ID decoding of one log format."""
+    parse: Callable[[str], List[_Frame]]
+    frame_id: Callable[[str], Tuple[int, bool]]
+
+
+class TraceDecoder:
+    """
+    Decode candump/ASC logs against a CANDatabase.
+
+    The frame-ID map is built from the database when the decoder is
+    created; create a new decoder after editing the database's messages.
+    Frames whose ID is not in the database are counted in
+    ``unknown_frames`` and skipped.
+
+    Example:
+        >>> decoder = TraceDecoder(can_db)
+        >>> for block in decoder.iter_blocks('drive.log'):
+        ...     speed = block.signals.physical.get('VehicleSpeed')
+        >>> for record in decoder.iter_records('drive.asc'):
+        ...     print(record.timestamp, record.message, record.signals)
+    """
+
+    DEFAULT_CHUNK_SIZE = 8 * 1024 * 1024  # 8 MB of log text per batch
+    SNIFF_BYTES = 4096
+
+    def __init__(self, database: 'CANDatabase', chunk_size: Optional[int] = None):
+        """
+        Initialize decoder.
+
+        Args:
+            database: CAN database describing the logged messages
+            chunk_size: Bytes of log read (and decoded) at a time
+        """
+        self.database = database
+        self.chunk_size = chunk_size or self.DEFAULT_CHUNK_SIZE
+        self.frames = 0
+        self.unknown_frames = 0
+
+        # (frame ID, extended) -> message; a message registered with the
+        # wrong frame format still matches its bare ID
+        self._frame_map: Dict[Tuple[int, bool], 'CANMessage'] = {}
+        for message in database.messages:
+            key = (message.message_id, message.is_extended)
+            self._frame_map.setdefault(key, message)
+        for (frame_id, is_extended), message in list(self._frame_map.items()):
+            self._frame_map.setdefault((frame_id, not is_extended), message)
+
+    # ==================== Public API ====================
+
+    @classmethod
+    def detect_format(cls, file_path: Union[str, Path]) -> TraceFormat:
+        """
+        Detect the format of a log by extension, then by content.
+
+        Raises:
+            ValueError: If the file is neither a candump nor an ASC log
+        """
+        path = Path(file_path)
+        suffix = path.suffix.lower()
+        if suffix == '.asc':
+            return TraceFormat.ASC
+        with path.open('rb') as f:
+            head = f.read(cls.SNIFF_BYTES)
+        if _CANDUMP_HEAD_RE.search(head):
+            return TraceFormat.CANDUMP
+        if _ASC_BASE_RE.search(head) or head.lstrip().startswith(b'date '):
+            return TraceFormat.ASC
+        if suffix == '.log':
+            return TraceFormat.CANDUMP
+        raise ValueError(f"Unrecognized CAN log format: {path}")
+
+    def iter_frames(
+        self,
+        file_path: Union[str, Path],
+        trace_format: Optional[Union[TraceFormat, str]] = None
+    ) -> Iterator[TraceFrame]:
+        """
+        Iterate over the raw frames of a log, in log order.
+
+        Args:
+            file_path: candump or ASC log
+            trace_format: Log format (default: detect_format())
+        """
+        syntax = self._syntax(file_path, trace_format)
+        frame_ids: Dict[str, Tuple[int, bool]] = {}
+        for frames in self._iter_chunks(file_path, syntax):
+            for timestamp, channel, key, data in frames:
+                frame_id = frame_ids.get(key)
+                if frame_id is None:
+                    frame_id = frame_ids[key] = syntax.frame_id(key)
+                if isinstance(data, str):
+                    data = bytes.fromhex(data)
+                yield TraceFrame(float(timestamp), channel, frame_id[0], frame_id[1], data)
+
+    def iter_blocks(
+        self,
+        file_path: Union[str, Path],
+        trace_format: Optional[Union[TraceFormat, str]] = None
+    ) -> Iterator[TraceBlock]:
+        """
+        Iterate over decoded per-message column blocks.
+
+        Each chunk of the log yields one block per message seen in it, so
+        blocks of different messages are not interleaved in time; use the
+        block timestamps to merge them.
+
+        Args:
+            file_path: candump or ASC log
+            trace_format: Log format (default: detect_format())
+        """
+        syntax = self._syntax(file_path, trace_format)
+        messages: Dict[str, Optional['CANMessage']] = {}
+        for frames in self._iter_chunks(file_path, syntax):
+            for message, _, batch in self._batch(frames, syntax, messages).values():
+                yield self._decode(message, batch)
+
+    def iter_records(
+        self,
+        file_path: Union[str, Path],
+        trace_format: Optional[Union[TraceFormat, str]] = None
+    ) -> Iterator[TraceRecord]:
+        """
+        Iterate over decoded frames, in log order.
+
+        Frames are still decoded per message in batches; the records of a
+        chunk are put back in log order before they are yielded. A record
+        leaves out the multiplexed signals whose multiplexer value is not
+        the one in its frame (messages with nested multiplexers keep every
+        signal).
+
+        Args:
+            file_path: candump or ASC log
+            trace_format: Log format (default: detect_format())
+        """
+        syntax = self._syntax(file_path, trace_format)
+        messages: Dict[str, Optional['CANMessage']] = {}
+        multiplexing: Dict[str, Optional[Tuple[str, Dict[str, int]]]] = {}
+        for frames in self._iter_chunks(file_path, syntax):
+            ordered: List[Optional[TraceRecord]] = [None] * len(frames)
+            for message, rows, batch in self._batch(frames, syntax, messages).values():
+                block = self._decode(message, batch)
+                physical = block.signals.physical
+                names = list(physical)
+                values = zip(*[physical[name].tolist() for name in names]) if names else repeat(())
+                if message.name not in multiplexing:
+                    multiplexing[message.name] = _multiplexing(message)
+                if multiplexing[message.name] is None:
+                    rows_signals = (dict(zip(names, row_values)) for row_values in values)
+                else:
+                    rows_signals = _multiplexed_signals(
+                        names, values, block.signals, *multiplexing[message.name]
+                    )
+                for row, timestamp, channel, signals in zip(
+                    rows, block.timestamps.tolist(), block.channels, rows_signals
+                ):
+                    ordered[row] = TraceRecord(timestamp, channel, message.name, signals)
+            for record in ordered:
+                if record is not None:
+                    yield record
+
+    # ==================== Internals ====================
+
+    def _syntax(
+        self,
+        file_path: Union[str, Path],
+        trace_format: Optional[Union[TraceFormat, str]]
+    ) -> _LogSyntax:
+        """Get the parser of a log's format (and ID base, for ASC)."""
+        trace_format = TraceFormat(trace_format or self.detect_format(file_path))
+        if trace_format == TraceFormat.CANDUMP:
+            return _LogSyntax(_parse_candump, _candump_frame_id)
+        with Path(file_path).open('rb') as f:
+            match = _ASC_BASE_RE.search(f.read(self.SNIFF_BYTES))
+        base = 10 if match and match.group(1) == b'dec' else 16
+        return _LogSyntax(
+            _parse_asc, lambda key: (int(key.rstrip('x'), base), key.endswith('x'))
+        )
+
+    def _iter_chunks(
+        self,
+        file_path: Union[str, Path],
+        syntax: _LogSyntax
+    ) -> Iterator[List[_Frame]]:
+        """Read the log in chunks of whole lines and parse each chunk."""
+        with Path(file_path).open('rb') as f:
+            tail = b''
+            while True:
+                block = f.read(self.chunk_size)
+                if not block:
+                    break
+                block = tail + block
+                cut = block.rfind(b'\n') + 1
+                tail = block[cut:]
+                if cut:
+                    frames = syntax.parse(block[:cut].decode('latin-1'))
+                    self.frames += len(frames)
+                    yield frames
+            if tail:
+                frames = syntax.parse(tail.decode('latin-1'))
+                self.frames += len(frames)
+                yield frames
+
+    def _batch(
+        self,
+        frames: List[_Frame],
+        syntax: _LogSyntax,
+        messages: Dict[str, Optional['CANMessage']]
+    ) -> Dict[str, Tuple['CANMessage', List[int], List[_Frame]]]:
+        """
+        Group the frames of a chunk by message.
+
+        ``messages`` memoizes the message of each ID text across chunks.
+
+        Returns:
+            ID text -> (message, row indices, frames)
+        """
+        frame_map = self._frame_map
+        batches: Dict[str, Tuple['CANMessage', List[int], List[_Frame]]] = {}
+        unknown: Set[str] = set()
+        skipped = 0
+        for row, frame in enumerate(frames):
+            key = frame[2]
+            batch = batches.get(key)
+            if batch is None:
+                if key in unknown:
+                    skipped += 1
+                    continue
+                if key not in messages:
+                    messages[key] = frame_map.get(syntax.frame_id(key))
+                message = messages[key]
+                if message is None:
+                    unknown.add(key)
+                    skipped += 1
+                    continue
+                batch = batches[key] = (message, [], [])
+            batch[1].append(row)
+            batch[2].append(frame)
+        self.unknown_frames += skipped
+        return batches
+
+    def _decode(self, message: 'CANMessage', frames: List[_Frame]) -> TraceBlock:
+        """Decode the batched frames of one message."""
+        np = _numpy()
+        timestamps, channels, _, payloads = zip(*frames)
+        dlc = message.dlc
+        count = len(payloads)
+
+        # One hex conversion for the whole batch when every payload has the
+        # message's length (the usual case), else pad/truncate per frame
+        data = None
+        if isinstance(payloads[0], str):
+            if set(map(len, payloads)) == {2 * dlc}:
+                data = bytes.fromhex(''.join(payloads))
+            else:
+                payloads = tuple(bytes.fromhex(payload) for payload in payloads)
+        if data is None:
+            data = b''.join([
+                payload if len(payload) == dlc else payload[:dlc].ljust(dlc, b'\0')
+                for payload in payloads
+            ])
+        return TraceBlock(
+            message,
+            np.array(timestamps, dtype=np.float64),
+            np.array(channels, dtype=object),
+            message.decode_batch(
+                np.frombuffer(data, dtype=np.uint8).reshape(count, dlc)
+            ),
+        )
+
+
+def _multiplexing(message: 'CANMessage') -> Optional[Tuple[str, Dict[str, int]]]:
+    """
+    Get the multiplexer of a message and the multiplexer value of its signals.
+
+    Returns:
+        (multiplexer name, multiplexed signal name -> value), or None if the
+        message has no single top-level 'M' multiplexer or has nested ones
+    """
+    multiplexers = []
+    values: Dict[str, int] = {}
+    for signal in message.signals:
+        indicator = signal.multiplex_indicator
+        if not indicator:
+            continue
+        if indicator == 'M':
+            multiplexers.append(signal.name)
+        elif indicator.endswith('M'):
+            return None
+        else:
+            value = _mux_value(indicator)
+            if value >= 0:
+                values[signal.name] = value
+    if len(multiplexers) != 1 or not values:
+        return None
+    return multiplexers[0], values
+
+
+def _multiplexed_signals(
+    names: List[str],
+    values: Iterator[Tuple[float, ...]],
+    batch: 'DecodedBatch',
+    multiplexer: str,
+    mux_values: Dict[str, int]
+) -> Iterator[Dict[str, float]]:
+    """Per-frame signal dicts without the signals of other multiplexer values."""
+    # Column positions present for each multiplexer value seen
+    present: Dict[int, Tuple[int, ...]] = {}
+    for selector, row_values in zip(batch.raw[multiplexer].tolist(), values):
+        columns = present.get(selector)
+        if columns is None:
+            columns = present[selector] = tuple(
+                i for i, name in enumerate(names)
+                if mux_values.get(name, selector) == selector
+            )
+        yield {names[i]: row_values[i] for i in columns}
+
+
+def _parse_candump(text: str) -> List[_Frame]:
+    """Parse the frames of candump log lines."""
+    return _CANDUMP_RE.findall(text)
+
+
+def _candump_frame_id(key: str) -> Tuple[int, bool]:
+    return int(key, 16), len(key) == 8
+
+
+def _parse_asc(text: str) -> List[_Frame]:
+    """Parse the CAN and CAN FD frames of Vector ASC lines."""
+    fromhex = bytes.fromhex
+    frames = []
+    for (timestamp, fd_channel, fd_id, fd_length,
+         channel, frame_id, dlc, data) in _ASC_RE.findall(text):
+        if fd_id:
+            frames.append((timestamp, fd_channel, fd_id, fromhex(data)[:int(fd_length)]))
+        else:
+            frames.append((timestamp, channel, frame_id, fromhex(data)[:int(dlc, 16)]))
+    return frames
+
+
+__all__ = ['TraceDecoder', 'TraceFormat', 'TraceFrame', 'TraceBlock', 'TraceRecord']
@@ -4,29 +4,32 @@ XLSX (Excel) file loader for CAN configuration.
 Loads and parses Excel files containing CAN message and signal definitions.
 """
 
-from typing import Dict, Any, List, Optional, Set
+from typing import TYPE_CHECKING, Callable, Dict, Any, Iterator, List, Optional, Set, Union
 import logging
 from pathlib import Path
 
-try:
-    import openpyxl
-    from openpyxl.worksheet.worksheet import Worksheet
-except ImportError:
-    raise ImportError(
-        "openpyxl is required for XLSX loading. "
-        "Install with: pip install openpyxl"
-    )
-
-from .base_loader import BaseLoader, ParserError, ValidationError, ConversionError
+from .base_loader import (
+    CachedLoader, ParserError, ValidationError, ConversionError, ValidationMode,
+    import_optional, strip_text,
+)
 from ..model import (
     CANDatabase, CANMessage, CANSignal,
     XLSXDatabase, XLSXMessage, XLSXSignal,
-    MessageDirection, create_xlsx_database,
+    MessageDirection, create_xlsx_database, create_xlsx_message,
     ByteOrder, ValueType, SignalType
 )
 
+if TYPE_CHECKING:
+    import openpyxl
+    from openpyxl.worksheet.worksheet import Worksheet
+
+
+def _openpyxl():
+    """Import openpyxl on first use (it dominates the package import time)."""
+    return import_optional('openpyxl', 'XLSX loading')
 
-class XLSXLoader(BaseLoader[CANDatabase]):
+
+class XLSXLoader(CachedLoader[CANDatabase]):
     """
     Loader for XLSX (Excel) files containing CAN configuration.
     
@@ -65,10 +68,25 @@ class XLSXLoader(BaseLoader[CANDatabase]):
         'notes': 9,             # Notes
     }
     
-    def __init__(self, logger: Optional[logging.Logger] = None):
-        """Initialize XLSX loader."""
-        super().__init__(logger)
-        self._workbook: Optional[openpyxl.Workbook] = None
+    def __init__(
+        self,
+        logger: Optional[logging.Logger] = None,
+        validation: Union[str, ValidationMode] = ValidationMode.STRICT,
+        **cache_options: Any
+    ):
+        """
+        Initialize XLSX loader.
+        
+        Args:
+            logger: Optional logger instance
+            validation: 'strict' validates every model; 'trusted' builds them
+                from the parsed data without validation
+            **cache_options: Cache settings passed to CachedLoader
+                (``cache_dir``, ``max_cache_bytes``, ``max_cache_entries``,
+                ``max_cache_weight``)
+        """
+        super().__init__(logger, validation=validation, **cache_options)
+        self._workbook: Optional['openpyxl.Workbook'] = None
     
     def load(self, file_path: str) -> Dict[str, Any]:
         """
@@ -91,7 +109,7 @@ class XLSXLoader(BaseLoader[CANDatabase]):
         try:
             # Load workbook
             self.logger.info(f"Parsing XLSX file: {path}")
-            self._workbook = openpyxl.load_workbook(str(path), data_only=True)
+            self._workbook = _openpyxl().load_workbook(str(path), data_only=True)
             
             # Extract data from sheets
             rx_messages = []
@@ -137,7 +155,7 @@ class XLSXLoader(BaseLoader[CANDatabase]):
             if self._workbook:
                 self._workbook.close()
     
-    def _parse_rx_sheet(self, worksheet: Worksheet) -> List[Dict[str, Any]]:
+    def _parse_rx_sheet(self, worksheet: 'Worksheet') -> List[Dict[str, Any]]:
         """
         Parse Rx sheet to extract CAN messages and signals.
         
@@ -147,57 +165,12 @@ class XLSXLoader(BaseLoader[CANDatabase]):
         Returns:
             List of message dictionaries
         """
-        messages = {}  # message_name -> message_data
-        
-        # Skip first 2 rows (title and header)
-        for row_idx, row in enumerate(worksheet.iter_rows(min_row=3, values_only=True), start=3):
-            try:
-                # Get message info from first columns
-                message_name = row[self.RX_COLUMNS['message_name']]
-                message_id = row[self.RX_COLUMNS['message_id']]
-                signal_name = row[self.RX_COLUMNS['signal_name']]
-                
-                # Skip empty rows
-                if not signal_name:
-                    continue
-                
-                # If message_name is None, use the previous message name (merged cells)
-                if message_name is None:
-                    # Find the last valid message name
-                    if not messages:
-                        self.logger.warning(f"Row {row_idx}: Signal without message name, skipping")
-                        continue
-                    message_name = list(messages.keys())[-1]
-                else:
-                    # Create new message if not exists
-                    if message_name not in messages:
-                        parsed_msg_id = self._parse_message_id(message_id) if message_id else 0
-                        # Auto-detect extended frame based on ID value
-                        is_extended = parsed_msg_id > 0x7FF
-                        messages[message_name] = {
-                            'name': message_name,
-                            'message_id': parsed_msg_id,
-                            'is_extended': is_extended,
-                            'dlc': 8,  # Default CAN DLC
-                            'cycle_time': self._parse_cycle_time(row[self.RX_COLUMNS['periodicity']]),
-                            'senders': [],  # RX messages don't have senders in this format
-                            'comment': f"RX Message from XLSX",
-                            'signals': [],
-                            'direction': 'rx',
-                        }
-                
-                # Create signal
-                signal = self._create_signal_from_rx_row(row, row_idx)
-                if signal:
-                    messages[message_name]['signals'].append(signal)
-                    
-            except Exception as e:
-                self.logger.error(f"Error parsing Rx row {row_idx}: {e}")
-                continue
-        
-        return list(messages.values())
+        return self._parse_sheet(
+            worksheet, 'Rx', self.RX_COLUMNS,
+            self._create_message_from_rx_row, self._create_signal_from_rx_row,
+        )
     
-    def _parse_tx_sheet(self, worksheet: Worksheet) -> List[Dict[str, Any]]:
+    def _parse_tx_sheet(self, worksheet: 'Worksheet') -> List[Dict[str, Any]]:
         """
         Parse Tx sheet to extract CAN messages and signals.
         
@@ -207,55 +180,201 @@ class XLSXLoader(BaseLoader[CANDatabase]):
         Returns:
             List of message dictionaries
         """
-        messages = {}  # message_name -> message_data
+        return self._parse_sheet(
+            worksheet, 'Tx', self.TX_COLUMNS,
+            self._create_message_from_tx_row, self._create_signal_from_tx_row,
+        )
+    
+    def _parse_sheet(
+        self,
+        worksheet: 'Worksheet',
+        sheet_name: str,
+        columns: Dict[str, int],
+        create_message: Callable[[tuple, Any], Dict[str, Any]],
+        create_signal: Callable[[tuple, int], Optional[Dict[str, Any]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Parse an Rx or Tx sheet into message dictionaries.
+        
+        Blocks of a message name that appears more than once in the sheet
+        are merged into the first message of that name.
+        
+        Args:
+            worksheet: Openpyxl worksheet object
+            sheet_name: Sheet name for log messages
+            columns: Column index mapping (RX_COLUMNS or TX_COLUMNS)
+            create_message: Builds a message dict from its first row and name
+            create_signal: Builds a signal dict from a row
+            
+        Returns:
+            List of message dictionaries, in order of first appearance
+        """
+        messages: Dict[Any, Dict[str, Any]] = {}  # message_name -> message_data
+        
+        for block in self._iter_sheet(worksheet, sheet_name, columns,
+                                      create_message, create_signal):
+            existing = messages.get(block['name'])
+            if existing is None:
+                messages[block['name']] = block
+            else:
+                existing['signals'].extend(block['signals'])
+        
+        return list(messages.values())
+    
+    def _iter_sheet(
+        self,
+        worksheet: 'Worksheet',
+        sheet_name: str,
+        columns: Dict[str, int],
+        create_message: Callable[[tuple, Any], Dict[str, Any]],
+        create_signal: Callable[[tuple, int], Optional[Dict[str, Any]]]
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream message blocks from an Rx or Tx sheet.
+        
+        The message name is only present on the first row of each message
+        block (merged cells); the following rows leave it empty. The parser
+        keeps the current message as state, attaches every signal row to it
+        and yields it as soon as a row names a different message, so each
+        row is processed in constant time.
+        
+        Args:
+            worksheet: Openpyxl worksheet object (regular or read-only)
+            sheet_name: Sheet name for log messages
+            columns: Column index mapping (RX_COLUMNS or TX_COLUMNS)
+            create_message: Builds a message dict from its first row and name
+            create_signal: Builds a signal dict from a row
+            
+        Yields:
+            Message dictionaries, one per contiguous message block
+        """
+        current: Optional[Dict[str, Any]] = None
+        
+        name_col = columns['message_name']
+        signal_col = columns['signal_name']
         
         # Skip first 2 rows (title and header)
         for row_idx, row in enumerate(worksheet.iter_rows(min_row=3, values_only=True), start=3):
+            finished = None
             try:
-                # Get message info from first columns
-                message_name = row[self.TX_COLUMNS['message_name']]
-                message_id = row[self.TX_COLUMNS['message_id']]
-                signal_name = row[self.TX_COLUMNS['signal_name']]
-                
                 # Skip empty rows
-                if not signal_name:
+                if not row[signal_col]:
                     continue
                 
-                # If message_name is None, use the previous message name (merged cells)
-                if message_name is None:
-                    # Find the last valid message name
-                    if not messages:
-                        self.logger.warning(f"Row {row_idx}: Signal without message name, skipping")
-                        continue
-                    message_name = list(messages.keys())[-1]
-                else:
-                    # Create new message if not exists
-                    if message_name not in messages:
-                        parsed_msg_id = self._parse_message_id(message_id) if message_id else 0
-                        # Auto-detect extended frame based on ID value
-                        is_extended = parsed_msg_id > 0x7FF
-                        messages[message_name] = {
-                            'name': message_name,
-                            'message_id': parsed_msg_id,
-                            'is_extended': is_extended,
-                            'dlc': 8,  # Default CAN DLC
-                            'cycle_time': self._parse_cycle_time(row[self.TX_COLUMNS['periodicity']]),
-                            'senders': ['ECU'],  # TX messages are sent by ECU
-                            'comment': row[self.TX_COLUMNS['dbc_comment']] or "TX Message from XLSX",
-                            'signals': [],
-                            'direction': 'tx',
-                        }
+                message_name = row[name_col]
+                if message_name is not None:
+                    if current is None or current['name'] != message_name:
+                        # First row of a new message block
+                        block = create_message(row, message_name)
+                        finished, current = current, block
+                elif current is None:
+                    self.logger.warning(f"Row {row_idx}: Signal without message name, skipping")
+                    continue
                 
                 # Create signal
-                signal = self._create_signal_from_tx_row(row, row_idx)
+                signal = create_signal(row, row_idx)
                 if signal:
-                    messages[message_name]['signals'].append(signal)
+                    current['signals'].append(signal)
                     
             except Exception as e:
-                self.logger.error(f"Error parsing Tx row {row_idx}: {e}")
-                continue
+                # Only this row is lost; a message completed above is still yielded
+                self.logger.error(f"Error parsing {sheet_name} row {row_idx}: {e}")
+            
+            if finished is not None:
+                yield finished
         
-        return list(messages.values())
+        if current is not None:
+            yield current
+    
+    def iter_messages(self, file_path: str) -> Iterator[XLSXMessage]:
+        """
+        Incrementally load messages from an XLSX file.
+        
+        The workbook is opened read-only and streamed; each XLSXMessage is
+        converted and yielded as soon as its block of rows ends, Rx sheet
+        first, then Tx. Only the current message is held in memory.
+        
+        Unlike load(), a message name that appears in several separate
+        blocks of a sheet is yielded once per block.
+        
+        Args:
+            file_path: Path to XLSX file
+            
+        Yields:
+            XLSXMessage objects in sheet order
+            
+        Raises:
+            FileNotFoundError: If file does not exist
+            ParserError: If the workbook cannot be opened
+            ConversionError: If a message cannot be converted
+        """
+        path = self._validate_file_exists(file_path)
+        self._validate_file_extension(path, ['.xlsx', '.XLSX'])
+        
+        try:
+            self.logger.info(f"Streaming XLSX file: {path}")
+            workbook = _openpyxl().load_workbook(str(path), read_only=True, data_only=True)
+        except Exception as e:
+            raise ParserError(f"Failed to parse XLSX file: {e}") from e
+        
+        sheets = (
+            (self.RX_SHEET_NAME, self.RX_COLUMNS,
+             self._create_message_from_rx_row, self._create_signal_from_rx_row),
+            (self.TX_SHEET_NAME, self.TX_COLUMNS,
+             self._create_message_from_tx_row, self._create_signal_from_tx_row),
+        )
+        
+        try:
+            for sheet_name, columns, create_message, create_signal in sheets:
+                if sheet_name not in workbook.sheetnames:
+                    self.logger.warning(f"Sheet '{sheet_name}' not found")
+                    continue
+                
+                for block in self._iter_sheet(workbook[sheet_name], sheet_name, columns,
+                                              create_message, create_signal):
+                    try:
+                        message = create_xlsx_message(block)
+                    except Exception as e:
+                        raise ConversionError(
+                            f"Failed to convert message '{block['name']}': {e}"
+                        ) from e
+                    yield message
+        finally:
+            workbook.close()
+    
+    def _create_message_from_rx_row(self, row: tuple, message_name: Any) -> Dict[str, Any]:
+        """Create message dictionary from the first Rx row of a message block."""
+        message_id = row[self.RX_COLUMNS['message_id']]
+        parsed_msg_id = self._parse_message_id(message_id) if message_id else 0
+        return {
+            'name': message_name,
+            'message_id': parsed_msg_id,
+            # Auto-detect extended frame based on ID value
+            'is_extended': parsed_msg_id > 0x7FF,
+            'dlc': 8,  # Default CAN DLC
+            'cycle_time': self._parse_cycle_time(row[self.RX_COLUMNS['periodicity']]),
+            'senders': [],  # RX messages don't have senders in this format
+            'comment': "RX Message from XLSX",
+            'signals': [],
+            'direction': 'rx',
+        }
+    
+    def _create_message_from_tx_row(self, row: tuple, message_name: Any) -> Dict[str, Any]:
+        """Create message dictionary from the first Tx row of a message block."""
+        message_id = row[self.TX_COLUMNS['message_id']]
+        parsed_msg_id = self._parse_message_id(message_id) if message_id else 0
+        return {
+            'name': message_name,
+            'message_id': parsed_msg_id,
+            # Auto-detect extended frame based on ID value
+            'is_extended': parsed_msg_id > 0x7FF,
+            'dlc': 8,  # Default CAN DLC
+            'cycle_time': self._parse_cycle_time(row[self.TX_COLUMNS['periodicity']]),
+            'senders': ['ECU'],  # TX messages are sent by ECU
+            'comment': row[self.TX_COLUMNS['dbc_comment']] or "TX Message from XLSX",
+            'signals': [],
+            'direction': 'tx',
+        }
     
     def _create_signal_from_rx_row(self, row: tuple, row_idx: int) -> Optional[Dict[str, Any]]:
         """Create signal dictionary from Rx row data."""
@@ -476,6 +595,7 @@ class XLSXLoader(BaseLoader[CANDatabase]):
         Raises:
             ConversionError: If conversion fails
         """
+        build = self._construct
         try:
             # Convert messages
             messages = []
@@ -483,7 +603,8 @@ class XLSXLoader(BaseLoader[CANDatabase]):
                 # Convert signals
                 signals = []
                 for sig_data in msg_data['signals']:
-                    signal = CANSignal(
+                    signal = build(
+                        CANSignal,
                         name=sig_data['name'],
                         short_name=sig_data['name'],
                         start_bit=sig_data['start_bit'],
@@ -493,17 +614,15 @@ class XLSXLoader(BaseLoader[CANDatabase]):
                         signal_type=sig_data['signal_type'],
                         factor=sig_data['factor'],
                         offset=sig_data['offset'],
-                        minimum=sig_data['minimum'],
-                        maximum=sig_data['maximum'],
-                        unit=sig_data['unit'],
-                        receivers=sig_data['receivers'],
-                        comment=sig_data['comment'],
+                        unit=strip_text(sig_data['unit']),
+                        receivers=list(sig_data['receivers']),
                         value_table=sig_data.get('value_table'),
                     )
                     signals.append(signal)
                 
                 # Create message
-                message = CANMessage(
+                message = build(
+                    CANMessage,
                     name=msg_data['name'],
                     short_name=msg_data['name'],
                     message_id=msg_data['message_id'],
@@ -511,19 +630,17 @@ class XLSXLoader(BaseLoader[CANDatabase]):
                     dlc=msg_data['dlc'],
                     signals=signals,
                     cycle_time=msg_data.get('cycle_time'),
-                    senders=msg_data.get('senders', []),
-                    comment=msg_data.get('comment', ''),
+                    comment=strip_text(msg_data.get('comment', '')),
                 )
                 messages.append(message)
             
             # Create database
-            database = CANDatabase(
+            database = build(
+                CANDatabase,
                 name=Path(data['file_path']).stem,
-                short_name=Path(data['file_path']).stem,
                 version=data['version'],
                 messages=messages,
                 nodes=[],  # Nodes are extracted from messages
-                comment=f"Loaded from XLSX: {data['file_path']}",
             )
             
             self.logger.info(f"Successfully converted to CANDatabase model")
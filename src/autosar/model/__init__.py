@@ -4,91 +4,225 @@ AUTOSAR Model Module
 Provides data models for CAN, LIN, AUTOSAR, and ECU configuration elements.
 """
 
-from .base import BaseElement, Identifiable
-from .types import (
-    ByteOrder,
-    ValueType,
-    SignalType,
-    ParameterType,
-    ModuleDefType,
-    FrameType,
-)
-
-# CAN Models
-from .can_model import (
-    CANDatabase,
-    CANMessage,
-    CANSignal,
-    CANNode,
-    ValueTable,
-    ValueTableEntry,
-)
-
-# XLSX Models
-from .xlsx_model import (
-    XLSXDatabase,
-    XLSXMessage,
-    XLSXSignal,
-    MessageDirection,
-    create_xlsx_signal,
-    create_xlsx_message,
-    create_xlsx_database,
-)
-
-# Complete XLSX Models (with ALL Excel columns)
-from .xlsx_complete_model import (
-    CompleteXLSXDatabase,
-    CompleteXLSXMessage,
-    CompleteXLSXSignal,
-    RxColumnMapping,
-    TxColumnMapping,
-    ExcelColumnMapping,
-    InvalidationPolicy,
-    SignalStatus,
-)
-
-# LIN Models
-from .lin_model import (
-    LINNetwork,
-    LINFrame,
-    LINSignal,
-    LINNode,
-    LINNodeType,
-    ScheduleTable,
-    ScheduleEntry,
-)
-
-# AUTOSAR Models
-from .autosar_model import (
-    ARPackage,
-    Component,
-    PortInterface,
-    DataElement,
-)
-
-# ECU Models
-from .ecu_model import (
-    EcuConfiguration,
-    Module,
-    Container,
-    Parameter,
-)
-
-# ECUC Models
-from .ecuc_model import (
-    AutosarVersion,
-    ECUCParameterType,
-    ECUCParameterValue,
-    ECUCContainerValue,
-    ECUCModuleConfigurationValues,
-    ECUCValueCollection,
-    ECUCProject,
-)
+from typing import TYPE_CHECKING
+import importlib
+
+if TYPE_CHECKING:
+    from .base import (
+        BaseElement,
+        Identifiable,
+        UUIDStrategy,
+        set_uuid_strategy,
+        uuid_strategy,
+        deterministic_uuid,
+    )
+    from .types import (
+        ByteOrder,
+        ValueType,
+        SignalType,
+        ParameterType,
+        ModuleDefType,
+        FrameType,
+    )
+
+    # CAN Models
+    from .can_model import (
+        CANDatabase,
+        CANMessage,
+        CANSignal,
+        CANNode,
+        ValueTable,
+        ValueTableEntry,
+        LazyCANDatabase,
+        LazyMessageList,
+    )
+
+    # XLSX Models
+    from .xlsx_model import (
+        XLSXDatabase,
+        XLSXMessage,
+        XLSXSignal,
+        MessageDirection,
+        create_xlsx_signal,
+        create_xlsx_message,
+        create_xlsx_database,
+    )
+
+    # Complete XLSX Models (with ALL Excel columns)
+    from .xlsx_complete_model import (
+        CompleteXLSXDatabase,
+        CompleteXLSXMessage,
+        CompleteXLSXSignal,
+        RxColumnMapping,
+        TxColumnMapping,
+        ExcelColumnMapping,
+        InvalidationPolicy,
+        SignalStatus,
+    )
+
+    # LIN Models
+    from .lin_model import (
+        LINNetwork,
+        LINFrame,
+        LINSignal,
+        LINNode,
+        LINNodeType,
+        ScheduleTable,
+        ScheduleEntry,
+    )
+
+    # Columnar signal view and batch codec (require numpy)
+    from .signal_table import SignalTable
+    from .signal_codec import MessageCodec, DecodedBatch, RangeMode, SignalRangeError
+
+    # Signal layout validation
+    from .signal_layout import (
+        LayoutIssue,
+        LayoutIssueKind,
+        signal_mask,
+        signal_end_bit,
+        check_frame_layout,
+        check_layout,
+    )
+
+    # AUTOSAR Models
+    from .autosar_model import (
+        ARPackage,
+        Component,
+        PortInterface,
+        DataElement,
+    )
+
+    # ECU Models
+    from .ecu_model import (
+        EcuConfiguration,
+        Module,
+        Container,
+        Parameter,
+    )
+
+    # ECUC Models
+    from .ecuc_model import (
+        AutosarVersion,
+        ECUCParameterType,
+        ECUCParameterValue,
+        ECUCContainerValue,
+        ECUCModuleConfigurationValues,
+        ECUCValueCollection,
+        ECUCProject,
+        ECUCReferenceIndex,
+    )
+
+# Public name -> defining submodule. Submodules are imported on first
+# access, so importing e.g. only the ECUC models skips building the
+# CAN/LIN/XLSX model classes.
+_SUBMODULES = {
+    ".base": (
+        "BaseElement",
+        "Identifiable",
+        "UUIDStrategy",
+        "set_uuid_strategy",
+        "uuid_strategy",
+        "deterministic_uuid",
+    ),
+    ".types": (
+        "ByteOrder",
+        "ValueType",
+        "SignalType",
+        "ParameterType",
+        "ModuleDefType",
+        "FrameType",
+    ),
+    ".can_model": (
+        "CANDatabase",
+        "CANMessage",
+        "CANSignal",
+        "CANNode",
+        "ValueTable",
+        "ValueTableEntry",
+        "LazyCANDatabase",
+        "LazyMessageList",
+    ),
+    ".xlsx_model": (
+        "XLSXDatabase",
+        "XLSXMessage",
+        "XLSXSignal",
+        "MessageDirection",
+        "create_xlsx_signal",
+        "create_xlsx_message",
+        "create_xlsx_database",
+    ),
+    ".xlsx_complete_model": (
+        "CompleteXLSXDatabase",
+        "CompleteXLSXMessage",
+        "CompleteXLSXSignal",
+        "RxColumnMapping",
+        "TxColumnMapping",
+        "ExcelColumnMapping",
+        "InvalidationPolicy",
+        "SignalStatus",
+    ),
+    ".lin_model": (
+        "LINNetwork",
+        "LINFrame",
+        "LINSignal",
+        "LINNode",
+        "LINNodeType",
+        "ScheduleTable",
+        "ScheduleEntry",
+    ),
+    ".signal_table": (
+        "SignalTable",
+    ),
+    ".signal_codec": (
+        "MessageCodec",
+        "DecodedBatch",
+        "RangeMode",
+        "SignalRangeError",
+    ),
+    ".signal_layout": (
+        "LayoutIssue",
+        "LayoutIssueKind",
+        "signal_mask",
+        "signal_end_bit",
+        "check_frame_layout",
+        "check_layout",
+    ),
+    ".autosar_model": (
+        "ARPackage",
+        "Component",
+        "PortInterface",
+        "DataElement",
+    ),
+    ".ecu_model": (
+        "EcuConfiguration",
+        "Module",
+        "Container",
+        "Parameter",
+    ),
+    ".ecuc_model": (
+        "AutosarVersion",
+        "ECUCParameterType",
+        "ECUCParameterValue",
+        "ECUCContainerValue",
+        "ECUCModuleConfigurationValues",
+        "ECUCValueCollection",
+        "ECUCProject",
+        "ECUCReferenceIndex",
+    ),
+}
+_LAZY_IMPORTS = {
+    name: module for module, names in _SUBMODULES.items() for name in names
+}
 
 __all__ = [
     # Base
     "BaseElement",
     "Identifiable",
+    "UUIDStrategy",
+    "set_uuid_strategy",
+    "uuid_strategy",
+    "deterministic_uuid",
     # Types
     "ByteOrder",
     "ValueType",
@@ -103,6 +237,8 @@ __all__ = [
     "CANNode",
     "ValueTable",
     "ValueTableEntry",
+    "LazyCANDatabase",
+    "LazyMessageList",
     # XLSX
     "XLSXDatabase",
     "XLSXMessage",
@@ -128,6 +264,18 @@ __all__ = [
     "LINNodeType",
     "ScheduleTable",
     "ScheduleEntry",
+    # Signal table and codec
+    "SignalTable",
+    "MessageCodec",
+    "DecodedBatch",
+    "RangeMode",
+    "SignalRangeError",
+    "LayoutIssue",
+    "LayoutIssueKind",
+    "signal_mask",
+    "signal_end_bit",
+    "check_frame_layout",
+    "check_layout",
     # AUTOSAR
     "ARPackage",
     "Component",
@@ -146,6 +294,21 @@ __all__ = [
     "ECUCModuleConfigurationValues",
     "ECUCValueCollection",
     "ECUCProject",
+    "ECUCReferenceIndex",
 ]
 
 __version__ = "0.1.0"
+
+
+def __getattr__(name: str):
+    """Import model submodules on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
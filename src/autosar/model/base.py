@@ -4,9 +4,476 @@ Base models for all AUTOSAR elements.
 Provides common base classes and mixins used across all model types.
 """
 
-from typing import Any, Dict, Optional
-from uuid import uuid4
+from contextlib import contextmanager
+from enum import Enum
+from typing import Any, Callable, ClassVar, Dict, FrozenSet, Hashable, Iterable, Iterator, List, Optional, Tuple, Type, TypeVar, Union
+from uuid import NAMESPACE_URL, uuid4, uuid5
+import threading
+import weakref
 from pydantic import BaseModel, Field, ConfigDict
+from pydantic_core import PydanticUndefined
+
+M = TypeVar('M', bound=BaseModel)
+
+# model class -> (static defaults, default factories, private defaults,
+# private default factories)
+_CONSTRUCT_PLANS: Dict[type, Tuple[
+    Dict[str, Any],
+    Tuple[Tuple[str, Callable[[], Any]], ...],
+    Optional[Dict[str, Any]],
+    Tuple[Tuple[str, Callable[[], Any]], ...],
+]] = {}
+
+
+def construct_trusted(model_cls: Type[M], **values: Any) -> M:
+    """
+    Build a model instance from already-validated values without validation.
+    
+    Intended for loaders whose input is trusted (e.g. objects produced by
+    cantools, which has already checked them). Like ``model_construct`` but
+    the per-class default plan is computed once, so construction costs
+    little more than a dict copy. Values must already have the field types;
+    missing fields receive their defaults.
+    
+    Args:
+        model_cls: Pydantic model class
+        **values: Field values
+    
+    Returns:
+        Model instance
+    """
+    plan = _CONSTRUCT_PLANS.get(model_cls)
+    if plan is None:
+        plan = _build_construct_plan(model_cls)
+    static_defaults, factories, private_defaults, private_factories = plan
+    
+    fields = dict(static_defaults)
+    for name, factory in factories:
+        if name not in values:
+            fields[name] = factory()
+    fields.update(values)
+    
+    instance = model_cls.__new__(model_cls)
+    object.__setattr__(instance, '__dict__', fields)
+    object.__setattr__(instance, '__pydantic_fields_set__', set(values))
+    object.__setattr__(instance, '__pydantic_extra__', None)
+    private = None
+    if private_defaults is not None:
+        private = dict(private_defaults)
+        for name, factory in private_factories:
+            private[name] = factory()
+    object.__setattr__(instance, '__pydantic_private__', private)
+    return instance
+
+
+def _build_construct_plan(model_cls: type):
+    """Collect static defaults, default factories and private defaults."""
+    static_defaults: Dict[str, Any] = {}
+    factories = []
+    for name, field in model_cls.model_fields.items():
+        if field.default_factory is not None:
+            factories.append((name, field.default_factory))
+        elif field.default is not PydanticUndefined:
+            static_defaults[name] = field.default
+    
+    private_defaults = None
+    private_factories = []
+    if model_cls.__private_attributes__:
+        private_defaults = {}
+        for name, attr in model_cls.__private_attributes__.items():
+            if attr.default_factory is not None:
+                private_factories.append((name, attr.default_factory))
+            else:
+                private_defaults[name] = attr.get_default()
+    
+    plan = (static_defaults, tuple(factories), private_defaults, tuple(private_factories))
+    _CONSTRUCT_PLANS[model_cls] = plan
+    return plan
+
+
+class UUIDStrategy(str, Enum):
+    """How BaseElement.uuid is assigned."""
+    # uuid4 at construction; differs between runs
+    RANDOM = "random"
+    # Left empty at construction; derived with uuid5 from the element's
+    # AUTOSAR path when serialized, so identical inputs give identical output
+    DETERMINISTIC = "deterministic"
+
+
+# Namespace of the uuid5 values derived from AUTOSAR paths
+UUID_NAMESPACE = uuid5(NAMESPACE_URL, 'https://github.com/pempem98/ecuc-configurator')
+
+_uuid_strategy = UUIDStrategy.RANDOM
+
+
+def get_uuid_strategy() -> UUIDStrategy:
+    """Get the process-wide UUID strategy."""
+    return _uuid_strategy
+
+
+def set_uuid_strategy(strategy: Union[UUIDStrategy, str]) -> None:
+    """
+    Set the process-wide UUID strategy used for new elements.
+    
+    Args:
+        strategy: UUIDStrategy or its value ('random', 'deterministic')
+    """
+    global _uuid_strategy
+    _uuid_strategy = UUIDStrategy(strategy)
+
+
+@contextmanager
+def uuid_strategy(strategy: Union[UUIDStrategy, str]) -> Iterator[None]:
+    """
+    Use a UUID strategy for the elements created inside the block.
+    
+    Example:
+        >>> with uuid_strategy('deterministic'):
+        ...     project = service.generate_ecuc_project('Proj', 'ECU')
+    """
+    previous = _uuid_strategy
+    set_uuid_strategy(strategy)
+    try:
+        yield
+    finally:
+        set_uuid_strategy(previous)
+
+
+def new_uuid(strategy: Optional[Union[UUIDStrategy, str]] = None) -> str:
+    """
+    UUID for a new element: a random one, or '' (assigned on serialization).
+    
+    Args:
+        strategy: Strategy to apply (default: the process-wide strategy)
+    
+    Returns:
+        UUID string, empty under UUIDStrategy.DETERMINISTIC
+    """
+    if strategy is None:
+        strategy = _uuid_strategy
+    if strategy == UUIDStrategy.DETERMINISTIC:
+        return ''
+    return str(uuid4())
+
+
+def deterministic_uuid(path: str) -> str:
+    """
+    Derive a stable UUID from an AUTOSAR path.
+    
+    Args:
+        path: Absolute path (e.g., '/Proj/CanIf/CanIfInitCfg')
+    
+    Returns:
+        uuid5 of the path in UUID_NAMESPACE
+    """
+    return str(uuid5(UUID_NAMESPACE, path))
+
+
+class _AssignmentMode(threading.local):
+    """Per-thread switch read by BaseElement.__setattr__."""
+    trusted = False
+
+
+_assignment_mode = _AssignmentMode()
+
+
+@contextmanager
+def trusted_assignment() -> Iterator[None]:
+    """
+    Skip validation of field assignments on BaseElement models.
+    
+    For bulk edits with trusted values, e.g. a pass that sets the start
+    bit of thousands of signals. Inside the block (in the current thread),
+    ``element.field = value`` stores the value as is instead of
+    re-validating it through ``validate_assignment``. Lookup indexes are
+    still invalidated when a key field changes.
+    
+    Example:
+        >>> with trusted_assignment():
+        ...     for signal, start_bit in zip(signals, start_bits):
+        ...         signal.start_bit = start_bit
+    """
+    previous = _assignment_mode.trusted
+    _assignment_mode.trusted = True
+    try:
+        yield
+    finally:
+        _assignment_mode.trusted = previous
+
+
+class TrackedList(list):
+    """
+    List that counts its mutations.
+    
+    Lets an IndexCache tell whether an index built over the list is stale
+    without comparing its contents. Once watched, the version also moves
+    when a ``CONTAINER_KEYS`` field of one of its elements changes.
+    """
+    
+    version = 0
+    
+    def _mutated(self) -> None:
+        self.version += 1
+    
+    def watch(self) -> None:
+        """Register the list as a container of its elements (see BaseElement)."""
+        watch_elements(self, self)
+    
+    def append(self, item: Any) -> None:
+        super().append(item)
+        self._mutated()
+    
+    def extend(self, items: Any) -> None:
+        super().extend(items)
+        self._mutated()
+    
+    def insert(self, index: int, item: Any) -> None:
+        super().insert(index, item)
+        self._mutated()
+    
+    def remove(self, item: Any) -> None:
+        super().remove(item)
+        self._mutated()
+    
+    def pop(self, index: int = -1) -> Any:
+        item = super().pop(index)
+        self._mutated()
+        return item
+    
+    def clear(self) -> None:
+        super().clear()
+        self._mutated()
+    
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        super().sort(*args, **kwargs)
+        self._mutated()
+    
+    def reverse(self) -> None:
+        super().reverse()
+        self._mutated()
+    
+    def __setitem__(self, index: Any, item: Any) -> None:
+        super().__setitem__(index, item)
+        self._mutated()
+    
+    def __delitem__(self, index: Any) -> None:
+        super().__delitem__(index)
+        self._mutated()
+    
+    def __iadd__(self, items: Any) -> 'TrackedList':
+        result = super().__iadd__(items)
+        self._mutated()
+        return result
+    
+    def __imul__(self, count: int) -> 'TrackedList':
+        result = super().__imul__(count)
+        self._mutated()
+        return result
+
+
+class TrackedDict(dict):
+    """
+    Dict that counts its mutations.
+    
+    Counterpart of TrackedList for indexes built over a dict field.
+    """
+    
+    version = 0
+    
+    def _mutated(self) -> None:
+        self.version += 1
+    
+    def __setitem__(self, key: Any, value: Any) -> None:
+        super().__setitem__(key, value)
+        self._mutated()
+    
+    def __delitem__(self, key: Any) -> None:
+        super().__delitem__(key)
+        self._mutated()
+    
+    def pop(self, *args: Any) -> Any:
+        value = super().pop(*args)
+        self._mutated()
+        return value
+    
+    def popitem(self) -> Tuple[Any, Any]:
+        item = super().popitem()
+        self._mutated()
+        return item
+    
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        value = super().setdefault(key, default)
+        self._mutated()
+        return value
+    
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        super().update(*args, **kwargs)
+        self._mutated()
+    
+    def clear(self) -> None:
+        super().clear()
+        self._mutated()
+    
+    def __ior__(self, other: Any) -> 'TrackedDict':
+        result = super().__ior__(other)
+        self._mutated()
+        return result
+
+
+def track_list(items: List[Any]) -> List[Any]:
+    """Field validator helper: store list fields as TrackedList."""
+    if isinstance(items, list) and type(items) is not TrackedList:
+        return TrackedList(items)
+    return items
+
+
+def track_dict(items: Dict[Any, Any]) -> Dict[Any, Any]:
+    """Field validator helper: store dict fields as TrackedDict."""
+    if isinstance(items, dict) and type(items) is not TrackedDict:
+        return TrackedDict(items)
+    return items
+
+
+def _tracked(items: Any) -> Any:
+    """Wrap a plain list or dict in its tracked counterpart."""
+    if type(items) is TrackedList or type(items) is TrackedDict:
+        return items
+    return TrackedDict(items) if isinstance(items, dict) else TrackedList(items)
+
+
+def watch_elements(container: Any, items: Iterable[Any]) -> None:
+    """
+    Register a container as holding the given elements.
+    
+    A later change of a ``CONTAINER_KEYS`` field of one of the elements
+    calls the container's ``_mutated()``. Used by TrackedList.watch() and by
+    list types that are not TrackedLists.
+    
+    Args:
+        container: Weak-referenceable sequence with a ``_mutated()`` method
+        items: Elements held by the container
+    """
+    ref = None
+    for item in items:
+        if not isinstance(item, BaseElement) or not item.CONTAINER_KEYS:
+            continue
+        try:
+            refs = _containers_slot.__get__(item)
+        except AttributeError:
+            refs = ()
+        if any(held() is container for held in refs):
+            continue
+        if ref is None:
+            ref = weakref.ref(container)
+        live = tuple(held for held in refs if held() is not None)
+        _containers_slot.__set__(item, live + (ref,))
+
+
+class IndexCache:
+    """
+    Lazily built lookup dictionaries over the list (or dict) fields of a model.
+    
+    An index is rebuilt on the next lookup after its field is mutated or
+    replaced, after a key field (``INDEX_KEYS``) of any element changes, or
+    after a ``CONTAINER_KEYS`` field of one of the field's elements changes.
+    The cache is not part of a model's value: it compares equal to any other
+    cache and pickles empty.
+    """
+    
+    # Bumped whenever a key field of any element changes value
+    key_generation = 0
+    
+    __slots__ = ('_entries',)
+    
+    def __init__(self):
+        # index key -> (container, container version, key generation, index)
+        self._entries: Dict[Hashable, Tuple[Any, int, int, Any]] = {}
+    
+    def get(
+        self,
+        model: BaseModel,
+        field: str,
+        build: Callable[[Any], Any],
+        key: Optional[Hashable] = None
+    ) -> Any:
+        """
+        Get the index over a list or dict field, building it if needed.
+        
+        Args:
+            model: Model owning the field
+            field: Name of the list or dict field
+            build: Builds the index from the field value
+            key: Cache key, to keep several indexes over one field
+                (defaults to the field name)
+        
+        Returns:
+            Index returned by ``build``
+        """
+        items = model.__dict__[field]
+        entry = self._entries.get(field if key is None else key)
+        if (
+            entry is not None
+            and entry[0] is items
+            and entry[1] == items.version
+            and entry[2] == IndexCache.key_generation
+        ):
+            return entry[3]
+        
+        if type(items) is not TrackedList and type(items) is not TrackedDict:
+            # Adopt the container once so later mutations are counted
+            items = _tracked(items)
+            model.__dict__[field] = items
+        index = build(items)
+        if type(items) is TrackedList:
+            items.watch()
+        self._entries[field if key is None else key] = (
+            items, items.version, IndexCache.key_generation, index
+        )
+        return index
+    
+    def discard(self, key: Hashable) -> None:
+        """Drop one index (no-op if not built)."""
+        self._entries.pop(key, None)
+    
+    def clear(self) -> None:
+        """Drop all indexes."""
+        self._entries.clear()
+    
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, IndexCache)
+    
+    def __hash__(self) -> int:
+        return 0
+    
+    def __reduce__(self):
+        return (IndexCache, ())
+
+
+def lookup_index(
+    model: BaseModel,
+    field: str,
+    build: Callable[[Any], Any],
+    key: Optional[Hashable] = None
+) -> Any:
+    """
+    Get an index over a field from the model's ``_lookup`` IndexCache.
+    
+    Reads the private attribute directly: pydantic's attribute fallback
+    would cost more than the lookup itself.
+    """
+    return model.__pydantic_private__['_lookup'].get(model, field, build, key)
+
+
+def index_by_name(items: List[Any]) -> Dict[str, Any]:
+    """Index builder: map name -> first element with that name."""
+    index: Dict[str, Any] = {}
+    for item in items:
+        index.setdefault(item.name, item)
+    return index
+
+
+# Marks a field missing from a model's __dict__
+_UNSET = object()
 
 
 class BaseElement(BaseModel):
@@ -14,6 +481,10 @@ class BaseElement(BaseModel):
     Base class for all model elements.
     
     Provides common fields like name, description, UUID, and metadata.
+    
+    The UUID default follows the UUID strategy (see set_uuid_strategy()):
+    a random uuid4, or an empty string that generators replace with
+    deterministic_uuid() of the element's path.
     """
     
     model_config = ConfigDict(
@@ -25,14 +496,59 @@ class BaseElement(BaseModel):
     name: str = Field(..., min_length=1, description="Element name")
     description: Optional[str] = Field(None, description="Element description")
     uuid: str = Field(
-        default_factory=lambda: str(uuid4()),
-        description="Unique identifier"
+        default_factory=new_uuid,
+        description="Unique identifier (empty: derived from the path when serialized)"
     )
     metadata: Dict[str, Any] = Field(
         default_factory=dict,
         description="Additional metadata"
     )
     
+    # Watched TrackedLists holding this element (weak references); not
+    # copied or pickled with the model
+    __slots__ = ('_containers',)
+    
+    # Fields whose change invalidates all lookup indexes: keys under which
+    # containers index this element, or inputs of its own indexes
+    INDEX_KEYS: ClassVar[FrozenSet[str]] = frozenset({'name'})
+    
+    # Fields whose change only invalidates the indexes built over the lists
+    # holding this element, by bumping their version
+    CONTAINER_KEYS: ClassVar[FrozenSet[str]] = frozenset()
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in self.INDEX_KEYS or name in self.CONTAINER_KEYS:
+            previous = self.__dict__.get(name, _UNSET)
+            self._assign(name, value)
+            # Re-assigning the same value leaves every index valid
+            current = self.__dict__.get(name, _UNSET)
+            if current is not previous and current != previous:
+                if name in self.INDEX_KEYS:
+                    IndexCache.key_generation += 1
+                else:
+                    self._containers_changed()
+        else:
+            self._assign(name, value)
+    
+    def _containers_changed(self) -> None:
+        """Bump the version of every watched list holding this element."""
+        try:
+            refs = _containers_slot.__get__(self)
+        except AttributeError:
+            return
+        for ref in refs:
+            items = ref()
+            if items is not None:
+                items._mutated()
+    
+    def _assign(self, name: str, value: Any) -> None:
+        """Set an attribute, skipping validation inside trusted_assignment()."""
+        if _assignment_mode.trusted and name in type(self).model_fields:
+            self.__dict__[name] = value
+            self.__pydantic_fields_set__.add(name)
+        else:
+            super().__setattr__(name, value)
+    
     def __str__(self) -> str:
         return f"{self.__class__.__name__}(name='{self.name}')"
     
@@ -40,6 +556,9 @@ class BaseElement(BaseModel):
         return f"{self.__class__.__name__}(name='{self.name}', uuid='{self.uuid}')"
 
 
+_containers_slot = BaseElement.__dict__['_containers']
+
+
 class Identifiable(BaseElement):
     """
     Base class for identifiable AUTOSAR elements.
@@ -51,6 +570,8 @@ class Identifiable(BaseElement):
     long_name: Optional[str] = Field(None, description="AUTOSAR long name")
     category: Optional[str] = Field(None, description="Element category")
     
+    INDEX_KEYS: ClassVar[FrozenSet[str]] = frozenset({'name', 'short_name'})
+    
     def __init__(self, **data):
         # If name is not provided but short_name is, use short_name as name
         if 'name' not in data and 'short_name' in data:
@@ -4,10 +4,18 @@ CAN (Controller Area Network) data models.
 Defines models for CAN database, messages, signals, and nodes.
 """
 
-from typing import List, Optional, Dict, Any
-from pydantic import Field, field_validator, model_validator
+from typing import Callable, ClassVar, FrozenSet, Iterator, List, Optional, Dict, Any, Tuple, Union
+from collections.abc import MutableSequence
+import copy
+from pydantic import Field, PrivateAttr, field_serializer, field_validator, model_validator
 
-from .base import BaseElement, Identifiable
+from .base import (
+    BaseElement, Identifiable, IndexCache, construct_trusted, index_by_name, lookup_index,
+    track_dict, track_list, watch_elements,
+)
+from .signal_codec import DecodedBatch, MessageCodec, RangeMode
+from .signal_layout import LayoutIssue, check_frame_layout, check_layout, signal_mask
+from .signal_table import SignalTable
 from .types import ByteOrder, ValueType, SignalType, NumericValue
 
 
@@ -22,27 +30,68 @@ class ValueTable(BaseElement):
     """
     Value table for signal enumeration.
     
-    Maps numeric values to human-readable labels.
+    Maps numeric values to human-readable labels. The mapping is kept as a
+    ``choices`` dict (value -> label) plus a lazily built reverse index, so
+    both lookups are O(1); ValueTableEntry objects are only created when
+    ``entries`` is read. A legacy ``entries`` list is still accepted as
+    input.
     """
     
-    entries: List[ValueTableEntry] = Field(
-        default_factory=list,
-        description="Value table entries"
+    choices: Dict[int, str] = Field(
+        default_factory=dict,
+        description="Value -> label mapping"
     )
     
+    _lookup: IndexCache = PrivateAttr(default_factory=IndexCache)
+    
+    _track_choices = field_validator('choices')(track_dict)
+    
+    @model_validator(mode='before')
+    @classmethod
+    def _entries_to_choices(cls, data: Any) -> Any:
+        """Fold an ``entries`` list into ``choices`` (first entry per value wins)."""
+        if isinstance(data, dict) and 'entries' in data:
+            data = dict(data)
+            choices: Dict[Any, Any] = {}
+            for entry in data.pop('entries') or ():
+                if isinstance(entry, dict):
+                    choices.setdefault(entry['value'], entry['label'])
+                else:
+                    choices.setdefault(entry.value, entry.label)
+            choices.update(data.get('choices') or {})
+            data['choices'] = choices
+        return data
+    
+    @property
+    def entries(self) -> Tuple[ValueTableEntry, ...]:
+        """
+        Value table entries, built from ``choices`` on first access.
+        
+        The tuple is read-only; edit ``choices`` to change the table.
+        """
+        return lookup_index(self, 'choices', self._build_entries, 'entries')
+    
+    def _build_entries(self, choices: Dict[int, str]) -> Tuple[ValueTableEntry, ...]:
+        # Tables built by the loaders are named '<signal>_values'; entries
+        # keep their historical '<signal>_entry_<value>' names
+        base = self.name[:-len('_values')] if self.name.endswith('_values') else self.name
+        return tuple(
+            construct_trusted(
+                ValueTableEntry,
+                name=f"{base}_entry_{value}",
+                value=value,
+                label=label,
+            )
+            for value, label in choices.items()
+        )
+    
     def get_label(self, value: int) -> Optional[str]:
         """Get label for a numeric value."""
-        for entry in self.entries:
-            if entry.value == value:
-                return entry.label
-        return None
+        return self.choices.get(value)
     
     def get_value(self, label: str) -> Optional[int]:
         """Get numeric value for a label."""
-        for entry in self.entries:
-            if entry.label == label:
-                return entry.value
-        return None
+        return lookup_index(self, 'choices', _index_labels, 'labels').get(label)
 
 
 class CANSignal(Identifiable):
@@ -52,7 +101,7 @@ class CANSignal(Identifiable):
     Represents a signal within a CAN message.
     """
     
-    start_bit: int = Field(..., ge=0, le=63, description="Start bit position")
+    start_bit: int = Field(..., ge=0, le=511, description="Start bit position")
     length: int = Field(..., ge=1, le=64, description="Signal length in bits")
     byte_order: ByteOrder = Field(
         default=ByteOrder.LITTLE_ENDIAN,
@@ -101,6 +150,14 @@ class CANSignal(Identifiable):
         description="List of receiver node names"
     )
     
+    # Layout and scaling fields: inputs of the MessageCodec and SignalTable
+    # built over the signal list holding this signal
+    CONTAINER_KEYS: ClassVar[FrozenSet[str]] = frozenset({
+        'start_bit', 'length', 'byte_order', 'value_type', 'signal_type',
+        'multiplex_indicator', 'factor', 'offset', 'min_value', 'max_value',
+        'initial_value',
+    })
+    
     @field_validator('start_bit', 'length')
     @classmethod
     def validate_bit_range(cls, v: int) -> int:
@@ -112,12 +169,12 @@ class CANSignal(Identifiable):
     @model_validator(mode='after')
     def validate_signal_fits_in_message(self):
         """Validate that signal fits within message boundaries."""
-        if self.byte_order == ByteOrder.LITTLE_ENDIAN:
-            end_bit = self.start_bit + self.length - 1
-        else:  # Big endian (Motorola)
-            end_bit = self.start_bit + self.length - 1
-        
-        if end_bit > 63:
+        # Big endian (Motorola) bits run from the MSB at start_bit towards
+        # bit 0 of the byte, then continue at bit 7 of the next
+        mask = signal_mask(
+            self.start_bit, self.length, self.byte_order == ByteOrder.BIG_ENDIAN
+        )
+        if mask.bit_length() > 512:
             raise ValueError(
                 f"Signal extends beyond message boundary: "
                 f"start_bit={self.start_bit}, length={self.length}"
@@ -151,7 +208,7 @@ class CANMessage(Identifiable):
         le=0x1FFFFFFF,
         description="CAN message ID (11-bit or 29-bit)"
     )
-    dlc: int = Field(..., ge=0, le=8, description="Data Length Code (0-8 bytes)")
+    dlc: int = Field(..., ge=0, le=64, description="Data length in bytes (0-8, up to 64 for CAN FD)")
     
     def __init__(self, **data):
         # Allow 'length' as alias for 'dlc'
@@ -186,6 +243,17 @@ class CANMessage(Identifiable):
     # Attributes
     comment: Optional[str] = Field(None, description="Message comment")
     
+    INDEX_KEYS: ClassVar[FrozenSet[str]] = frozenset(
+        {'name', 'short_name', 'message_id', 'is_extended'}
+    )
+    
+    # Frame length: SignalTable column of the database's message list
+    CONTAINER_KEYS: ClassVar[FrozenSet[str]] = frozenset({'dlc'})
+    
+    _lookup: IndexCache = PrivateAttr(default_factory=IndexCache)
+    
+    _track_signals = field_validator('signals')(track_list)
+    
     @field_validator('message_id')
     @classmethod
     def validate_message_id(cls, v: int, info) -> int:
@@ -198,11 +266,59 @@ class CANMessage(Identifiable):
         return v
     
     def get_signal(self, name: str) -> Optional[CANSignal]:
-        """Get signal by name."""
-        for signal in self.signals:
-            if signal.name == name or signal.short_name == name:
-                return signal
-        return None
+        """Get signal by name or short name."""
+        return lookup_index(self, 'signals', _index_signals).get(name)
+    
+    def decode_batch(self, payloads: Any) -> DecodedBatch:
+        """
+        Decode many payloads of this message at once (requires numpy).
+        
+        The compiled MessageCodec is cached until the signals change.
+        
+        Args:
+            payloads: (N, dlc) uint8 array, one frame payload per row
+        
+        Returns:
+            DecodedBatch: ``raw`` and ``physical`` dicts of signal name -> column
+        
+        Raises:
+            ValueError: If the payload array does not cover the signals
+        """
+        return lookup_index(self, 'signals', MessageCodec, key='codec').decode(payloads)
+    
+    def encode_batch(
+        self,
+        values: Dict[str, Any],
+        on_range: Union[RangeMode, str] = RangeMode.ERROR,
+        scaled: bool = True
+    ) -> Any:
+        """
+        Pack columns of signal values into payloads (requires numpy).
+        
+        Args:
+            values: Signal name -> N values (or one value for all frames);
+                missing signals get their raw initial value (or 0)
+            on_range: 'error' to raise SignalRangeError on values outside
+                min/max or the bit length, 'saturate' to clamp them
+            scaled: If True, values are physical; if False, raw
+        
+        Returns:
+            (N, dlc) uint8 array, one frame payload per row
+        
+        Raises:
+            SignalRangeError: If a value is out of range in 'error' mode
+            ValueError: If a signal is unknown or does not fit in dlc bytes
+        """
+        codec = lookup_index(self, 'signals', MessageCodec, key='codec')
+        return codec.encode(values, length=self.dlc, on_range=on_range, scaled=scaled)
+    
+    def check_layout(self) -> List[LayoutIssue]:
+        """
+        Find overlapping signals and signals beyond the message length.
+        
+        Multiplexed signals only conflict within their multiplexer value.
+        """
+        return check_frame_layout(self)
     
     def is_tx(self) -> bool:
         """
@@ -279,30 +395,320 @@ class CANDatabase(BaseElement):
         description="Database-level attributes"
     )
     
-    def get_message_by_id(self, message_id: int) -> Optional[CANMessage]:
-        """Get message by CAN ID."""
-        for message in self.messages:
-            if message.message_id == message_id:
-                return message
-        return None
+    # Lookup indexes, rebuilt lazily after the lists change
+    _lookup: IndexCache = PrivateAttr(default_factory=IndexCache)
+    
+    _track_lists = field_validator('messages', 'nodes', 'value_tables')(track_list)
+    
+    def get_message_by_id(
+        self,
+        message_id: int,
+        is_extended: Optional[bool] = None
+    ) -> Optional[CANMessage]:
+        """
+        Get message by CAN ID.
+        
+        Args:
+            message_id: CAN identifier
+            is_extended: Frame format to match (None = first message with
+                this ID in either format)
+        """
+        if is_extended is None:
+            return lookup_index(
+                self, 'messages', _index_messages_by_id, key='message_id'
+            ).get(message_id)
+        return lookup_index(
+            self, 'messages', _index_messages_by_frame_id, key='frame_id'
+        ).get((message_id, is_extended))
     
     def get_message_by_name(self, name: str) -> Optional[CANMessage]:
         """Get message by name."""
-        for message in self.messages:
-            if message.name == name:
-                return message
-        return None
+        return lookup_index(self, 'messages', index_by_name, key='message_name').get(name)
     
     def get_node(self, name: str) -> Optional[CANNode]:
         """Get node by name."""
-        for node in self.nodes:
-            if node.name == name:
-                return node
-        return None
+        return lookup_index(self, 'nodes', index_by_name).get(name)
     
     def get_value_table(self, name: str) -> Optional[ValueTable]:
         """Get value table by name."""
-        for vt in self.value_tables:
-            if vt.name == name:
-                return vt
+        return lookup_index(self, 'value_tables', index_by_name).get(name)
+    
+    def signal_table(self) -> SignalTable:
+        """
+        Get the columnar NumPy view of all signals (requires numpy).
+        
+        Cached until the messages, a message's signal list or a signal's
+        layout/scaling field change; do not modify the arrays.
+        """
+        table = lookup_index(self, 'messages', SignalTable.from_frames, key='signal_table')
+        if not table.is_current():
+            self._lookup.discard('signal_table')
+            table = lookup_index(self, 'messages', SignalTable.from_frames, key='signal_table')
+        return table
+    
+    def check_layout(self) -> List[LayoutIssue]:
+        """Find signal overlap and boundary conflicts in all messages."""
+        return check_layout(self.messages)
+
+
+def _index_labels(choices: Dict[int, str]) -> Dict[str, int]:
+    """Index builder: map label -> first value with that label."""
+    index: Dict[str, int] = {}
+    for value, label in choices.items():
+        index.setdefault(label, value)
+    return index
+
+
+def _index_signals(signals: List[CANSignal]) -> Dict[str, CANSignal]:
+    """Map name and short name -> first signal matching either."""
+    index: Dict[str, CANSignal] = {}
+    for signal in signals:
+        index.setdefault(signal.name, signal)
+        index.setdefault(signal.short_name, signal)
+    return index
+
+
+def _index_messages_by_id(messages: List[CANMessage]) -> Dict[int, CANMessage]:
+    """Map message ID -> first message with that ID."""
+    index: Dict[int, CANMessage] = {}
+    for message in messages:
+        index.setdefault(message.message_id, message)
+    return index
+
+
+def _index_messages_by_frame_id(
+    messages: List[CANMessage]
+) -> Dict[Tuple[int, bool], CANMessage]:
+    """Map (message ID, extended flag) -> first matching message."""
+    index: Dict[Tuple[int, bool], CANMessage] = {}
+    for message in messages:
+        index.setdefault((message.message_id, message.is_extended), message)
+    return index
+
+
+def _field_values(database: CANDatabase) -> Dict[str, Any]:
+    """Field values of a database, with the message list materialized."""
+    values = {name: getattr(database, name) for name in CANDatabase.model_fields}
+    values['messages'] = list(values['messages'])
+    return values
+
+
+class LazyMessageList(MutableSequence):
+    """
+    Message list that builds CANMessage objects on first access.
+    
+    Holds only a compact (message_id, name) key per message plus a factory
+    that builds the message for a given source index. Built messages are
+    memoized. Behaves like a list of CANMessage for indexing, iteration and
+    mutation; ``len()`` never materializes anything. Pickling builds every
+    message and yields a plain list (the factory holds the parsed source);
+    deep copies stay lazy and share the factory.
+    """
+    
+    def __init__(
+        self,
+        keys: List[Tuple[int, str]],
+        factory: Callable[[int], CANMessage]
+    ):
+        """
+        Initialize lazy message list.
+        
+        Args:
+            keys: (message_id, name) for each source message, in order
+            factory: Builds the CANMessage for a source index
+        """
+        self._keys = keys
+        self._factory = factory
+        # Each slot is either a built CANMessage or the int source index
+        self._slots: List[Union[CANMessage, int]] = list(range(len(keys)))
+        self._built = 0
+        self.version = 0
+    
+    @property
+    def materialized_count(self) -> int:
+        """Number of messages built so far."""
+        return self._built
+    
+    def key_at(self, index: int) -> Tuple[int, str]:
+        """Get (message_id, name) of the message at index without building it."""
+        slot = self._slots[index]
+        if type(slot) is int:
+            return self._keys[slot]
+        return (slot.message_id, slot.name)
+    
+    def _materialize(self, index: int) -> CANMessage:
+        slot = self._slots[index]
+        if type(slot) is int:
+            slot = self._factory(slot)
+            self._slots[index] = slot
+            self._built += 1
+        return slot
+    
+    def __len__(self) -> int:
+        return len(self._slots)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._materialize(i) for i in range(*index.indices(len(self._slots)))]
+        if index < 0:
+            index += len(self._slots)
+        if not 0 <= index < len(self._slots):
+            raise IndexError("message index out of range")
+        return self._materialize(index)
+    
+    def __iter__(self) -> Iterator[CANMessage]:
+        for index in range(len(self._slots)):
+            yield self._materialize(index)
+    
+    def __setitem__(self, index, value) -> None:
+        if isinstance(index, slice):
+            value = list(value)
+        self._slots[index] = value
+        self.version += 1
+    
+    def __delitem__(self, index) -> None:
+        del self._slots[index]
+        self.version += 1
+    
+    def _mutated(self) -> None:
+        self.version += 1
+    
+    def watch(self) -> None:
+        """Register the list as a container of its built messages (see TrackedList.watch())."""
+        watch_elements(self, [slot for slot in self._slots if type(slot) is not int])
+    
+    def insert(self, index: int, value: CANMessage) -> None:
+        self._slots.insert(index, value)
+        self.version += 1
+    
+    def __reduce__(self):
+        return (list, (list(self),))
+    
+    def __deepcopy__(self, memo: Dict[int, Any]) -> 'LazyMessageList':
+        state = dict(self.__dict__)
+        factory = state.pop('_factory')
+        copied = LazyMessageList.__new__(LazyMessageList)
+        memo[id(self)] = copied
+        copied.__dict__.update(copy.deepcopy(state, memo))
+        copied._factory = factory
+        return copied
+    
+    def __repr__(self) -> str:
+        return (
+            f"LazyMessageList({len(self._slots)} messages, "
+            f"{self._built} materialized)"
+        )
+
+
+class LazyCANDatabase(CANDatabase):
+    """
+    CAN Database whose messages are built on demand.
+    
+    ``messages`` is a LazyMessageList: only messages that are looked up or
+    iterated over are converted to CANMessage models, so load time and
+    memory scale with the messages actually used. Lookups by ID and name use
+    an index over the compact message keys and do not build other messages.
+    
+    Instances are created by ``DBCLoader.load_lazy()``. Serialization
+    (model_dump(), model_dump_json(), pickling) builds every message; an
+    unpickled database holds a plain message list. Instances compare equal
+    to a CANDatabase with the same field values. Use to_database() to obtain
+    a fully materialized CANDatabase.
+    """
+    
+    # (message list version, IndexCache.key_generation) of the key index
+    _index_stamp: Tuple[int, int] = PrivateAttr(default=(-1, -1))
+    _id_index: Dict[int, int] = PrivateAttr(default_factory=dict)
+    _name_index: Dict[str, int] = PrivateAttr(default_factory=dict)
+    _signal_table: Optional[Tuple[int, SignalTable]] = PrivateAttr(default=None)
+    
+    @property
+    def materialized_count(self) -> int:
+        """Number of messages built so far."""
+        messages = self.messages
+        if isinstance(messages, LazyMessageList):
+            return messages.materialized_count
+        return len(messages)
+    
+    @field_serializer('messages', mode='wrap')
+    def _serialize_messages(self, messages: Any, handler: Any) -> Any:
+        return handler(list(messages))
+    
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, CANDatabase):
+            return NotImplemented
+        return _field_values(self) == _field_values(other)
+    
+    def _ensure_index(self) -> Optional[LazyMessageList]:
+        """(Re)build the key index if the message list or a message's ID or name changed."""
+        messages = self.messages
+        if not isinstance(messages, LazyMessageList):
+            return None
+        stamp = (messages.version, IndexCache.key_generation)
+        if self._index_stamp != stamp:
+            id_index: Dict[int, int] = {}
+            name_index: Dict[str, int] = {}
+            for position in range(len(messages)):
+                message_id, name = messages.key_at(position)
+                id_index.setdefault(message_id, position)
+                name_index.setdefault(name, position)
+            self._id_index = id_index
+            self._name_index = name_index
+            self._index_stamp = stamp
+        return messages
+    
+    def get_message_by_id(
+        self,
+        message_id: int,
+        is_extended: Optional[bool] = None
+    ) -> Optional[CANMessage]:
+        """Get message by CAN ID, building only matching messages."""
+        messages = self._ensure_index()
+        if messages is None:
+            return super().get_message_by_id(message_id, is_extended)
+        if is_extended is None:
+            position = self._id_index.get(message_id)
+            return None if position is None else messages[position]
+        # Keys carry no frame format: build and check each candidate
+        for position in range(len(messages)):
+            if messages.key_at(position)[0] == message_id:
+                message = messages[position]
+                if message.is_extended == is_extended:
+                    return message
         return None
+    
+    def get_message_by_name(self, name: str) -> Optional[CANMessage]:
+        """Get message by name, building only that message."""
+        messages = self._ensure_index()
+        if messages is None:
+            return super().get_message_by_name(name)
+        position = self._name_index.get(name)
+        return None if position is None else messages[position]
+    
+    def signal_table(self) -> SignalTable:
+        """Get the columnar view of all signals, building every message."""
+        messages = self.messages
+        if not isinstance(messages, LazyMessageList):
+            return super().signal_table()
+        cached = self._signal_table
+        if cached is None or cached[0] != messages.version or not cached[1].is_current():
+            table = SignalTable.from_frames(messages)
+            messages.watch()
+            cached = self._signal_table = (messages.version, table)
+        return cached[1]
+    
+    def to_database(self) -> CANDatabase:
+        """Build all messages and return a regular CANDatabase."""
+        return CANDatabase(
+            name=self.name,
+            description=self.description,
+            uuid=self.uuid,
+            metadata=dict(self.metadata),
+            version=self.version,
+            protocol=self.protocol,
+            baudrate=self.baudrate,
+            messages=list(self.messages),
+            nodes=list(self.nodes),
+            value_tables=list(self.value_tables),
+            attributes=dict(self.attributes),
+        )
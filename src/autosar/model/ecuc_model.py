@@ -4,11 +4,20 @@ ECUC (ECU Configuration) data models.
 Defines models for AUTOSAR ECUC configuration values and parameters.
 """
 
-from typing import List, Optional, Dict, Any, Union
+from typing import ClassVar, FrozenSet, Iterator, List, Optional, Dict, Any, Tuple, Union
 from enum import Enum
-from pydantic import Field, field_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
 
-from .base import Identifiable, Referenceable
+from .base import Identifiable, IndexCache, Referenceable, lookup_index, track_list
+
+# Elements addressable by an AUTOSAR path
+ECUCElement = Union[
+    'ECUCProject',
+    'ECUCValueCollection',
+    'ECUCModuleConfigurationValues',
+    'ECUCContainerValue',
+    'ECUCParameterValue',
+]
 
 
 class AutosarVersion(str, Enum):
@@ -27,6 +36,34 @@ class ECUCParameterType(str, Enum):
     ENUMERATION = "ENUMERATION"
 
 
+class _IndexSlot:
+    """
+    Private attribute linking an ECUC element to a reference index.
+    
+    For a project it holds the project's own index; for a collection,
+    module or container, the index the element is registered in, so that
+    ``add_*`` can register new children. Like IndexCache it is not part of
+    the model's value: it compares equal to any other slot and pickles
+    (and copies deeply) empty.
+    """
+    
+    __slots__ = ('index', 'owner_id', 'child_path')
+    
+    def __init__(self):
+        self.index: Optional['ECUCReferenceIndex'] = None
+        self.owner_id = 0
+        self.child_path = ''
+    
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, _IndexSlot)
+    
+    def __hash__(self) -> int:
+        return 0
+    
+    def __reduce__(self):
+        return (_IndexSlot, ())
+
+
 class ECUCParameterValue(Identifiable):
     """
     ECUC Parameter Value.
@@ -54,6 +91,8 @@ class ECUCParameterValue(Identifiable):
         description="Reference value (for REFERENCE type)"
     )
     
+    INDEX_KEYS: ClassVar[FrozenSet[str]] = frozenset({'name', 'short_name', 'definition_ref'})
+    
     @field_validator('value')
     @classmethod
     def validate_value(cls, v: Any, info) -> Any:
@@ -97,27 +136,30 @@ class ECUCContainerValue(Referenceable):
         description="Sub-containers"
     )
     
+    INDEX_KEYS: ClassVar[FrozenSet[str]] = frozenset({'name', 'short_name', 'definition_ref'})
+    
+    _lookup: IndexCache = PrivateAttr(default_factory=IndexCache)
+    _index_slot: _IndexSlot = PrivateAttr(default_factory=_IndexSlot)
+    
+    _track_lists = field_validator('parameters', 'sub_containers')(track_list)
+    
     def add_parameter(self, param: ECUCParameterValue) -> None:
         """Add a parameter value."""
         self.parameters.append(param)
+        _notify_added(self, param)
     
     def add_sub_container(self, container: 'ECUCContainerValue') -> None:
         """Add a sub-container."""
         self.sub_containers.append(container)
+        _notify_added(self, container)
     
     def get_parameter(self, name: str) -> Optional[ECUCParameterValue]:
         """Get parameter by name."""
-        for param in self.parameters:
-            if param.short_name == name:
-                return param
-        return None
+        return lookup_index(self, 'parameters', _index_by_short_name).get(name)
     
     def get_sub_container(self, name: str) -> Optional['ECUCContainerValue']:
         """Get sub-container by name."""
-        for container in self.sub_containers:
-            if container.short_name == name:
-                return container
-        return None
+        return lookup_index(self, 'sub_containers', _index_by_short_name).get(name)
 
 
 class ECUCModuleConfigurationValues(Referenceable):
@@ -142,16 +184,21 @@ class ECUCModuleConfigurationValues(Referenceable):
         description="Top-level containers"
     )
     
+    INDEX_KEYS: ClassVar[FrozenSet[str]] = frozenset({'name', 'short_name', 'module_def_ref'})
+    
+    _lookup: IndexCache = PrivateAttr(default_factory=IndexCache)
+    _index_slot: _IndexSlot = PrivateAttr(default_factory=_IndexSlot)
+    
+    _track_containers = field_validator('containers')(track_list)
+    
     def add_container(self, container: ECUCContainerValue) -> None:
         """Add a top-level container."""
         self.containers.append(container)
+        _notify_added(self, container)
     
     def get_container(self, name: str) -> Optional[ECUCContainerValue]:
         """Get container by name."""
-        for container in self.containers:
-            if container.short_name == name:
-                return container
-        return None
+        return lookup_index(self, 'containers', _index_by_short_name).get(name)
 
 
 class ECUCValueCollection(Referenceable):
@@ -176,23 +223,25 @@ class ECUCValueCollection(Referenceable):
         description="Module configurations"
     )
     
+    _lookup: IndexCache = PrivateAttr(default_factory=IndexCache)
+    _index_slot: _IndexSlot = PrivateAttr(default_factory=_IndexSlot)
+    
+    _track_modules = field_validator('modules')(track_list)
+    
     def add_module(self, module: ECUCModuleConfigurationValues) -> None:
         """Add a module configuration."""
         self.modules.append(module)
+        _notify_added(self, module)
     
     def get_module(self, name: str) -> Optional[ECUCModuleConfigurationValues]:
         """Get module by name."""
-        for module in self.modules:
-            if module.short_name == name:
-                return module
-        return None
+        return lookup_index(self, 'modules', _index_by_short_name).get(name)
     
     def get_module_by_def_ref(self, def_ref: str) -> Optional[ECUCModuleConfigurationValues]:
         """Get module by definition reference."""
-        for module in self.modules:
-            if module.module_def_ref == def_ref:
-                return module
-        return None
+        return lookup_index(
+            self, 'modules', _index_modules_by_def_ref, 'module_def_ref'
+        ).get(def_ref)
 
 
 class ECUCProject(Referenceable):
@@ -228,7 +277,227 @@ class ECUCProject(Referenceable):
         description="Source files used to generate this configuration"
     )
     
+    INDEX_KEYS: ClassVar[FrozenSet[str]] = frozenset({'name', 'short_name', 'value_collection'})
+    
+    _index_slot: _IndexSlot = PrivateAttr(default_factory=_IndexSlot)
+    
     def add_source_file(self, file_path: str) -> None:
         """Add a source file reference."""
         if file_path not in self.source_files:
             self.source_files.append(file_path)
+    
+    @property
+    def reference_index(self) -> 'ECUCReferenceIndex':
+        """Path/definition index over the project, built on first access."""
+        slot = self.__pydantic_private__['_index_slot']
+        if slot.index is None or slot.index.project is not self:
+            # Unbuilt, or the slot was shared by a shallow model_copy()
+            slot = self.__pydantic_private__['_index_slot'] = _IndexSlot()
+            slot.index = ECUCReferenceIndex(self)
+        return slot.index
+    
+    def resolve(self, path: str) -> Optional[ECUCElement]:
+        """
+        Resolve an absolute AUTOSAR short-name path.
+        
+        Args:
+            path: Path such as ``/Proj/CanIf/CanIfInitCfg/CanIfRxPdu_X``
+                (also accepts the ``reference_value`` of REFERENCE parameters)
+        
+        Returns:
+            Element at the path, or None
+        """
+        return self.reference_index.resolve(path)
+    
+    def find_by_definition(self, definition_ref: str) -> List[ECUCElement]:
+        """
+        Get all modules, containers and parameters with a definition reference.
+        
+        Args:
+            definition_ref: Definition path (e.g., '/AUTOSAR/EcucDefs/CanIf')
+        
+        Returns:
+            Matching elements (empty list if none)
+        """
+        return self.reference_index.find_by_definition(definition_ref)
+    
+    def rebuild_index(self) -> None:
+        """
+        Rebuild the reference index.
+        
+        Only needed after editing element lists directly (e.g.
+        ``container.sub_containers.append(...)``) instead of through the
+        ``add_*`` methods.
+        """
+        self.reference_index.rebuild()
+
+
+class ECUCReferenceIndex:
+    """
+    Index of an ECUCProject by absolute short-name path and definition ref.
+    
+    Built in one traversal of the project. Paths are AUTOSAR reference
+    paths: the project is the package, and modules sit directly below it
+    (ECUCGenerator nests their XML elements in the value collection, but
+    they are referenced from the package), then containers, sub-containers
+    and parameters. ECUCGenerator derives deterministic UUIDs from these
+    paths:
+        
+        /Proj                                   ECUCProject
+        /Proj/Proj_EcucValues                   ECUCValueCollection
+        /Proj/CanIf                             ECUCModuleConfigurationValues
+        /Proj/CanIf/CanIfInitCfg                ECUCContainerValue
+        /Proj/CanIf/CanIfInitCfg/CanIfRxPdu_X   ECUCContainerValue
+    
+    A container shadows a parameter with the same path; otherwise the first
+    element registered at a path wins.
+    
+    Elements added through ``add_module``/``add_container``/
+    ``add_sub_container``/``add_parameter`` are registered as they are
+    added. Renaming an element or changing a definition reference marks the
+    index stale, and it is rebuilt on the next lookup. Direct edits of the
+    element lists are not tracked; call ``rebuild()`` after them.
+    
+    Example:
+        >>> index = project.reference_index
+        >>> pdu = index.resolve('/Proj/CanIf/CanIfInitCfg/CanIfRxPdu_X')
+        >>> rx_pdus = index.find_by_definition(
+        ...     '/AUTOSAR/EcucDefs/CanIf/CanIfInitCfg/CanIfRxPduCfg')
+    """
+    
+    def __init__(self, project: 'ECUCProject'):
+        """
+        Build the index of a project.
+        
+        Args:
+            project: Project to index
+        """
+        self.project = project
+        self._paths: Dict[str, ECUCElement] = {}
+        self._definitions: Dict[str, List[ECUCElement]] = {}
+        self._key_generation = -1
+        self.rebuild()
+    
+    def rebuild(self) -> None:
+        """Rebuild the index from the current project tree."""
+        self._paths.clear()
+        self._definitions.clear()
+        
+        project = self.project
+        root = f"/{project.short_name}"
+        self._paths[root] = project
+        collection = project.value_collection
+        self._add(f"{root}/{collection.short_name}", collection, None)
+        self._attach(collection, root)
+        for module in collection.modules:
+            self._add_module(root, module)
+        
+        self._key_generation = IndexCache.key_generation
+    
+    def resolve(self, path: str) -> Optional[ECUCElement]:
+        """Get the element at an absolute path, or None."""
+        if self._key_generation != IndexCache.key_generation:
+            self.rebuild()
+        return self._paths.get(path.rstrip('/') or path)
+    
+    def find_by_definition(self, definition_ref: str) -> List[ECUCElement]:
+        """Get all elements with a definition reference, in registration order."""
+        if self._key_generation != IndexCache.key_generation:
+            self.rebuild()
+        return list(self._definitions.get(definition_ref, ()))
+    
+    def path_of(self, element: ECUCElement) -> Optional[str]:
+        """Get the path of an indexed collection, module or container."""
+        slot = element.__pydantic_private__.get('_index_slot')
+        if slot is None or slot.index is not self or slot.owner_id != id(element):
+            return None
+        if element is self.project.value_collection:
+            return f"{slot.child_path}/{element.short_name}"
+        return slot.child_path
+    
+    def paths(self) -> Iterator[Tuple[str, ECUCElement]]:
+        """Iterate over (path, element) pairs."""
+        if self._key_generation != IndexCache.key_generation:
+            self.rebuild()
+        return iter(list(self._paths.items()))
+    
+    def __len__(self) -> int:
+        return len(self._paths)
+    
+    def __contains__(self, path: str) -> bool:
+        return self.resolve(path) is not None
+    
+    # ==================== Internals ====================
+    
+    def _add(self, path: str, element: ECUCElement, definition_ref: Optional[str]) -> None:
+        existing = self._paths.setdefault(path, element)
+        if (
+            existing is not element
+            and isinstance(existing, ECUCParameterValue)
+            and not isinstance(element, ECUCParameterValue)
+        ):
+            # A container shadows a parameter registered first
+            self._paths[path] = element
+        if definition_ref:
+            self._definitions.setdefault(definition_ref, []).append(element)
+    
+    def _attach(self, element: BaseModel, child_path: str) -> None:
+        """Let an element's add_* methods register children under child_path."""
+        slot = element.__pydantic_private__['_index_slot']
+        slot.index = self
+        slot.owner_id = id(element)
+        slot.child_path = child_path
+    
+    def _add_child(self, parent_path: str, child: ECUCElement) -> None:
+        if isinstance(child, ECUCParameterValue):
+            self._add(f"{parent_path}/{child.short_name}", child, child.definition_ref)
+        elif isinstance(child, ECUCContainerValue):
+            self._add_container(parent_path, child)
+        elif isinstance(child, ECUCModuleConfigurationValues):
+            self._add_module(parent_path, child)
+    
+    def _add_module(self, parent_path: str, module: ECUCModuleConfigurationValues) -> None:
+        path = f"{parent_path}/{module.short_name}"
+        self._add(path, module, module.module_def_ref)
+        self._attach(module, path)
+        for container in module.containers:
+            self._add_container(path, container)
+    
+    def _add_container(self, parent_path: str, container: ECUCContainerValue) -> None:
+        path = f"{parent_path}/{container.short_name}"
+        self._add(path, container, container.definition_ref)
+        self._attach(container, path)
+        for param in container.parameters:
+            self._add(f"{path}/{param.short_name}", param, param.definition_ref)
+        for sub_container in container.sub_containers:
+            self._add_container(path, sub_container)
+
+
+def _notify_added(parent: BaseModel, child: ECUCElement) -> None:
+    """Register a child added through add_* in the parent's reference index."""
+    slot = parent.__pydantic_private__['_index_slot']
+    index = slot.index
+    if (
+        index is not None
+        and slot.owner_id == id(parent)
+        and index._key_generation == IndexCache.key_generation
+    ):
+        index._add_child(slot.child_path, child)
+
+
+def _index_by_short_name(items: List[Any]) -> Dict[str, Any]:
+    """Index builder: map short name -> first element with that short name."""
+    index: Dict[str, Any] = {}
+    for item in items:
+        index.setdefault(item.short_name, item)
+    return index
+
+
+def _index_modules_by_def_ref(
+    modules: List[ECUCModuleConfigurationValues]
+) -> Dict[str, ECUCModuleConfigurationValues]:
+    """Index builder: map module definition ref -> first module with it."""
+    index: Dict[str, ECUCModuleConfigurationValues] = {}
+    for module in modules:
+        index.setdefault(module.module_def_ref, module)
+    return index
@@ -4,10 +4,12 @@ LIN (Local Interconnect Network) data models.
 Defines models for LIN network, frames, signals, nodes, and schedule tables.
 """
 
-from typing import List, Optional, Dict, Any
-from pydantic import Field, field_validator
+from typing import ClassVar, FrozenSet, List, Optional, Dict, Any
+from pydantic import Field, PrivateAttr, field_validator
 
-from .base import BaseElement, Identifiable
+from .base import BaseElement, Identifiable, IndexCache, index_by_name, lookup_index, track_list
+from .signal_layout import LayoutIssue, check_frame_layout, check_layout
+from .signal_table import SignalTable
 from .types import ByteOrder, ValueType, LINNodeType, FrameType, NumericValue
 
 
@@ -37,6 +39,12 @@ class LINSignal(Identifiable):
         default_factory=list,
         description="Subscribing nodes"
     )
+    
+    # Layout and scaling fields: SignalTable columns
+    CONTAINER_KEYS: ClassVar[FrozenSet[str]] = frozenset({
+        'start_bit', 'length', 'factor', 'offset', 'min_value', 'max_value',
+        'initial_value',
+    })
 
 
 class LINFrame(Identifiable):
@@ -61,6 +69,11 @@ class LINFrame(Identifiable):
     # Publisher node
     publisher: Optional[str] = Field(None, description="Publisher node name")
     
+    INDEX_KEYS: ClassVar[FrozenSet[str]] = frozenset({'name', 'short_name', 'frame_id'})
+    
+    # Frame length: SignalTable column of the network's frame list
+    CONTAINER_KEYS: ClassVar[FrozenSet[str]] = frozenset({'length'})
+    
     @field_validator('frame_id')
     @classmethod
     def validate_frame_id(cls, v: int) -> int:
@@ -68,6 +81,10 @@ class LINFrame(Identifiable):
         if not (0 <= v <= 0x3F):
             raise ValueError(f"LIN frame ID must be 0-63, got {v}")
         return v
+    
+    def check_layout(self) -> List[LayoutIssue]:
+        """Find overlapping signals and signals beyond the frame length."""
+        return check_frame_layout(self)
 
 
 class LINNode(Identifiable):
@@ -119,6 +136,9 @@ class ScheduleEntry(BaseElement):
     frame_name: str = Field(..., description="Name of frame to transmit")
     delay: float = Field(..., ge=0, description="Delay in milliseconds")
     position: int = Field(..., ge=0, description="Position in schedule")
+    
+    # Inputs of the schedule table's total duration and frame name set
+    CONTAINER_KEYS: ClassVar[FrozenSet[str]] = frozenset({'frame_name', 'delay'})
 
 
 class ScheduleTable(Identifiable):
@@ -133,14 +153,18 @@ class ScheduleTable(Identifiable):
         description="Schedule entries"
     )
     
+    _lookup: IndexCache = PrivateAttr(default_factory=IndexCache)
+    
+    _track_entries = field_validator('entries')(track_list)
+    
     def get_total_duration(self) -> float:
         """Calculate total schedule duration in milliseconds."""
-        return sum(entry.delay for entry in self.entries)
+        return lookup_index(self, 'entries', _total_delay, key='total_duration')
     
     def get_frame_cycle_time(self, frame_name: str) -> Optional[float]:
         """Get cycle time for a specific frame."""
         # In a simple repeating schedule, cycle time = total duration
-        if any(entry.frame_name == frame_name for entry in self.entries):
+        if frame_name in lookup_index(self, 'entries', _frame_names, key='frame_names'):
             return self.get_total_duration()
         return None
 
@@ -163,12 +187,12 @@ class LINNetwork(BaseElement):
     
     @property
     def nodes(self) -> List[LINNode]:
-        """Get all nodes (master + slaves) as a list."""
-        result = []
-        if self.master_node:
-            result.append(self.master_node)
-        result.extend(self.slave_nodes)
-        return result
+        """
+        Get all nodes (master + slaves) as a list.
+        
+        The list is cached until the nodes change; do not modify it.
+        """
+        return lookup_index(self, 'slave_nodes', self._collect_nodes, key='nodes')
     
     # Master node (required for LIN)
     master_node: Optional[LINNode] = Field(None, description="Master node")
@@ -195,40 +219,75 @@ class LINNetwork(BaseElement):
     diagnostic_nad_min: int = Field(default=0x01, description="Min diagnostic NAD")
     diagnostic_nad_max: int = Field(default=0x7F, description="Max diagnostic NAD")
     
+    # Reassigning the master node invalidates the node indexes
+    INDEX_KEYS: ClassVar[FrozenSet[str]] = frozenset({'name', 'master_node'})
+    
+    # Lookup indexes, rebuilt lazily after the lists change
+    _lookup: IndexCache = PrivateAttr(default_factory=IndexCache)
+    
+    _track_lists = field_validator('slave_nodes', 'frames', 'schedule_tables')(track_list)
+    
     def get_frame_by_id(self, frame_id: int) -> Optional[LINFrame]:
         """Get frame by ID."""
-        for frame in self.frames:
-            if frame.frame_id == frame_id:
-                return frame
-        return None
+        return lookup_index(self, 'frames', _index_frames_by_id, key='frame_id').get(frame_id)
     
     def get_frame_by_name(self, name: str) -> Optional[LINFrame]:
         """Get frame by name."""
-        for frame in self.frames:
-            if frame.name == name:
-                return frame
-        return None
+        return lookup_index(self, 'frames', index_by_name, key='frame_name').get(name)
     
     def get_node(self, name: str) -> Optional[LINNode]:
         """Get node by name."""
-        if self.master_node and self.master_node.name == name:
-            return self.master_node
-        for node in self.slave_nodes:
-            if node.name == name:
-                return node
-        return None
+        return lookup_index(self, 'slave_nodes', self._index_nodes, key='node_name').get(name)
     
     def get_schedule_table(self, name: str) -> Optional[ScheduleTable]:
         """Get schedule table by name."""
-        for table in self.schedule_tables:
-            if table.name == name:
-                return table
-        return None
+        return lookup_index(self, 'schedule_tables', index_by_name).get(name)
+    
+    def signal_table(self) -> SignalTable:
+        """
+        Get the columnar NumPy view of all frame signals (requires numpy).
+        
+        Cached until the frames, a frame's signal list or a signal's
+        layout/scaling field change; do not modify the arrays.
+        """
+        table = lookup_index(self, 'frames', SignalTable.from_frames, key='signal_table')
+        if not table.is_current():
+            self._lookup.discard('signal_table')
+            table = lookup_index(self, 'frames', SignalTable.from_frames, key='signal_table')
+        return table
+    
+    def check_layout(self) -> List[LayoutIssue]:
+        """Find signal overlap and boundary conflicts in all frames."""
+        return check_layout(self.frames)
     
     def get_all_nodes(self) -> List[LINNode]:
         """Get all nodes (master + slaves)."""
-        nodes = []
-        if self.master_node:
-            nodes.append(self.master_node)
-        nodes.extend(self.slave_nodes)
+        return list(self.nodes)
+    
+    def _collect_nodes(self, slave_nodes: List[LINNode]) -> List[LINNode]:
+        """Build the master + slaves node list."""
+        nodes = [self.master_node] if self.master_node else []
+        nodes.extend(slave_nodes)
         return nodes
+    
+    def _index_nodes(self, slave_nodes: List[LINNode]) -> Dict[str, LINNode]:
+        """Map node name -> node, master first."""
+        return index_by_name(self._collect_nodes(slave_nodes))
+
+
+def _index_frames_by_id(frames: List[LINFrame]) -> Dict[int, LINFrame]:
+    """Map frame ID -> first frame with that ID."""
+    index: Dict[int, LINFrame] = {}
+    for frame in frames:
+        index.setdefault(frame.frame_id, frame)
+    return index
+
+
+def _frame_names(entries: List[ScheduleEntry]) -> FrozenSet[str]:
+    """Names of the frames a schedule table transmits."""
+    return frozenset(entry.frame_name for entry in entries)
+
+
+def _total_delay(entries: List[ScheduleEntry]) -> float:
+    """Sum of the entry delays."""
+    return sum(entry.delay for entry in entries)
@@ -0,0 +1,461 @@
+"""
+Vectorized batch decoding and encoding of CAN payloads.
+
+A MessageCodec is compiled once per message from its signal layout. It
+decodes an (N, dlc) uint8 array of payloads into one column per signal,
+and packs columns of signal values back into such an array, with NumPy
+bit operations per signal instead of Python loops per frame.
+
+NumPy is an optional dependency (``pip install ecuc-configurator[numpy]``),
+imported when the first codec is built.
+"""
+
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, NamedTuple, Optional, Sequence, Tuple, Union
+
+from .signal_layout import msb_bit_index
+from .signal_table import _numpy
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+class RangeMode(str, Enum):
+    """What MessageCodec.encode() does with out-of-range values."""
+    ERROR = "error"        # Raise SignalRangeError
+    SATURATE = "saturate"  # Clamp to the signal's range
+
+
+class SignalRangeError(ValueError):
+    """Raised when values to encode exceed a signal's range."""
+    
+    def __init__(self, signal: str, count: int, row: int, value: float, limits: Tuple[float, float]):
+        self.signal = signal
+        self.count = count
+        self.row = row
+        super().__init__(
+            f"Signal '{signal}': {count} value(s) outside [{limits[0]:g}, {limits[1]:g}] "
+            f"(first at row {row}: {value:g})"
+        )
+
+
+class DecodedBatch(NamedTuple):
+    """Signal columns decoded from N payloads of one message."""
+    # Signal name -> raw values (uint64, int64, float32 or float64)
+    raw: Dict[str, 'np.ndarray']
+    # Signal name -> physical values, raw * factor + offset (float64)
+    physical: Dict[str, 'np.ndarray']
+
+
+class _SignalPlan(NamedTuple):
+    """Precomputed extraction of one signal from a payload."""
+    name: str
+    window: int         # First payload byte of the signal
+    big_endian: bool
+    shift: int          # Intel: right shift; Motorola: see _extract()
+    spill: bool         # Signal spans 9 bytes: 8-byte window + one byte
+    length: int
+    signed: bool
+    float_bits: int     # 32 or 64 for IEEE float signals, else 0
+    factor: float
+    offset: float
+    minimum: Optional[float]    # Physical range (None = unbounded)
+    maximum: Optional[float]
+    initial: Optional[float]    # Raw value of signals missing from encode()
+
+
+def _plan_signal(signal: Any) -> _SignalPlan:
+    """Compute the window and shift of a signal (DBC bit numbering)."""
+    fields = signal.__dict__
+    start = fields['start_bit']
+    length = fields['length']
+    byte_order = fields.get('byte_order')
+    value_type = fields.get('value_type')
+    type_name = value_type.value if value_type is not None else 'unsigned'
+    big_endian = byte_order is not None and byte_order.value == 'big_endian'
+    
+    float_bits = 0
+    if type_name in ('float', 'double'):
+        if length not in (32, 64):
+            raise ValueError(
+                f"Float signal '{fields['name']}' must be 32 or 64 bits, got {length}"
+            )
+        float_bits = length
+    
+    if big_endian:
+        # Linear position: 0 = bit 7 of byte 0, counting towards the LSB
+        msb = msb_bit_index(start)
+        lsb = msb + length - 1
+        window = msb // 8
+        end = lsb - window * 8          # Position of the LSB in the window
+        spill = end > 63
+        shift = end - 63 if spill else 63 - end
+    else:
+        window = start // 8
+        shift = start - window * 8
+        spill = shift + length > 64
+    
+    return _SignalPlan(
+        name=fields['name'],
+        window=window,
+        big_endian=big_endian,
+        shift=shift,
+        spill=spill,
+        length=length,
+        signed=type_name == 'signed',
+        float_bits=float_bits,
+        factor=float(fields['factor']),
+        offset=float(fields['offset']),
+        minimum=_optional_float(fields.get('min_value')),
+        maximum=_optional_float(fields.get('max_value')),
+        initial=_optional_float(fields.get('initial_value')),
+    )
+
+
+def _optional_float(value: Any) -> Optional[float]:
+    return None if value is None else float(value)
+
+
+class MessageCodec:
+    """
+    Compiled payload decoder/encoder for one message's signals.
+    
+    Each signal is read as an 8-byte window starting at its first byte
+    (plus a ninth byte for 64-bit-wide unaligned signals), then shifted,
+    masked, sign-extended or reinterpreted as IEEE float; all N frames are
+    processed at once. Multiplexed signals are decoded in every frame;
+    select the frames of a multiplexer value with the multiplexer column.
+    
+    Encoding is the reverse: values are range-checked (or saturated),
+    scaled to raw integers (or IEEE float bits) and OR-ed into the same
+    8-byte windows.
+    
+    Use ``CANMessage.decode_batch()`` / ``encode_batch()``, which cache the
+    codec on the message until its signals change.
+    
+    Example:
+        >>> payloads = np.frombuffer(log_bytes, dtype=np.uint8).reshape(-1, 8)
+        >>> batch = message.decode_batch(payloads)
+        >>> batch.physical['EngineSpeed'].mean()
+    """
+    
+    def __init__(self, signals: Sequence[Any]):
+        """
+        Compile a codec for a list of CANSignal models.
+        
+        Args:
+            signals: Signals of the message
+        
+        Raises:
+            ValueError: If a float signal is not 32 or 64 bits wide
+        """
+        self.plans: Tuple[_SignalPlan, ...] = tuple(_plan_signal(s) for s in signals)
+        # Payload bytes needed to decode every signal
+        self.min_length = max((_last_byte(p) + 1 for p in self.plans), default=0)
+        self._plans_by_name = {p.name: p for p in self.plans}
+    
+    @property
+    def signal_names(self) -> List[str]:
+        """Names of the decoded signals, in message order."""
+        return [p.name for p in self.plans]
+    
+    def decode(self, payloads: Any) -> DecodedBatch:
+        """
+        Decode N payloads of the message.
+        
+        Args:
+            payloads: (N, dlc) array of payload bytes (uint8), or anything
+                NumPy converts to one; rows may be longer than the message
+        
+        Returns:
+            DecodedBatch with one raw and one physical column per signal
+        
+        Raises:
+            ValueError: If payloads is not 2-D or its rows are too short
+                for the signal layout
+        """
+        np = _numpy()
+        data = np.asarray(payloads, dtype=np.uint8)
+        if data.ndim != 2:
+            raise ValueError(f"payloads must be a 2-D (N, dlc) array, got shape {data.shape}")
+        if data.shape[1] < self.min_length:
+            raise ValueError(
+                f"payloads have {data.shape[1]} bytes per frame, "
+                f"signals need {self.min_length}"
+            )
+        
+        # Zero padding so every 8-byte window (and spill byte) is in bounds
+        padded = np.zeros((data.shape[0], data.shape[1] + 9), dtype=np.uint8)
+        padded[:, :data.shape[1]] = data
+        
+        raw: Dict[str, np.ndarray] = {}
+        physical: Dict[str, np.ndarray] = {}
+        words: Dict[Tuple[int, bool], np.ndarray] = {}
+        for plan in self.plans:
+            values = _extract(np, padded, plan, words)
+            raw[plan.name] = values
+            scaled = values.astype(np.float64)
+            if plan.factor != 1.0:
+                scaled *= plan.factor
+            if plan.offset != 0.0:
+                scaled += plan.offset
+            physical[plan.name] = scaled
+        return DecodedBatch(raw, physical)
+    
+    def encode(
+        self,
+        values: Mapping[str, Any],
+        length: Optional[int] = None,
+        on_range: Union[RangeMode, str] = RangeMode.ERROR,
+        scaled: bool = True
+    ) -> 'np.ndarray':
+        """
+        Pack columns of signal values into N payloads.
+        
+        Values are checked against the signal's min/max (physical, when
+        set) and against what its bit length can hold. Integer signals
+        are rounded to the nearest raw value. Signals missing from
+        ``values`` are encoded with their raw initial value (or 0).
+        
+        Args:
+            values: Signal name -> N values (or one value for every frame)
+            length: Payload bytes per frame (default: the bytes the signals
+                occupy)
+            on_range: RangeMode.ERROR to raise, RangeMode.SATURATE to clamp
+            scaled: If True, values are physical (raw * factor + offset);
+                if False, raw
+        
+        Returns:
+            (N, length) uint8 array of payloads
+        
+        Raises:
+            SignalRangeError: If a value is out of range in ERROR mode
+            ValueError: If a signal name is unknown, the columns differ in
+                length, or ``length`` is too short for the signals
+        """
+        np = _numpy()
+        on_range = RangeMode(on_range)
+        unknown = [name for name in values if name not in self._plans_by_name]
+        if unknown:
+            raise ValueError(f"Unknown signal(s): {', '.join(unknown)}")
+        if length is None:
+            length = self.min_length
+        elif length < self.min_length:
+            raise ValueError(f"payload length {length} is too short, signals need {self.min_length}")
+        
+        columns = {name: np.asarray(column) for name, column in values.items()}
+        sizes = {column.shape[0] for column in columns.values() if column.ndim}
+        if len(sizes) > 1 or any(column.ndim > 1 for column in columns.values()):
+            raise ValueError("signal columns must be 1-D arrays of equal length")
+        rows = sizes.pop() if sizes else 1
+        
+        padded = np.zeros((rows, length + 9), dtype=np.uint8)
+        words: Dict[Tuple[int, bool], np.ndarray] = {}
+        for plan in self.plans:
+            column = columns.get(plan.name)
+            if column is None:
+                if not plan.initial:
+                    continue
+                bits = _to_bits(np, np.full(rows, plan.initial), plan, on_range, scaled=False)
+            else:
+                bits = _to_bits(np, np.broadcast_to(column, (rows,)), plan, on_range, scaled)
+            _insert(np, padded, plan, bits, words)
+        
+        for (window, big_endian), word in words.items():
+            padded[:, window:window + 8] |= word.astype(
+                '>u8' if big_endian else '<u8'
+            ).view(np.uint8).reshape(rows, 8)
+        return np.ascontiguousarray(padded[:, :length])
+
+
+def _last_byte(plan: _SignalPlan) -> int:
+    """Index of the last payload byte a signal occupies."""
+    if plan.big_endian:
+        end = plan.shift + 63 if plan.spill else 63 - plan.shift
+    else:
+        end = plan.shift + plan.length - 1
+    return plan.window + end // 8
+
+
+def _extract(
+    np: Any,
+    padded: 'np.ndarray',
+    plan: _SignalPlan,
+    words: Dict[Tuple[int, bool], 'np.ndarray']
+) -> 'np.ndarray':
+    """
+    Extract the raw column of one signal from padded payloads.
+    
+    ``words`` caches the 8-byte windows of the batch: signals starting in
+    the same byte share one.
+    """
+    u64 = np.uint64
+    key = (plan.window, plan.big_endian)
+    word = words.get(key)
+    if word is None:
+        window = np.ascontiguousarray(padded[:, plan.window:plan.window + 8])
+        word = words[key] = window.view(
+            '>u8' if plan.big_endian else '<u8'
+        ).ravel().astype(u64, copy=False)
+    shift = u64(plan.shift)
+    
+    if not plan.spill:
+        values = word >> shift
+    elif plan.big_endian:
+        spill = padded[:, plan.window + 8].astype(u64)
+        values = (word << shift) | (spill >> u64(8 - plan.shift))
+    else:
+        spill = padded[:, plan.window + 8].astype(u64)
+        values = (word >> shift) | (spill << u64(64 - plan.shift))
+    
+    if plan.length < 64:
+        values &= u64((1 << plan.length) - 1)
+    
+    if plan.float_bits == 32:
+        return values.astype(np.uint32).view(np.float32)
+    if plan.float_bits == 64:
+        return values.view(np.float64)
+    if plan.signed:
+        if plan.length == 64:
+            return values.view(np.int64)
+        sign = 1 << (plan.length - 1)
+        return (values ^ u64(sign)).astype(np.int64) - np.int64(sign)
+    return values
+
+
+def _raw_limits(np: Any, plan: _SignalPlan) -> Tuple[float, float]:
+    """
+    Raw range of a signal's bit length as floats.
+    
+    64-bit limits are not exact floats; the nearest floats inside the
+    integer range are used so clamped values convert without overflow.
+    """
+    if plan.signed:
+        low, high = -(1 << (plan.length - 1)), (1 << (plan.length - 1)) - 1
+    else:
+        low, high = 0, (1 << plan.length) - 1
+    low_f, high_f = float(low), float(high)
+    if low_f < low:
+        low_f = float(np.nextafter(low_f, np.inf))
+    if high_f > high:
+        high_f = float(np.nextafter(high_f, -np.inf))
+    return low_f, high_f
+
+
+def _to_bits(
+    np: Any,
+    column: 'np.ndarray',
+    plan: _SignalPlan,
+    on_range: RangeMode,
+    scaled: bool
+) -> 'np.ndarray':
+    """Range-check a value column and convert it to the signal's raw bits."""
+    if not scaled and not plan.float_bits and column.dtype.kind in 'iu':
+        return _int_to_bits(np, column, plan, on_range)
+    values = column.astype(np.float64)
+    
+    # Physical range from the database
+    if scaled and (plan.minimum is not None or plan.maximum is not None):
+        low = -np.inf if plan.minimum is None else plan.minimum
+        high = np.inf if plan.maximum is None else plan.maximum
+        values = _check_range(np, values, low, high, plan, on_range)
+    
+    if scaled:
+        values = (values - plan.offset) / plan.factor
+    
+    if plan.float_bits == 32:
+        return values.astype(np.float32).view(np.uint32).astype(np.uint64)
+    if plan.float_bits == 64:
+        return values.view(np.uint64)
+    
+    # Range of the bit length, on the rounded raw values
+    values = np.rint(values)
+    low, high = _raw_limits(np, plan)
+    values = _check_range(np, values, low, high, plan, on_range, raw_limits=scaled)
+    if plan.signed:
+        bits = values.astype(np.int64).view(np.uint64)
+    else:
+        bits = values.astype(np.uint64)
+    if plan.length < 64:
+        bits &= np.uint64((1 << plan.length) - 1)
+    return bits
+
+
+def _int_to_bits(
+    np: Any,
+    column: 'np.ndarray',
+    plan: _SignalPlan,
+    on_range: RangeMode
+) -> 'np.ndarray':
+    """Raw integer column to bits, without a lossy round trip through float64."""
+    high = (1 << (plan.length - 1)) - 1 if plan.signed else (1 << plan.length) - 1
+    if column.dtype.kind == 'u':
+        bits = _check_range(
+            np, column.astype(np.uint64), np.uint64(0), np.uint64(high), plan, on_range
+        )
+    else:
+        low = -(1 << (plan.length - 1)) if plan.signed else 0
+        values = column.astype(np.int64)
+        values = _check_range(
+            np, values, np.int64(low), np.int64(min(high, (1 << 63) - 1)), plan, on_range
+        )
+        bits = values.view(np.uint64)
+    if plan.length < 64:
+        bits = bits & np.uint64((1 << plan.length) - 1)
+    return bits
+
+
+def _check_range(
+    np: Any,
+    values: 'np.ndarray',
+    low: float,
+    high: float,
+    plan: _SignalPlan,
+    on_range: RangeMode,
+    raw_limits: bool = False
+) -> 'np.ndarray':
+    """
+    Raise on or clamp values outside [low, high]; NaN is out of range.
+    
+    With ``raw_limits``, values and limits are raw but the caller passed
+    physical values, so the error reports them scaled back.
+    """
+    outside = ~((values >= low) & (values <= high))
+    if not outside.any():
+        return values
+    if on_range == RangeMode.SATURATE:
+        return np.clip(np.nan_to_num(values, nan=max(low, min(high, 0.0))), low, high)
+    rows = np.flatnonzero(outside)
+    value, limits = values[rows[0]], (low, high)
+    if raw_limits:
+        value = value * plan.factor + plan.offset
+        limits = tuple(sorted(x * plan.factor + plan.offset for x in limits))
+    raise SignalRangeError(plan.name, len(rows), int(rows[0]), float(value), limits)
+
+
+def _insert(
+    np: Any,
+    padded: 'np.ndarray',
+    plan: _SignalPlan,
+    bits: 'np.ndarray',
+    words: Dict[Tuple[int, bool], 'np.ndarray']
+) -> None:
+    """OR the raw bits of a signal into its window word (and spill byte)."""
+    u64 = np.uint64
+    key = (plan.window, plan.big_endian)
+    word = words.get(key)
+    if word is None:
+        word = words[key] = np.zeros(bits.shape[0], dtype=u64)
+    shift = u64(plan.shift)
+    
+    if not plan.spill:
+        word |= bits << shift
+    elif plan.big_endian:
+        word |= bits >> shift
+        padded[:, plan.window + 8] |= ((bits << u64(8 - plan.shift)) & u64(0xFF)).astype(np.uint8)
+    else:
+        word |= bits << shift
+        padded[:, plan.window + 8] |= (bits >> u64(64 - plan.shift)).astype(np.uint8)
+
+
+__all__ = ['MessageCodec', 'DecodedBatch', 'RangeMode', 'SignalRangeError']
@@ -0,0 +1,213 @@
+"""
+Bit layout validation of CAN messages and LIN frames.
+
+Each signal's occupied bits are computed as an integer bitmask in DBC bit
+numbering (bit ``n`` is bit ``n % 8`` of byte ``n // 8``), following the
+sawtooth order of big endian (Motorola) signals. A message is then checked
+in one pass: every signal's mask is ANDed with the bits already taken by
+the signals it can coexist with, and with the bits beyond the frame.
+
+Multiplexed signals (indicator ``m<n>``) only conflict with signals of the
+same multiplexer value and with signals present in every frame.
+"""
+
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+from enum import Enum
+
+from .types import ByteOrder
+
+# Bit order of every byte reversed (MSB-first <-> LSB-first)
+_REVERSED_BITS = bytes(int(f'{b:08b}'[::-1], 2) for b in range(256))
+
+
+class LayoutIssueKind(str, Enum):
+    """Kinds of signal layout conflicts."""
+    OVERLAP = "overlap"    # Two signals share bits
+    BOUNDARY = "boundary"  # A signal extends beyond the frame length
+
+
+class LayoutIssue(NamedTuple):
+    """A signal layout conflict in one message or frame."""
+    message: str
+    kind: LayoutIssueKind
+    signals: Tuple[str, ...]  # Both signals of an overlap, the signal out of bounds
+    bits: Tuple[int, ...]     # Shared bits, or the bits beyond the frame
+    
+    def __str__(self) -> str:
+        bits = ', '.join(str(bit) for bit in self.bits[:8])
+        if len(self.bits) > 8:
+            bits += ', ...'
+        if self.kind == LayoutIssueKind.OVERLAP:
+            return (
+                f"Signals '{self.signals[0]}' and '{self.signals[1]}' overlap "
+                f"in message '{self.message}' (bits {bits})"
+            )
+        return (
+            f"Signal '{self.signals[0]}' exceeds message '{self.message}' "
+            f"size (bits {bits})"
+        )
+
+
+def msb_bit_index(bit: Any) -> Any:
+    """
+    Convert between DBC bit numbers and MSB-first bit positions.
+    
+    In MSB-first numbering, position 0 is bit 7 of byte 0 and positions
+    count towards the LSB, so the bits of a big endian signal are
+    contiguous. The mapping is its own inverse and works element-wise on
+    NumPy integer arrays.
+    """
+    return bit // 8 * 8 + 7 - bit % 8
+
+
+def signal_end_bit(start_bit: Any, length: Any, big_endian: Any = False) -> Any:
+    """
+    Get the DBC bit number of the last bit of a signal.
+    
+    Little endian signals end at ``start_bit + length - 1``; big endian
+    signals count down from the MSB at ``start_bit`` and continue at bit 7
+    of the next byte. Works element-wise on NumPy arrays (with ``big_endian``
+    a boolean array).
+    
+    Args:
+        start_bit: DBC start bit (LSB for little endian, MSB for big endian)
+        length: Signal length in bits
+        big_endian: Motorola byte order
+    
+    Returns:
+        Bit number of the LSB (big endian) or MSB (little endian)
+    """
+    intel = start_bit + length - 1
+    motorola = msb_bit_index(msb_bit_index(start_bit) + length - 1)
+    return intel + (motorola - intel) * big_endian
+
+
+def signal_mask(start_bit: int, length: int, big_endian: bool = False) -> int:
+    """
+    Get the bits occupied by a signal as an integer bitmask.
+    
+    Args:
+        start_bit: DBC start bit (LSB for little endian, MSB for big endian)
+        length: Signal length in bits
+        big_endian: Motorola byte order
+    
+    Returns:
+        Mask with bit ``n`` set if the signal occupies DBC bit ``n``
+    
+    Example:
+        >>> bin(signal_mask(7, 12, big_endian=True))  # byte 0, high nibble of byte 1
+        '0b1111000011111111'
+    """
+    if length <= 0:
+        return 0
+    if not big_endian:
+        return ((1 << length) - 1) << start_bit
+    # Motorola bits are contiguous when numbered MSB-first within each byte;
+    # lay them out that way and reverse the bits of every byte
+    msb = msb_bit_index(start_bit)
+    linear = ((1 << length) - 1) << msb
+    size = (msb + length + 7) // 8
+    return int.from_bytes(linear.to_bytes(size, 'little').translate(_REVERSED_BITS), 'little')
+
+
+def mask_bits(mask: int) -> Tuple[int, ...]:
+    """Get the bit numbers set in a mask, in ascending order."""
+    bits = []
+    while mask:
+        low = mask & -mask
+        bits.append(low.bit_length() - 1)
+        mask ^= low
+    return tuple(bits)
+
+
+def check_frame_layout(frame: Any) -> List[LayoutIssue]:
+    """
+    Check the signal layout of a CANMessage or LINFrame.
+    
+    Reports every overlapping signal pair and every signal extending beyond
+    the frame length. LIN signals have no byte order and are little endian.
+    
+    Args:
+        frame: CANMessage or LINFrame
+    
+    Returns:
+        Conflicts, in signal order (empty if the layout is valid)
+    """
+    issues: List[LayoutIssue] = []
+    frame_bits = (1 << frame.length * 8) - 1
+    always = 0          # Bits of signals present in every frame
+    multiplexed = 0     # Bits of all multiplexed signals
+    groups: Dict[int, int] = {}
+    placed: List[Tuple[str, int, Optional[int]]] = []
+    
+    for signal in frame.signals:
+        fields = signal.__dict__
+        name = fields['name']
+        mask = signal_mask(
+            fields['start_bit'],
+            fields['length'],
+            fields.get('byte_order') == ByteOrder.BIG_ENDIAN,
+        )
+        indicator = fields.get('multiplex_indicator')
+        mux = _mux_value(indicator) if indicator else None
+        
+        outside = mask & ~frame_bits
+        if outside:
+            issues.append(LayoutIssue(
+                frame.name, LayoutIssueKind.BOUNDARY, (name,), mask_bits(outside)
+            ))
+        
+        taken = always | (multiplexed if mux is None else groups.get(mux, 0))
+        if mask & taken:
+            # Rare: find the signals holding the shared bits
+            for other, other_mask, other_mux in placed:
+                shared = mask & other_mask
+                if shared and (mux is None or other_mux is None or mux == other_mux):
+                    issues.append(LayoutIssue(
+                        frame.name, LayoutIssueKind.OVERLAP, (other, name), mask_bits(shared)
+                    ))
+        
+        placed.append((name, mask, mux))
+        if mux is None:
+            always |= mask
+        else:
+            groups[mux] = groups.get(mux, 0) | mask
+            multiplexed |= mask
+    
+    return issues
+
+
+def check_layout(frames: Iterable[Any]) -> List[LayoutIssue]:
+    """
+    Check the signal layout of several messages or frames.
+    
+    Args:
+        frames: CANMessage or LINFrame models (e.g., ``can_db.messages``)
+    
+    Returns:
+        Conflicts of all frames, in frame order
+    """
+    issues: List[LayoutIssue] = []
+    for frame in frames:
+        issues.extend(check_frame_layout(frame))
+    return issues
+
+
+def _mux_value(indicator: Optional[str]) -> Optional[int]:
+    """Multiplexer value of an 'm<n>' (or 'm<n>M') indicator, None otherwise."""
+    if not indicator or indicator[0] != 'm':
+        return None
+    digits = indicator[1:].rstrip('M')
+    return int(digits) if digits.isdigit() else None
+
+
+__all__ = [
+    'LayoutIssue',
+    'LayoutIssueKind',
+    'msb_bit_index',
+    'signal_end_bit',
+    'signal_mask',
+    'mask_bits',
+    'check_frame_layout',
+    'check_layout',
+]
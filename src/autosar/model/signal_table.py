@@ -0,0 +1,273 @@
+"""
+Columnar view of the signals of a CAN database or LIN network.
+
+A SignalTable holds one row per signal in a NumPy structured array, so
+analysis passes (bit layout, value ranges, statistics) run vectorized over
+all signals instead of reading pydantic attributes one signal at a time.
+
+NumPy is an optional dependency (``pip install ecuc-configurator[numpy]``),
+imported when the first table is built.
+"""
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+from types import ModuleType
+import sys
+
+from .base import IndexCache, TrackedList
+from .signal_layout import signal_end_bit
+
+if TYPE_CHECKING:
+    import numpy as np
+    from .can_model import CANDatabase
+    from .lin_model import LINNetwork
+
+# signal_type column codes
+SIGNAL_STANDARD = 0
+SIGNAL_MULTIPLEXER = 1
+SIGNAL_MULTIPLEXED = 2
+
+_SIGNAL_TYPE_CODES = {
+    'standard': SIGNAL_STANDARD,
+    'multiplexer': SIGNAL_MULTIPLEXER,
+    'multiplexed': SIGNAL_MULTIPLEXED,
+}
+
+# Row layout of SignalTable.rows. minimum/maximum/initial are NaN when unset,
+# mux_value is -1 unless the multiplex indicator is 'm<n>'.
+SIGNAL_FIELDS: Tuple[Tuple[str, str], ...] = (
+    ('message', 'i4'),
+    ('start_bit', 'u2'),
+    ('length', 'u1'),
+    ('big_endian', '?'),
+    ('signed', '?'),
+    ('is_float', '?'),
+    ('signal_type', 'u1'),
+    ('mux_value', 'i4'),
+    ('factor', 'f8'),
+    ('offset', 'f8'),
+    ('minimum', 'f8'),
+    ('maximum', 'f8'),
+    ('initial', 'f8'),
+)
+
+_NAN = float('nan')
+
+
+def _numpy() -> ModuleType:
+    """Import NumPy on first use."""
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError(
+            "numpy is required for signal tables. "
+            "Install with: pip install ecuc-configurator[numpy]"
+        ) from e
+    return numpy
+
+
+def _mux_value(indicator: Optional[str]) -> int:
+    """Multiplexer value of an 'm<n>' indicator, -1 otherwise."""
+    if indicator and indicator[0] == 'm' and indicator[1:].isdigit():
+        return int(indicator[1:])
+    return -1
+
+
+def _float_or_nan(value: Any) -> float:
+    return _NAN if value is None else float(value)
+
+
+def _tracked_signals(frame: Any) -> List[Any]:
+    """The frame's signal list, adopted and watched as a TrackedList so edits are seen."""
+    signals = frame.__dict__['signals']
+    if type(signals) is not TrackedList:
+        signals = frame.__dict__['signals'] = TrackedList(signals)
+    signals.watch()
+    return signals
+
+
+class SignalTable:
+    """
+    Structured NumPy arrays over all signals of a network.
+    
+    Rows are grouped by message (or LIN frame), in network order; the rows
+    of message ``i`` are ``rows[message_offsets[i]:message_offsets[i + 1]]``.
+    Names are held in object arrays of interned strings.
+    
+    Tables are snapshots. ``CANDatabase.signal_table()`` and
+    ``LINNetwork.signal_table()`` cache one and rebuild it when the
+    messages, a message's signal list or a layout field (start bit, length,
+    byte order, scaling, range...) change.
+    
+    Attributes:
+        rows: Structured array with one row per signal (see SIGNAL_FIELDS)
+        names: Signal names
+        message_names: Message/frame names
+        message_ids: CAN or LIN identifiers
+        message_lengths: Message lengths in bytes
+        message_extended: Extended (29-bit) frame format flags
+        message_offsets: Row offset of each message, plus the row count
+        messages: Message/frame models, in row order
+        signals: Signal models, in row order
+    
+    Example:
+        >>> table = can_db.signal_table()
+        >>> wide = table.rows['length'] > 32
+        >>> table.names[wide]
+    """
+    
+    def __init__(self, messages: Sequence[Any], signal_lists: Sequence[List[Any]]):
+        """
+        Build a table from messages and their signal lists.
+        
+        Prefer from_can_database() / from_lin_network() or the cached
+        ``signal_table()`` of the database.
+        
+        Args:
+            messages: CANMessage or LINFrame models
+            signal_lists: Signal list of each message
+        """
+        np = _numpy()
+        intern = sys.intern
+        
+        rows = []
+        names = []
+        offsets = [0]
+        for position, signals in enumerate(signal_lists):
+            for signal in signals:
+                fields = signal.__dict__
+                byte_order = fields.get('byte_order')
+                value_type = fields.get('value_type')
+                signal_type = fields.get('signal_type')
+                rows.append((
+                    position,
+                    fields['start_bit'],
+                    fields['length'],
+                    byte_order is not None and byte_order.value == 'big_endian',
+                    value_type is not None and value_type.value == 'signed',
+                    value_type is not None and value_type.value in ('float', 'double'),
+                    SIGNAL_STANDARD if signal_type is None else _SIGNAL_TYPE_CODES[signal_type.value],
+                    _mux_value(fields.get('multiplex_indicator')),
+                    fields['factor'],
+                    fields['offset'],
+                    _float_or_nan(fields['min_value']),
+                    _float_or_nan(fields['max_value']),
+                    _float_or_nan(fields['initial_value']),
+                ))
+                names.append(intern(fields['name']))
+            offsets.append(len(rows))
+        
+        self.rows = np.array(rows, dtype=list(SIGNAL_FIELDS))
+        self.names = np.array(names, dtype=object)
+        self.message_names = np.array(
+            [intern(message.name) for message in messages], dtype=object
+        )
+        self.message_ids = np.array(
+            [_frame_id(message) for message in messages], dtype=np.uint32
+        )
+        self.message_lengths = np.array(
+            [message.length for message in messages], dtype=np.uint8
+        )
+        self.message_extended = np.array(
+            [getattr(message, 'is_extended', False) for message in messages], dtype=bool
+        )
+        self.message_offsets = np.array(offsets, dtype=np.int64)
+        self.messages: Tuple[Any, ...] = tuple(messages)
+        self.signals: Tuple[Any, ...] = tuple(s for signals in signal_lists for s in signals)
+        
+        # Staleness check: the signal lists and their versions at build time
+        self._sources = tuple((signals, signals.version) for signals in signal_lists)
+        self._key_generation = IndexCache.key_generation
+        self._message_index: Optional[Dict[str, int]] = None
+    
+    @classmethod
+    def from_can_database(cls, database: 'CANDatabase') -> 'SignalTable':
+        """Build the table of a CANDatabase (builds every lazy message)."""
+        return cls.from_frames(database.messages)
+    
+    @classmethod
+    def from_lin_network(cls, network: 'LINNetwork') -> 'SignalTable':
+        """Build the table of a LINNetwork."""
+        return cls.from_frames(network.frames)
+    
+    @classmethod
+    def from_frames(cls, frames: Sequence[Any]) -> 'SignalTable':
+        """Build the table of a list of CANMessage or LINFrame models."""
+        frames = list(frames)
+        return cls(frames, [_tracked_signals(frame) for frame in frames])
+    
+    def __len__(self) -> int:
+        return len(self.rows)
+    
+    def __getitem__(self, column: str) -> 'np.ndarray':
+        """Get a column of ``rows`` (e.g. ``table['start_bit']``)."""
+        return self.rows[column]
+    
+    def __repr__(self) -> str:
+        return f"SignalTable({len(self.rows)} signals, {len(self.messages)} messages)"
+    
+    def is_current(self) -> bool:
+        """
+        Check that no signal list or layout field changed since the build.
+        
+        Layout and scaling changes bump the version of the signal's list;
+        renames and message ID changes move the global key generation.
+        Changes to the message list itself, and message length changes
+        (which bump its version), are tracked by the owning database's cache.
+        """
+        if self._key_generation != IndexCache.key_generation:
+            return False
+        for message, (signals, version) in zip(self.messages, self._sources):
+            if message.__dict__['signals'] is not signals or signals.version != version:
+                return False
+        return True
+    
+    def message_rows(self, message: Any) -> slice:
+        """
+        Get the row slice of a message.
+        
+        Args:
+            message: Message position, or message name
+        
+        Returns:
+            Slice of ``rows``/``names``/``signals``
+        
+        Raises:
+            KeyError: If no message has that name
+        """
+        if isinstance(message, str):
+            if self._message_index is None:
+                index: Dict[str, int] = {}
+                for position, name in enumerate(self.message_names):
+                    index.setdefault(name, position)
+                self._message_index = index
+            message = self._message_index[message]
+        return slice(int(self.message_offsets[message]), int(self.message_offsets[message + 1]))
+    
+    def end_bits(self) -> 'np.ndarray':
+        """
+        Last bit of each signal in DBC bit numbering (see signal_end_bit()).
+        
+        Little endian signals end at ``start_bit + length - 1``; big endian
+        (Motorola) signals count down from the MSB at ``start_bit`` and
+        continue at bit 7 of the next byte, as CANSignal validates them.
+        """
+        np = _numpy()
+        return signal_end_bit(
+            self.rows['start_bit'].astype(np.int64),
+            self.rows['length'].astype(np.int64),
+            self.rows['big_endian'],
+        )
+
+
+def _frame_id(message: Any) -> int:
+    fields = message.__dict__
+    return fields['message_id'] if 'message_id' in fields else fields['frame_id']
+
+
+__all__ = [
+    'SignalTable',
+    'SIGNAL_FIELDS',
+    'SIGNAL_STANDARD',
+    'SIGNAL_MULTIPLEXER',
+    'SIGNAL_MULTIPLEXED',
+]
@@ -5,7 +5,7 @@ This module provides comprehensive models that capture EVERY field
 from the customer Excel files (Rx/Tx sheets), not just basic CAN data.
 """
 
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from enum import Enum
 from pydantic import BaseModel, Field, field_validator, ConfigDict
 
@@ -60,6 +60,16 @@ class ExcelColumnMapping:
     def get_all_mappings(cls) -> Dict[str, str]:
         """Get all column -> field mappings."""
         raise NotImplementedError
+    
+    @classmethod
+    def get_columns(cls) -> List[Tuple[str, str, int]]:
+        """Get all (column title, field name, column index) tuples, by index."""
+        columns = []
+        for attr_name in dir(cls):
+            attr = getattr(cls, attr_name)
+            if isinstance(attr, tuple) and len(attr) == 3:
+                columns.append(attr)
+        return sorted(columns, key=lambda column: column[2])
 
 
 class RxColumnMapping(ExcelColumnMapping):
@@ -5,6 +5,7 @@ AUTOSAR service package.
 from .ecuc_service import (
     ECUCService,
     ECUCServiceException,
+    FileLoadResult,
     DataMergeError,
     ValidationError,
     GenerationError,
@@ -13,6 +14,7 @@ from .ecuc_service import (
 __all__ = [
     'ECUCService',
     'ECUCServiceException',
+    'FileLoadResult',
     'DataMergeError',
     'ValidationError',
     'GenerationError',
@@ -8,9 +8,13 @@ This service:
 4. Supports AUTOSAR AR4.2.2 and AR4.5
 """
 
-from typing import Dict, List, Optional, Any, Set
+from typing import Dict, List, NamedTuple, Optional, Any, Sequence, Set, Tuple, Union
+from concurrent.futures import Executor, ProcessPoolExecutor
 from pathlib import Path
+import asyncio
 import logging
+import os
+import time
 from datetime import datetime
 
 from ..model import (
@@ -19,7 +23,10 @@ from ..model import (
     ECUCContainerValue, ECUCParameterValue,
     AutosarVersion, ECUCParameterType
 )
-from ..loader import DBCLoader, LDFLoader
+from ..model.base import UUIDStrategy, new_uuid
+from ..model.signal_layout import check_frame_layout
+from ..loader import BaseLoader, LoaderRegistry, LoaderSpec, UnsupportedFormatError
+from ..loader.registry import LoaderRef, resolve_loader_class
 
 
 class ECUCServiceException(Exception):
@@ -42,6 +49,63 @@ class GenerationError(ECUCServiceException):
     pass
 
 
+class FileLoadResult(NamedTuple):
+    """Outcome of loading one file in ECUCService.load_many()."""
+    file_path: str
+    network_type: Optional[str]
+    network_name: Optional[str]
+    network: Optional[Union[CANDatabase, LINNetwork]]
+    duration: float
+    error: Optional[str]
+    
+    @property
+    def ok(self) -> bool:
+        """True if the file was loaded successfully."""
+        return self.error is None
+
+
+# Network types the service can register
+NETWORK_TYPES = ('CAN', 'LIN')
+
+# Loader instances of the current worker process, reused across tasks
+_worker_loaders: Dict[Tuple[LoaderRef, Tuple[Tuple[str, Any], ...]], BaseLoader] = {}
+
+
+def _load_file(
+    loader: BaseLoader,
+    file_path: str
+) -> Tuple[Optional[Union[CANDatabase, LINNetwork]], float, Optional[str]]:
+    """
+    Load one file, capturing the error instead of raising.
+    
+    Returns:
+        Tuple of (network, duration in seconds, error message)
+    """
+    start = time.perf_counter()
+    try:
+        network = loader.load_and_convert(file_path)
+    except Exception as e:
+        return None, time.perf_counter() - start, f"{type(e).__name__}: {e}"
+    return network, time.perf_counter() - start, None
+
+
+def _load_file_in_worker(
+    loader_ref: LoaderRef,
+    file_path: str,
+    loader_kwargs: Tuple[Tuple[str, Any], ...] = ()
+) -> Tuple[Optional[Union[CANDatabase, LINNetwork]], float, Optional[str]]:
+    """Process pool task: load one file with a per-process loader."""
+    key = (loader_ref, loader_kwargs)
+    try:
+        loader = _worker_loaders.get(key)
+    except TypeError:
+        # Unhashable loader arguments: build a loader for this task only
+        return _load_file(resolve_loader_class(loader_ref)(**dict(loader_kwargs)), file_path)
+    if loader is None:
+        loader = _worker_loaders[key] = resolve_loader_class(loader_ref)(**dict(loader_kwargs))
+    return _load_file(loader, file_path)
+
+
 class ECUCService:
     """
     Service for managing ECUC configuration generation.
@@ -53,7 +117,12 @@ class ECUCService:
     def __init__(
         self,
         autosar_version: AutosarVersion = AutosarVersion.AR_4_2_2,
-        logger: Optional[logging.Logger] = None
+        logger: Optional[logging.Logger] = None,
+        executor: Optional[Executor] = None,
+        max_concurrency: Optional[int] = None,
+        registry: Optional[LoaderRegistry] = None,
+        validation: Optional[str] = None,
+        uuid_strategy: Optional[Union[UUIDStrategy, str]] = None
     ):
         """
         Initialize ECUC service.
@@ -61,10 +130,31 @@ class ECUCService:
         Args:
             autosar_version: Target AUTOSAR version
             logger: Optional logger instance
+            executor: Process pool used by the async API to parse files.
+                If None, a ProcessPoolExecutor is created on first use and
+                shut down by close().
+            max_concurrency: Maximum number of files parsed concurrently by
+                the async API (default: CPU count)
+            registry: Loader registry used to pick a loader per file
+                (default: built-in formats plus installed plugins)
+            validation: Loader validation mode, 'strict' or 'trusted'
+                (default: each loader's own default)
+            uuid_strategy: UUIDs of generated ECUC elements: 'random' (uuid4)
+                or 'deterministic' (left empty here and derived from the
+                element path by ECUCGenerator; default: the process-wide
+                strategy)
         """
         self.autosar_version = autosar_version
+        self.uuid_strategy = None if uuid_strategy is None else UUIDStrategy(uuid_strategy)
         self.logger = logger or logging.getLogger(self.__class__.__name__)
         
+        # Async API
+        self.max_concurrency = max_concurrency or os.cpu_count() or 1
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._state_lock: Optional[asyncio.Lock] = None
+        
         # Data containers
         self.can_networks: Dict[str, CANDatabase] = {}
         self.lin_networks: Dict[str, LINNetwork] = {}
@@ -73,9 +163,14 @@ class ECUCService:
         # Source tracking
         self.source_files: List[str] = []
         
-        # Loaders
-        self._dbc_loader = DBCLoader(logger=self.logger)
-        self._ldf_loader = LDFLoader(logger=self.logger)
+        # Loaders, created on first use per format
+        self.validation = validation
+        loader_kwargs: Dict[str, Any] = {'logger': self.logger}
+        if validation is not None:
+            loader_kwargs['validation'] = validation
+        self.loaders = registry or LoaderRegistry(
+            loader_kwargs=loader_kwargs, logger=self.logger
+        )
     
     def load_dbc(self, file_path: str, network_name: Optional[str] = None) -> CANDatabase:
         """
@@ -93,26 +188,8 @@ class ECUCService:
         """
         try:
             self.logger.info(f"Loading DBC file: {file_path}")
-            network = self._dbc_loader.load_and_convert(file_path)
-            
-            # Use provided name or generate from filename
-            if network_name:
-                network.name = network_name
-                network.short_name = network_name
-            elif not network.name:
-                network.name = Path(file_path).stem
-                network.short_name = Path(file_path).stem
-            
-            # Store network
-            self.can_networks[network.name] = network
-            self.source_files.append(str(Path(file_path).resolve()))
-            
-            self.logger.info(
-                f"Loaded CAN network '{network.name}' with "
-                f"{len(network.messages)} messages"
-            )
-            
-            return network
+            network = self.loaders.loader('dbc').load_and_convert(file_path)
+            return self._register_network(network, file_path, network_name)
             
         except Exception as e:
             raise ECUCServiceException(f"Failed to load DBC file: {e}") from e
@@ -133,29 +210,433 @@ class ECUCService:
         """
         try:
             self.logger.info(f"Loading LDF file: {file_path}")
-            network = self._ldf_loader.load_and_convert(file_path)
+            network = self.loaders.loader('ldf').load_and_convert(file_path)
+            return self._register_network(network, file_path, network_name)
             
-            # Use provided name or generate from filename
-            if network_name:
-                network.name = network_name
-                network.short_name = network_name
-            elif not network.name:
-                network.name = Path(file_path).stem
-                network.short_name = Path(file_path).stem
+        except Exception as e:
+            raise ECUCServiceException(f"Failed to load LDF file: {e}") from e
+    
+    def load_many(
+        self,
+        file_paths: Sequence[str],
+        workers: Optional[int] = None
+    ) -> List[FileLoadResult]:
+        """
+        Load several DBC, LDF and XLSX files concurrently.
+        
+        Files are dispatched to a loader by the service's loader registry
+        (extension, then content) and parsed in a process pool (parsing is
+        CPU-bound and holds the GIL). Worker loaders are created with the
+        registry's ``loader_kwargs`` (except the logger). Loaded networks
+        are registered in ``can_networks``/``lin_networks`` in the order of
+        ``file_paths``, regardless of completion order. A failing file does
+        not abort the batch; its error is reported in the result instead.
+        
+        Args:
+            file_paths: Files of any registered CAN/LIN network format
+            workers: Number of worker processes (default: CPU count).
+                With 1 worker, or a single file, files are loaded in the
+                calling process using the service's (cached) loaders.
             
-            # Store network
-            self.lin_networks[network.name] = network
-            self.source_files.append(str(Path(file_path).resolve()))
+        Returns:
+            One FileLoadResult per input file, in input order
+        """
+        file_paths = [str(file_path) for file_path in file_paths]
+        if workers is None:
+            workers = os.cpu_count() or 1
+        
+        # Reject unsupported formats up front
+        specs, outcomes = self._resolve_formats(file_paths)
+        pending = list(specs)
+        
+        self.logger.info(
+            f"Loading {len(file_paths)} files with {min(workers, len(pending)) or 1} worker(s)"
+        )
+        
+        if workers <= 1 or len(pending) <= 1:
+            for index in pending:
+                outcomes[index] = _load_file(
+                    self.loaders.loader(specs[index].name), file_paths[index]
+                )
+        else:
+            with ProcessPoolExecutor(max_workers=min(workers, len(pending))) as executor:
+                futures = {
+                    index: executor.submit(
+                        _load_file_in_worker, specs[index].loader, file_paths[index],
+                        self._worker_loader_kwargs(),
+                    )
+                    for index in pending
+                }
+                for index, future in futures.items():
+                    try:
+                        outcomes[index] = future.result()
+                    except Exception as e:
+                        outcomes[index] = (None, 0.0, f"{type(e).__name__}: {e}")
+        
+        results = self._register_results(file_paths, specs, outcomes)
+        
+        failed = sum(1 for result in results if not result.ok)
+        self.logger.info(
+            f"Loaded {len(results) - failed}/{len(results)} files"
+            + (f", {failed} failed" if failed else "")
+        )
+        return results
+    
+    def load_directory(
+        self,
+        directory: str,
+        recursive: bool = True,
+        workers: Optional[int] = None
+    ) -> List[FileLoadResult]:
+        """
+        Load every CAN/LIN network file found in a directory.
+        
+        Args:
+            directory: Directory to scan
+            recursive: If True, include subdirectories
+            workers: Number of worker processes (see load_many())
+            
+        Returns:
+            One FileLoadResult per file, sorted by path
+        """
+        network_extensions = {
+            ext for spec in self.loaders.formats()
+            if spec.network_type in NETWORK_TYPES for ext in spec.extensions
+        }
+        file_paths = [
+            str(path) for path in self.loaders.find_files(directory, recursive)
+            if path.suffix.lower() in network_extensions
+        ]
+        return self.load_many(file_paths, workers=workers)
+    
+    # ==================== Async API ====================
+    
+    async def aload_dbc(
+        self,
+        file_path: str,
+        network_name: Optional[str] = None,
+        timeout: Optional[float] = None
+    ) -> CANDatabase:
+        """
+        Load CAN network from DBC file without blocking the event loop.
+        
+        Async counterpart of load_dbc(). The file is parsed in the service's
+        process pool; at most ``max_concurrency`` files are parsed at once.
+        If the call is cancelled or times out, nothing is registered, but the
+        worker process is not interrupted: it finishes parsing the file and
+        its result is discarded.
+        
+        Args:
+            file_path: Path to DBC file
+            network_name: Optional network name (defaults to filename)
+            timeout: Optional timeout in seconds
+            
+        Returns:
+            Loaded CAN network
             
+        Raises:
+            ECUCServiceException: If loading fails
+            asyncio.TimeoutError: If the timeout expires
+        """
+        return await self._aload_network(file_path, 'dbc', network_name, timeout)
+    
+    async def aload_ldf(
+        self,
+        file_path: str,
+        network_name: Optional[str] = None,
+        timeout: Optional[float] = None
+    ) -> LINNetwork:
+        """
+        Load LIN network from LDF file without blocking the event loop.
+        
+        Async counterpart of load_ldf(); see aload_dbc().
+        
+        Args:
+            file_path: Path to LDF file
+            network_name: Optional network name (defaults to filename)
+            timeout: Optional timeout in seconds
+            
+        Returns:
+            Loaded LIN network
+            
+        Raises:
+            ECUCServiceException: If loading fails
+            asyncio.TimeoutError: If the timeout expires
+        """
+        return await self._aload_network(file_path, 'ldf', network_name, timeout)
+    
+    async def aload_many(
+        self,
+        file_paths: Sequence[str],
+        timeout: Optional[float] = None
+    ) -> List[FileLoadResult]:
+        """
+        Load several DBC, LDF and XLSX files without blocking the event loop.
+        
+        Async counterpart of load_many(). Files are parsed concurrently in
+        the service's process pool, limited to ``max_concurrency`` at once,
+        and registered in the order of ``file_paths``. A file that fails or
+        exceeds ``timeout`` is reported in its result without aborting the
+        batch. Cancelling the call registers nothing. Timed-out or cancelled
+        files keep parsing in their worker process until they finish, and
+        their results are discarded.
+        
+        Args:
+            file_paths: Files of any registered CAN/LIN network format
+            timeout: Optional per-file timeout in seconds
+            
+        Returns:
+            One FileLoadResult per input file, in input order
+        """
+        file_paths = [str(file_path) for file_path in file_paths]
+        specs, outcomes = self._resolve_formats(file_paths)
+        
+        async def load_one(index: int) -> None:
+            try:
+                outcomes[index] = await self._run_load(specs[index], file_paths[index], timeout)
+            except asyncio.TimeoutError:
+                outcomes[index] = (
+                    None, float(timeout or 0.0), f"TimeoutError: exceeded {timeout} s"
+                )
+            except Exception as e:
+                # Broken pool, unpicklable result, loader construction error
+                outcomes[index] = (None, 0.0, f"{type(e).__name__}: {e}")
+        
+        await asyncio.gather(*(load_one(index) for index in specs))
+        
+        async with self._get_state_lock():
+            return self._register_results(file_paths, specs, outcomes)
+    
+    async def agenerate_ecuc_project(
+        self,
+        project_name: str,
+        ecu_instance: str,
+        modules: Optional[List[str]] = None,
+        timeout: Optional[float] = None
+    ) -> ECUCProject:
+        """
+        Generate ECUC project without blocking the event loop.
+        
+        Async counterpart of generate_ecuc_project(). Generation runs in
+        the event loop's default (thread) executor; networks are not
+        registered by concurrent async loads until the generation thread
+        finishes. On timeout or cancellation the caller stops waiting, but
+        the thread is not interrupted: it runs to completion, still holding
+        off async loads, and its result is discarded.
+        
+        Args:
+            project_name: Name of the project
+            ecu_instance: ECU instance name
+            modules: List of module names to generate (None = all supported)
+            timeout: Optional timeout in seconds
+            
+        Returns:
+            Complete ECUC project
+            
+        Raises:
+            GenerationError: If generation fails
+            asyncio.TimeoutError: If the timeout expires
+        """
+        loop = asyncio.get_running_loop()
+        lock = self._get_state_lock()
+        await lock.acquire()
+        try:
+            future = loop.run_in_executor(
+                None, self.generate_ecuc_project, project_name, ecu_instance, modules
+            )
+        except BaseException:
+            lock.release()
+            raise
+        
+        def release(done: 'asyncio.Future[ECUCProject]') -> None:
+            # The thread reads the network dicts until it returns, even after
+            # the caller has stopped waiting
+            lock.release()
+            if not done.cancelled():
+                done.exception()  # Mark as retrieved
+        
+        future.add_done_callback(release)
+        return await asyncio.wait_for(asyncio.shield(future), timeout)
+    
+    def close(self) -> None:
+        """
+        Shut down the process pool created by the async API, if any.
+        
+        Waits for worker tasks still running, including those abandoned
+        after a timeout or cancellation.
+        """
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+    
+    async def _aload_network(
+        self,
+        file_path: str,
+        format_name: str,
+        network_name: Optional[str],
+        timeout: Optional[float]
+    ) -> Union[CANDatabase, LINNetwork]:
+        """Parse one file in the process pool and register the network."""
+        file_type = format_name.upper()
+        spec = self.loaders.spec(format_name)
+        if Path(file_path).suffix.lower() not in spec.extensions:
+            raise ECUCServiceException(
+                f"Failed to load {file_type} file: unsupported file type "
+                f"{Path(file_path).suffix}"
+            )
+        
+        self.logger.info(f"Loading {file_type} file: {file_path}")
+        network, _, error = await self._run_load(spec, str(file_path), timeout)
+        if error is not None:
+            raise ECUCServiceException(f"Failed to load {file_type} file: {error}")
+        
+        async with self._get_state_lock():
+            return self._register_network(network, file_path, network_name)
+    
+    async def _run_load(
+        self,
+        spec: LoaderSpec,
+        file_path: str,
+        timeout: Optional[float]
+    ) -> Tuple[Optional[Union[CANDatabase, LINNetwork]], float, Optional[str]]:
+        """
+        Run one file load in the executor, bounded by the semaphore.
+        
+        A timeout only stops waiting for the task; the pool worker keeps
+        running it until it returns.
+        """
+        loop = asyncio.get_running_loop()
+        async with self._get_semaphore():
+            return await asyncio.wait_for(
+                loop.run_in_executor(
+                    self._get_executor(), _load_file_in_worker, spec.loader, file_path,
+                    self._worker_loader_kwargs(),
+                ),
+                timeout,
+            )
+    
+    def _worker_loader_kwargs(self) -> Tuple[Tuple[str, Any], ...]:
+        """Registry loader arguments sent to worker processes (loggers stay local)."""
+        return tuple(sorted(
+            (name, value) for name, value in self.loaders.loader_kwargs.items()
+            if name != 'logger'
+        ))
+    
+    def _get_executor(self) -> Executor:
+        """Get the parsing executor, creating the process pool on first use."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_concurrency)
+        return self._executor
+    
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Get the concurrency semaphore (created inside the running loop)."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+    
+    def _get_state_lock(self) -> asyncio.Lock:
+        """Get the lock serializing network registration and generation."""
+        if self._state_lock is None:
+            self._state_lock = asyncio.Lock()
+        return self._state_lock
+    
+    def _resolve_formats(
+        self,
+        file_paths: List[str]
+    ) -> Tuple[Dict[int, LoaderSpec], Dict[int, Tuple[Any, float, Optional[str]]]]:
+        """
+        Look up the network format of each file.
+        
+        Returns:
+            Tuple of (format per loadable file index, failed outcome per
+            unsupported file index)
+        """
+        specs: Dict[int, LoaderSpec] = {}
+        outcomes: Dict[int, Tuple[Any, float, Optional[str]]] = {}
+        for index, file_path in enumerate(file_paths):
+            try:
+                spec = self.loaders.spec_for(file_path)
+            except UnsupportedFormatError as e:
+                outcomes[index] = (None, 0.0, str(e))
+                continue
+            if spec.network_type not in NETWORK_TYPES:
+                outcomes[index] = (
+                    None, 0.0, f"Format '{spec.name}' does not provide a CAN or LIN network"
+                )
+                continue
+            specs[index] = spec
+        return specs, outcomes
+    
+    def _register_results(
+        self,
+        file_paths: List[str],
+        specs: Dict[int, LoaderSpec],
+        outcomes: Dict[int, Tuple[Any, float, Optional[str]]]
+    ) -> List[FileLoadResult]:
+        """Register loaded networks in input order and build the results."""
+        results: List[FileLoadResult] = []
+        for index, file_path in enumerate(file_paths):
+            network, duration, error = outcomes[index]
+            spec = specs.get(index)
+            if error is None:
+                try:
+                    self._register_network(network, file_path)
+                except Exception as e:
+                    network, error = None, f"{type(e).__name__}: {e}"
+            if error is not None:
+                self.logger.error(f"Failed to load {file_path}: {error}")
+            
+            results.append(FileLoadResult(
+                file_path=file_path,
+                network_type=spec.network_type if spec is not None else None,
+                network_name=network.name if network is not None else None,
+                network=network,
+                duration=duration,
+                error=error,
+            ))
+        return results
+    
+    def _register_network(
+        self,
+        network: Union[CANDatabase, LINNetwork],
+        file_path: str,
+        network_name: Optional[str] = None
+    ) -> Union[CANDatabase, LINNetwork]:
+        """
+        Name a loaded network and store it in can_networks or lin_networks.
+        
+        Args:
+            network: Loaded CAN or LIN network
+            file_path: Source file path
+            network_name: Optional network name (defaults to filename)
+            
+        Returns:
+            The registered network
+        """
+        # Use provided name or generate from filename
+        if network_name:
+            network.name = network_name
+            network.short_name = network_name
+        elif not network.name:
+            network.name = Path(file_path).stem
+            network.short_name = Path(file_path).stem
+        
+        # Store network
+        if isinstance(network, LINNetwork):
+            self.lin_networks[network.name] = network
             self.logger.info(
                 f"Loaded LIN network '{network.name}' with "
                 f"{len(network.frames)} frames"
             )
-            
-            return network
-            
-        except Exception as e:
-            raise ECUCServiceException(f"Failed to load LDF file: {e}") from e
+        else:
+            self.can_networks[network.name] = network
+            self.logger.info(
+                f"Loaded CAN network '{network.name}' with "
+                f"{len(network.messages)} messages"
+            )
+        self.source_files.append(str(Path(file_path).resolve()))
+        
+        return network
     
     def validate_data(self) -> bool:
         """
@@ -164,7 +645,9 @@ class ECUCService:
         Checks:
         - No duplicate IDs within same network
         - Signal references are valid
-        - Frame/message sizes are correct
+        - Signals fit in their frame/message (Motorola bit order aware)
+        - Signals do not overlap (multiplexed signals only within their
+          multiplexer value)
         
         Returns:
             True if validation passes
@@ -190,13 +673,9 @@ class ECUCService:
                     )
                 message_ids.add(msg.message_id)
                 
-                # Validate signals fit in message
-                for sig in msg.signals:
-                    if sig.start_bit + sig.length > msg.length * 8:
-                        errors.append(
-                            f"Signal '{sig.name}' exceeds message '{msg.name}' "
-                            f"size in network '{network_name}'"
-                        )
+                # Validate signals fit in message and do not overlap
+                for issue in check_frame_layout(msg):
+                    errors.append(f"{issue} in network '{network_name}'")
         
         # Validate LIN networks
         for network_name, network in self.lin_networks.items():
@@ -212,13 +691,9 @@ class ECUCService:
                     )
                 frame_ids.add(frame.frame_id)
                 
-                # Validate signals fit in frame
-                for sig in frame.signals:
-                    if sig.start_bit + sig.length > frame.length * 8:
-                        errors.append(
-                            f"Signal '{sig.name}' exceeds frame '{frame.name}' "
-                            f"size in network '{network_name}'"
-                        )
+                # Validate signals fit in frame and do not overlap
+                for issue in check_frame_layout(frame):
+                    errors.append(f"{issue} in network '{network_name}'")
         
         if errors:
             error_msg = "Validation failed:\n" + "\n".join(f"  - {e}" for e in errors)
@@ -693,9 +1168,8 @@ class ECUCService:
         return container
     
     def _generate_uuid(self) -> str:
-        """Generate a UUID for AUTOSAR elements."""
-        import uuid
-        return str(uuid.uuid4())
+        """Generate a UUID for AUTOSAR elements ('' when deterministic)."""
+        return new_uuid(self.uuid_strategy)
     
     def clear(self) -> None:
         """Clear all loaded data."""
@@ -704,10 +1178,7 @@ class ECUCService:
         self.ecu_configs.clear()
         self.source_files.clear()
         
-        # Clear loader caches if they have them
-        if hasattr(self._dbc_loader, 'clear_cache'):
-            self._dbc_loader.clear_cache()
-        if hasattr(self._ldf_loader, 'clear_cache'):
-            self._ldf_loader.clear_cache()
+        # Clear loader caches
+        self.loaders.clear_caches()
         
         self.logger.info("Service data cleared")